@@ -1,16 +1,70 @@
 
 import os
-from flask import Flask, send_from_directory, request, jsonify
+import base64
+import csv
+import functools
+import hashlib
+import hmac
+import io
+import json
+import random
+import re
+import threading
+import click
+from collections import OrderedDict
+from flask import Flask, Response, send_from_directory, request, jsonify, g, has_request_context, make_response
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import text, inspect, and_, func, distinct
-from sqlalchemy.exc import IntegrityError
-from datetime import date
+from sqlalchemy import event, text, inspect, insert, select, update, bindparam, literal, case, true, union_all, and_, or_, func, distinct, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from datetime import date, datetime, timezone
+from backend.marks import parse_time, parse_distance
+from backend.seeding import METHODS as SEEDING_METHODS, seed_event
+from backend.lineup import SCORING_TABLES, build_candidates, optimize_lineup, projected_points
+from backend.projection import EventProjection, MeetProjection
+from backend.relays import LEGS as RELAY_LEGS, open_distance, optimize_relays
+from backend.timeline import build_timeline, format_clock, parse_clock
+from backend.query_plans import explain, seq_scans
+from backend.metrics import RequestMetrics
+from backend.query_budget import REPEAT_THRESHOLD, QueryBudgetExceeded, max_queries, tracker as query_tracker
+from backend.profiling import PROFILE_ID_RE, Profiler, prune as prune_profiles
+from backend.meet_stream import MeetBroker, LocalBackend, TableBackend, sse_stream
 
 app = Flask(__name__, static_folder="static")
 
+
+def under_gevent():
+    # gunicorn's gevent worker (Postgres deployments, see gunicorn.conf.py) patches the stdlib before loading the app
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("socket")
+
+
+def green_psycopg():
+    # psycopg2 must wait on Postgres cooperatively under gevent, or one query would
+    # stall every other request and meet stream
+    if under_gevent():
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+
+if under_gevent():
+    import gevent
+
+    @app.after_request
+    def _yield_after_response(response):
+        # a keep-alive client that sends its next request at once would otherwise be
+        # served again and again while other connections wait; let them go first
+        response.call_on_close(lambda: gevent.sleep(0))
+        return response
+
+
 DATABASE_URL = os.environ.get("DATABASE_URL")
 if DATABASE_URL:
     app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URL
+    green_psycopg()
 else:
     DB_PATH = os.environ.get("DB_PATH", "/data/meet_assist.db")
     app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{DB_PATH}"
@@ -20,6 +74,174 @@ print("USING DATABASE:", app.config["SQLALCHEMY_DATABASE_URI"], flush=True)
 
 db = SQLAlchemy(app)
 
+# latency, status and SQL counts per route, served at /metrics
+request_metrics = RequestMetrics()
+# stacks + SQL trace of requests profiled on demand (admins) or by sampling
+profiler = Profiler()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _sql_started(conn, cursor, statement, parameters, context, executemany):
+    request_metrics.sql_before()
+    query_tracker.record(statement)
+    profiler.sql_before(statement, parameters, executemany)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _sql_finished(conn, cursor, statement, parameters, context, executemany):
+    request_metrics.sql_after()
+    profiler.sql_after()
+
+
+def request_route():
+    # the rule template keeps label cardinality bounded (ids stay out of it)
+    return request.url_rule.rule if request.url_rule is not None else "unmatched"
+
+
+# There are no user accounts; admin-only debugging requires this shared token in
+# the X-Admin-Token header, and is disabled when it is unset.
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "/data/profiles")
+PROFILE_SAMPLE_PERCENT = float(os.environ.get("PROFILE_SAMPLE_PERCENT", "0"))
+PROFILE_INTERVAL_MS = float(os.environ.get("PROFILE_INTERVAL_MS", "2"))
+PROFILE_KEEP = int(os.environ.get("PROFILE_KEEP", "200"))  # newest profiles kept on disk; 0 keeps all
+PROFILE_KINDS = {"collapsed": "text/plain; charset=utf-8", "sql.json": "application/json"}
+
+
+def is_admin():
+    token = request.headers.get("X-Admin-Token")
+    return bool(ADMIN_TOKEN and token) and hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+
+def profile_requested():
+    return (request.headers.get("X-Profile") == "1" or request.args.get("profile") == "1") and is_admin()
+
+
+def explain_statement(statement, parameters):
+    with db.engine.connect() as conn:
+        return explain(conn, statement, parameters)
+
+
+@app.before_request
+def _start_profile():
+    if (request.endpoint or "").startswith("debug_profile"):
+        return
+    if profile_requested():
+        g.profile_mode = "on-demand"
+    elif PROFILE_SAMPLE_PERCENT and random.random() * 100 < PROFILE_SAMPLE_PERCENT:
+        g.profile_mode = "sampled"
+    else:
+        return
+    profiler.begin(PROFILE_INTERVAL_MS / 1000)
+
+
+def profile_info(status):
+    return {
+        "method": request.method,
+        "path": request.full_path.rstrip("?"),
+        "route": request_route(),
+        "endpoint": request.endpoint,
+        "status": status,
+        "mode": g.pop("profile_mode", None),
+    }
+
+
+def write_profile(profile, info):
+    # EXPLAIN adds a query per distinct SELECT, so only profiles an admin asked for get plans
+    explain_plans = explain_statement if info["mode"] == "on-demand" else None
+    try:
+        with app.app_context():
+            profile.write(PROFILE_DIR, info, explain=explain_plans)
+        prune_profiles(PROFILE_DIR, PROFILE_KEEP)
+    except OSError as e:
+        app.logger.warning("profile %s not written: %s", profile.id, e)
+
+
+@app.after_request
+def _finish_profile(response):
+    profile = profiler.end()
+    if profile is not None:
+        info = profile_info(response.status_code)
+        # written once the response has been sent, so the request doesn't wait for it
+        response.call_on_close(lambda: write_profile(profile, info))
+        if info["mode"] == "on-demand":
+            response.headers["X-Profile-Id"] = profile.id
+    return response
+
+
+@app.teardown_request
+def _finish_failed_profile(exc):
+    # only still running when the request failed before after_request finished
+    profile = profiler.end()
+    if profile is not None:
+        write_profile(profile, profile_info(500))
+
+
+@app.before_request
+def _start_request_metrics():
+    request_metrics.start_request()
+
+
+@app.after_request
+def _record_request_metrics(response):
+    request_metrics.finish(request.method, request_route(), response.status_code)
+    return response
+
+
+@app.teardown_request
+def _record_failed_request_metrics(exc):
+    # only reached unrecorded when the response itself failed
+    request_metrics.finish(request.method, request_route(), 500)
+
+
+# SQL statements allowed per request, by endpoint; going over, or running one statement
+# REPEAT_THRESHOLD times (N+1), is logged, or raised with QUERY_BUDGET_MODE=raise (tests)
+QUERY_BUDGET_MODE = os.environ.get("QUERY_BUDGET_MODE", "log")  # off/log/raise
+QUERY_BUDGET_DEFAULT = int(os.environ.get("QUERY_BUDGET_DEFAULT", "40"))
+# chunked bulk endpoints: statements grow with the upload by design
+QUERY_BUDGET_EXEMPT = {"import_meet_results"}
+QUERY_BUDGETS = {
+    "meet_page_bootstrap": 12,
+    "list_meets": 4,
+    "list_athletes": 4,
+    "list_seasons": 4,
+    "add_entry": 20,
+    "remove_entry": 20,
+    "update_athlete": 8,
+}
+
+
+@app.before_request
+def _open_query_budget():
+    if QUERY_BUDGET_MODE != "off" and request.endpoint not in QUERY_BUDGET_EXEMPT:
+        g.query_scope = query_tracker.push(request.endpoint)
+
+
+@app.after_request
+def _check_query_budget(response):
+    scope = g.pop("query_scope", None)
+    if scope is not None:
+        query_tracker.pop(scope)
+        problems = scope.problems(QUERY_BUDGETS.get(request.endpoint, QUERY_BUDGET_DEFAULT))
+        if problems:
+            message = f"{request.method} {request_route()}: " + "; ".join(problems)
+            if QUERY_BUDGET_MODE == "raise":
+                raise QueryBudgetExceeded(message + "\n" + scope.report())
+            app.logger.warning("query budget: %s", message)
+    return response
+
+
+@app.teardown_request
+def _close_query_budget(exc):
+    scope = g.pop("query_scope", None)
+    if scope is not None:
+        query_tracker.pop(scope)
+
+
+@app.get("/metrics")
+def metrics():
+    return Response(request_metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
 CURRENT_ORG_ID = int(os.environ.get("CURRENT_ORG_ID", "1"))
 CURRENT_ORG_NAME = os.environ.get("CURRENT_ORG_NAME", "Demo Org")
 
@@ -88,6 +310,11 @@ class Athlete(db.Model):
 
     is_active = db.Column(db.Boolean, nullable=False, default=True)    # soft delete
 
+    __table_args__ = (
+        # roster panel / list_athletes: org + active + gender, ordered by name
+        db.Index("ix_athletes_org_active_gender_name", "org_id", "is_active", "gender", "last_name", "first_name"),
+    )
+
     def to_dict(self):
         return {
             "athlete_id": self.athlete_id,
@@ -143,6 +370,13 @@ class Meet(db.Model):
     season_id = db.Column(db.Integer, db.ForeignKey("seasons.season_id"), nullable=True)
     notes = db.Column(db.Text, nullable=True)
 
+    # bumped by every change that shows up on the meet page (entries, meet events, meet fields)
+    page_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        db.Index("ix_meets_org_archived_date", "org_id", "is_archived", "meet_date"),
+    )
+
     def to_dict(self):
         return {
             "meet_id": self.meet_id,
@@ -170,8 +404,14 @@ class MeetEvent(db.Model):
     max_entries = db.Column(db.Integer, nullable=True)
     is_scored = db.Column(db.Boolean, nullable=False, default=True)
 
+    entries_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # meet page_version of last change
+
+    start_minute = db.Column(db.Integer, nullable=True)  # minutes after midnight
+    duration_minutes = db.Column(db.Integer, nullable=True)
+
     __table_args__ = (
         db.UniqueConstraint("meet_id", "event_id", "gender", name="uq_meet_event"),
+        db.Index("ix_meet_events_meet_gender_sort", "meet_id", "gender", "sort_order"),
     )
 
     def to_dict(self):
@@ -183,6 +423,8 @@ class MeetEvent(db.Model):
             "sort_order": self.sort_order,
             "max_entries": self.max_entries,
             "is_scored": self.is_scored,
+            "start_time": format_clock(self.start_minute),
+            "duration_minutes": self.duration_minutes,
         }
 
 class MeetEntry(db.Model):
@@ -208,9 +450,22 @@ class MeetEntry(db.Model):
     seed_mark = db.Column(db.String(20), nullable=True)
     heat = db.Column(db.Integer, nullable=True)
     lane = db.Column(db.Integer, nullable=True)
+    relay_leg = db.Column(db.Integer, nullable=True)  # 1-4 for relay legs; other relay entries are alternates
+
+    # seed_time / seed_mark parsed by backend.marks; kept in sync by the before_insert/update hook
+    seed_time_ms = db.Column(db.Integer, nullable=True)
+    seed_mark_mm = db.Column(db.Integer, nullable=True)
 
     __table_args__ = (
         db.UniqueConstraint("meet_event_id", "athlete_id", name="uq_meet_entry"),
+        db.Index("ix_meet_entries_event_seed_time", "meet_event_id", "seed_time_ms"),
+        db.Index("ix_meet_entries_event_seed_mark", "meet_event_id", "seed_mark_mm"),
+        db.Index("ix_meet_entries_athlete_status", "athlete_id", "entry_status"),
+        # varsity aggregate / entered_meet_count, index-only on Postgres (partial: 'entered' rows)
+        db.Index(
+            "ix_meet_entries_entered_athlete_event", "athlete_id", "meet_event_id",
+            postgresql_where=text("entry_status = 'entered'"),
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self):
@@ -221,11 +476,21 @@ class MeetEntry(db.Model):
             "entry_status": self.entry_status,
             "seed_time": self.seed_time,
             "seed_mark": self.seed_mark,
+            "seed_time_ms": self.seed_time_ms,
+            "seed_mark_mm": self.seed_mark_mm,
             "heat": self.heat,
             "lane": self.lane,
+            "relay_leg": self.relay_leg,
         }
 
 
+@event.listens_for(MeetEntry, "before_insert")
+@event.listens_for(MeetEntry, "before_update")
+def _normalize_seed_marks(mapper, connection, entry):
+    entry.seed_time_ms = parse_time(entry.seed_time)
+    entry.seed_mark_mm = parse_distance(entry.seed_mark)
+
+
 class Season(db.Model):
     __tablename__ = "seasons"
     __table_args__ = (db.UniqueConstraint("year", "discipline", "name", name="uq_season_name_year_disc"),)
@@ -243,47 +508,728 @@ class Season(db.Model):
             "discipline": self.discipline,
         }
 
-def autopopulate_meet_events(meet: "Meet"):
-    # optional: don't double-populate
-    if MeetEvent.query.filter_by(meet_id=meet.meet_id).first():
+
+class VarsityMeetCount(db.Model):
+    # distinct varsity (non-archived) meets each athlete is entered in, per season;
+    # maintained by add_entry/remove_entry/patch_meet, rebuilt by `flask rebuild-varsity-counts`
+    __tablename__ = "varsity_meet_counts"
+    athlete_id = db.Column(
+        db.Integer,
+        db.ForeignKey("athletes.athlete_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    season_id = db.Column(db.Integer, primary_key=True)  # 0 = meets without a season
+    varsity_meets = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index("ix_varsity_meet_counts_season_athlete", "season_id", "athlete_id"),
+    )
+
+
+class Result(db.Model):
+    # one performance; mark_value is mark parsed by backend.marks (ms for track/relay, mm for field)
+    __tablename__ = "results"
+    result_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+
+    # kept when the entry is later removed: the performance still happened
+    meet_entry_id = db.Column(
+        db.Integer,
+        db.ForeignKey("meet_entries.meet_entry_id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    athlete_id = db.Column(
+        db.Integer,
+        db.ForeignKey("athletes.athlete_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_id = db.Column(db.Integer, db.ForeignKey("events.event_id"), nullable=False)
+    meet_id = db.Column(db.Integer, db.ForeignKey("meets.meet_id", ondelete="CASCADE"), nullable=False, index=True)
+
+    mark = db.Column(db.String(20), nullable=False)  # as recorded: "4:32.15", "21-04.5", "DNF"
+    mark_value = db.Column(db.Integer, nullable=True)  # None for DNF/DQ/NH etc.
+    place = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_results_athlete_event", "athlete_id", "event_id"),
+    )
+
+    def to_dict(self):
+        return {
+            "result_id": self.result_id,
+            "meet_entry_id": self.meet_entry_id,
+            "athlete_id": self.athlete_id,
+            "event_id": self.event_id,
+            "meet_id": self.meet_id,
+            "mark": self.mark,
+            "mark_value": self.mark_value,
+            "place": self.place,
+        }
+
+
+class AthleteBest(db.Model):
+    # best result per (athlete, event, season) plus the all-time PR under season_id ALL_TIME;
+    # maintained by record_bests when results are added, rebuilt by `flask rebuild-athlete-bests`
+    __tablename__ = "athlete_bests"
+    athlete_id = db.Column(
+        db.Integer,
+        db.ForeignKey("athletes.athlete_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    event_id = db.Column(db.Integer, primary_key=True)
+    season_id = db.Column(db.Integer, primary_key=True)  # 0 = meets without a season, -1 = all time
+    best_value = db.Column(db.Integer, nullable=False)
+    best_mark = db.Column(db.String(20), nullable=False)
+    result_id = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.Index("ix_athlete_bests_season_event", "season_id", "event_id"),
+    )
+
+
+class AthleteConflict(db.Model):
+    # pairs of overlapping meet events an athlete is entered in; maintained per athlete by
+    # the entry endpoints and per meet by schedule changes (refresh_conflicts)
+    __tablename__ = "athlete_conflicts"
+    athlete_id = db.Column(
+        db.Integer,
+        db.ForeignKey("athletes.athlete_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    meet_event_id_a = db.Column(
+        db.Integer,
+        db.ForeignKey("meet_events.meet_event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    meet_event_id_b = db.Column(
+        db.Integer,
+        db.ForeignKey("meet_events.meet_event_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    meet_id = db.Column(db.Integer, db.ForeignKey("meets.meet_id", ondelete="CASCADE"), nullable=False, index=True)
+
+
+class MeetNotification(db.Model):
+    # change feed for MEET_STREAM_BACKEND=table (shared by all workers); pruned by the poller
+    __tablename__ = "meet_notifications"
+    notification_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    meet_id = db.Column(db.Integer, nullable=False, index=True)
+    event_type = db.Column(db.String(30), nullable=False)
+    payload = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False)
+
+
+meet_broker = MeetBroker()
+if os.environ.get("MEET_STREAM_BACKEND", "local") == "table":
+    meet_stream_backend = TableBackend(meet_broker, lambda: db.engine, MeetNotification.__table__, logger=app.logger)
+else:
+    meet_stream_backend = LocalBackend(meet_broker)
+
+
+def publish_meet_change(meet_id, event_type, data):
+    # call after commit so listeners never see a change that rolled back
+    try:
+        meet_stream_backend.publish(meet_id, event_type, data)
+    except Exception as e:
+        app.logger.warning("meet stream publish failed: %s", e)
+
+
+def season_key(season_id):
+    return season_id or 0
+
+
+def upsert_insert(model):
+    # INSERT ... ON CONFLICT for the dialect in use (SQLite and Postgres both support it)
+    if db.engine.dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def meet_counts_as_varsity(meet):
+    return bool(meet.is_varsity) and not meet.is_archived
+
+
+def season_kind(kind, season_id):
+    # per-season version of a kind, so a write in one season leaves other seasons' caches alone
+    return f"{kind}:{season_key(season_id)}"
+
+
+def adjust_varsity_counts(athlete_ids, season_id, delta):
+    athlete_ids = list(athlete_ids)
+    if not athlete_ids or not delta:
+        return
+    mark_changed(season_kind("varsity_counts", season_id))  # the season's roster panels
+    key = season_key(season_id)
+    if delta > 0:
+        stmt = upsert_insert(VarsityMeetCount).values(
+            [{"athlete_id": aid, "season_id": key, "varsity_meets": delta} for aid in athlete_ids]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["athlete_id", "season_id"],
+            set_={"varsity_meets": VarsityMeetCount.varsity_meets + delta},
+        )
+        db.session.execute(stmt)
+    else:
+        (db.session.query(VarsityMeetCount)
+            .filter(VarsityMeetCount.season_id == key, VarsityMeetCount.athlete_id.in_(athlete_ids))
+            .update({"varsity_meets": VarsityMeetCount.varsity_meets + delta}, synchronize_session=False))
+
+
+def lock_athletes(athlete_ids):
+    """Row-lock the athletes (in id order) until commit.
+
+    Entry changes that decide "first / last entry in this meet" from a count must
+    hold this first: otherwise two concurrent adds (or removes) for one athlete
+    both see the same count under READ COMMITTED and varsity_meet_counts drifts.
+    SQLite ignores FOR UPDATE; it runs one writer at a time anyway.
+    """
+    ids = sorted(set(athlete_ids))
+    if ids:
+        db.session.query(Athlete.athlete_id).filter(Athlete.athlete_id.in_(ids)).with_for_update().all()
+
+
+def entered_meet_count(athlete_id, meet_id):
+    # how many 'entered' entries this athlete has across the meet's events
+    return (db.session.query(func.count(MeetEntry.meet_entry_id))
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .filter(
+            MeetEvent.meet_id == meet_id,
+            MeetEntry.athlete_id == athlete_id,
+            MeetEntry.entry_status == "entered",
+        )
+        .scalar())
+
+
+def refresh_conflicts(meet_id, athlete_ids=None):
+    """Recompute a meet's athlete_conflicts rows, or just those of the given athletes.
+
+    One DELETE and one INSERT ... SELECT over the athletes' entries, so an entry change
+    costs O(that athlete's entries) and readers never compare schedules themselves.
+    """
+    q = db.session.query(AthleteConflict).filter(AthleteConflict.meet_id == meet_id)
+    if athlete_ids is not None:
+        athlete_ids = list(athlete_ids)
+        if not athlete_ids:
+            return
+        q = q.filter(AthleteConflict.athlete_id.in_(athlete_ids))
+    q.delete(synchronize_session=False)
+
+    ea, eb = MeetEntry.__table__.alias("ea"), MeetEntry.__table__.alias("eb")
+    ma, mb = MeetEvent.__table__.alias("ma"), MeetEvent.__table__.alias("mb")
+    end_a = ma.c.start_minute + func.coalesce(ma.c.duration_minutes, 0)
+    end_b = mb.c.start_minute + func.coalesce(mb.c.duration_minutes, 0)
+    sel = (select(ea.c.athlete_id, ma.c.meet_event_id, mb.c.meet_event_id, literal(meet_id))
+        .select_from(ea)
+        .join(ma, ea.c.meet_event_id == ma.c.meet_event_id)
+        .join(eb, eb.c.athlete_id == ea.c.athlete_id)
+        .join(mb, and_(
+            eb.c.meet_event_id == mb.c.meet_event_id,
+            mb.c.meet_id == ma.c.meet_id,
+            mb.c.meet_event_id > ma.c.meet_event_id,
+        ))
+        .where(
+            ma.c.meet_id == meet_id,
+            ea.c.entry_status == "entered",
+            eb.c.entry_status == "entered",
+            ma.c.start_minute.isnot(None),
+            mb.c.start_minute.isnot(None),
+            or_(
+                ma.c.start_minute == mb.c.start_minute,
+                and_(ma.c.start_minute < end_b, mb.c.start_minute < end_a),
+            ),
+        ))
+    if athlete_ids is not None:
+        sel = sel.where(ea.c.athlete_id.in_(athlete_ids))
+    db.session.execute(insert(AthleteConflict).from_select(
+        ["athlete_id", "meet_event_id_a", "meet_event_id_b", "meet_id"], sel
+    ))
+
+
+def meet_conflicts(meet_id, gender):
+    """[{athlete_id, meet_event_ids}] from athlete_conflicts, for the meet page."""
+    rows = (db.session.query(AthleteConflict.athlete_id, AthleteConflict.meet_event_id_a, AthleteConflict.meet_event_id_b)
+        .join(MeetEvent, AthleteConflict.meet_event_id_a == MeetEvent.meet_event_id)
+        .filter(AthleteConflict.meet_id == meet_id, MeetEvent.gender == gender)
+        .order_by(AthleteConflict.athlete_id, AthleteConflict.meet_event_id_a, AthleteConflict.meet_event_id_b))
+    return [{"athlete_id": aid, "meet_event_ids": [a, b]} for aid, a, b in rows]
+
+
+def rebuild_varsity_counts():
+    db.session.query(VarsityMeetCount).delete(synchronize_session=False)
+    key = func.coalesce(Meet.season_id, 0)
+    sel = (select(MeetEntry.athlete_id, key, func.count(distinct(Meet.meet_id)))
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .join(Meet, MeetEvent.meet_id == Meet.meet_id)
+        .where(
+            Meet.is_archived == False,
+            Meet.is_varsity == True,
+            MeetEntry.entry_status == "entered",
+        )
+        .group_by(MeetEntry.athlete_id, key))
+    db.session.execute(
+        insert(VarsityMeetCount).from_select(["athlete_id", "season_id", "varsity_meets"], sel)
+    )
+    mark_changed("varsity_counts")  # every season
+    db.session.commit()
+
+
+ALL_TIME = -1  # AthleteBest.season_id of personal records
+
+
+def higher_is_better(event_type):
+    return event_type == "field"
+
+
+def record_bests(results, season_id):
+    """Fold new results into athlete_bests (season best and PR).
+
+    results: [(result_id, athlete_id, event_id, event_type, mark, mark_value)]. Only
+    improvements are written: one upsert per direction, whose WHERE keeps better
+    existing rows. Only the seasons (and ALL_TIME) whose rows changed are marked.
+    """
+    best = {}  # (athlete_id, event_id, higher) -> row
+    for result_id, athlete_id, event_id, event_type, mark, value in results:
+        if value is None:
+            continue
+        higher = higher_is_better(event_type)
+        key = (athlete_id, event_id, higher)
+        cur = best.get(key)
+        if cur is None or (value > cur[2] if higher else value < cur[2]) or (value == cur[2] and result_id < cur[0]):
+            best[key] = (result_id, mark, value)
+    if not best:
         return
 
-    q = Event.query.filter_by(is_active=True)
+    changed_seasons = set()
+    for higher in (False, True):
+        rows = [
+            {"athlete_id": aid, "event_id": eid, "season_id": sid,
+             "best_value": value, "best_mark": mark, "result_id": rid}
+            for (aid, eid, h), (rid, mark, value) in best.items() if h == higher
+            for sid in (season_key(season_id), ALL_TIME)
+        ]
+        for i in range(0, len(rows), 500):  # stay under SQLite's bound-parameter limit
+            stmt = upsert_insert(AthleteBest).values(rows[i:i + 500])
+            improves = (AthleteBest.best_value < stmt.excluded.best_value if higher
+                        else AthleteBest.best_value > stmt.excluded.best_value)
+            changed_seasons.update(db.session.execute(stmt.on_conflict_do_update(
+                index_elements=["athlete_id", "event_id", "season_id"],
+                set_={"best_value": stmt.excluded.best_value, "best_mark": stmt.excluded.best_mark,
+                      "result_id": stmt.excluded.result_id},
+                where=improves,
+            ).returning(AthleteBest.season_id)).scalars())
+    if changed_seasons:
+        mark_changed(*(season_kind("bests", sid) for sid in changed_seasons))
+
+
+def insert_results(rows, event_types, season_id):
+    """Insert result rows in one statement and record any new bests.
+
+    Returns the inserted rows (result_id, no created_at) in result_id order. RETURNING
+    carries the columns instead of relying on row order: sort_by_parameter_order makes
+    SQLite fall back to one INSERT per row.
+    """
+    type_by_event = {r["event_id"]: t for r, t in zip(rows, event_types)}
+    cols = [c for c in Result.__table__.c if c.key != "created_at"]
+    inserted = sorted(
+        (dict(r._mapping) for r in db.session.execute(insert(Result).returning(*cols), rows)),
+        key=lambda r: r["result_id"],
+    )
+    record_bests([
+        (r["result_id"], r["athlete_id"], r["event_id"], type_by_event[r["event_id"]], r["mark"], r["mark_value"])
+        for r in inserted
+    ], season_id)
+    return inserted
+
 
-    venue = (meet.venue_type or "outdoor").strip().lower()
-    if venue == "indoor":
-        q = q.filter(Event.venue_type.in_(["indoor", "both"]))
+def recompute_bests(pairs=None):
+    """Recompute athlete_bests from results, for [(athlete_id, event_id)] or (None) everyone."""
+    if pairs is not None and not pairs:
+        return
+    stmt = AthleteBest.__table__.delete()
+    rows = (db.session.query(
+            Result.result_id, Result.athlete_id, Result.event_id, Event.event_type,
+            Result.mark, Result.mark_value, Meet.season_id)
+        .join(Event, Result.event_id == Event.event_id)
+        .join(Meet, Result.meet_id == Meet.meet_id)
+        .filter(Result.mark_value.isnot(None))
+        .order_by(Meet.season_id, Result.result_id))
+    if pairs is None:
+        db.session.execute(stmt)
+        mark_changed("bests")  # every season, including ones whose bests are now gone
     else:
-        q = q.filter(Event.venue_type.in_(["outdoor", "both"]))
-
-    events = q.order_by(Event.sort_order.asc()).all()
-
-    to_add = []
-    for gender in ("M", "F"):
-        for ev in events:
-            to_add.append(MeetEvent(
-                meet_id=meet.meet_id,
-                event_id=ev.event_id,
-                gender=gender,
-                sort_order=ev.sort_order,
-                is_scored=True,
-            ))
+        pairs = list(pairs)
+        stmt = stmt.where(tuple_(AthleteBest.athlete_id, AthleteBest.event_id).in_(pairs))
+        seasons = set(db.session.execute(stmt.returning(AthleteBest.season_id)).scalars())
+        if seasons:
+            mark_changed(*(season_kind("bests", sid) for sid in seasons))
+        rows = rows.filter(tuple_(Result.athlete_id, Result.event_id).in_(pairs))
+    by_season = {}
+    for row in rows:
+        by_season.setdefault(row[-1], []).append(row[:-1])
+    for season_id, results in by_season.items():
+        record_bests(results, season_id)
+
+
+def rebuild_athlete_bests():
+    recompute_bests()
+    db.session.commit()
+
 
-    db.session.add_all(to_add)
+@app.cli.command("rebuild-athlete-bests")
+def rebuild_athlete_bests_command():
+    """Recompute athlete_bests from results (backfill / drift repair)."""
+    rebuild_athlete_bests()
+    print("athlete_bests rebuilt:", AthleteBest.query.count(), "rows")
+
+
+@app.cli.command("rebuild-varsity-counts")
+def rebuild_varsity_counts_command():
+    """Recompute varsity_meet_counts from meet entries (backfill / drift repair)."""
+    rebuild_varsity_counts()
+    print("varsity_meet_counts rebuilt:", VarsityMeetCount.query.count(), "rows")
+
+
+def hot_queries(org_id, meet_id, athlete_id):
+    """[(name, statement, tables that must not be read with a sequential scan)]."""
+    return [
+        ("meet page: meet events", select(MeetEvent.meet_event_id)
+            .where(MeetEvent.meet_id == meet_id, MeetEvent.gender == "M")
+            .order_by(MeetEvent.sort_order), {"meet_events"}),
+        ("meet page: entries", select(MeetEntry.meet_entry_id, MeetEntry.athlete_id)
+            .where(MeetEntry.meet_event_id.in_(
+                select(MeetEvent.meet_event_id).where(MeetEvent.meet_id == meet_id, MeetEvent.gender == "M"))),
+            {"meet_entries", "meet_events"}),
+        ("list meets", select(Meet.meet_id)
+            .where(Meet.org_id == org_id, Meet.is_archived == False)
+            .order_by(Meet.meet_date.desc().nullslast(), Meet.meet_id.desc()), {"meets"}),
+        ("roster panel", select(Athlete.athlete_id)
+            .where(Athlete.org_id == org_id, Athlete.is_active == True, Athlete.gender == "M")
+            .order_by(Athlete.last_name, Athlete.first_name), {"athletes"}),
+        ("varsity aggregate", select(func.count(distinct(Meet.meet_id)))
+            .select_from(MeetEntry)
+            .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+            .join(Meet, MeetEvent.meet_id == Meet.meet_id)
+            .where(
+                MeetEntry.athlete_id == athlete_id,
+                MeetEntry.entry_status == "entered",
+                Meet.is_varsity == True,
+                Meet.is_archived == False,
+            ), {"meet_entries", "meet_events", "meets"}),
+    ]
+
+
+@app.cli.command("check-query-plans")
+@click.option("--orgs", default=10, show_default=True, help="synthetic orgs to add before EXPLAIN")
+@click.option("--athletes", default=300, show_default=True, help="athletes per org")
+@click.option("--meets-per-season", default=8, show_default=True, help="meets per org and season")
+@click.option("--verbose", is_flag=True, help="print every plan")
+def check_query_plans_command(orgs, athletes, meets_per_season, verbose):
+    """EXPLAIN the hot queries at a realistic data size; exit 1 on a sequential scan.
+
+    The synthetic rows (backend.seed.generate) are inserted and analyzed inside a
+    transaction that is rolled back, so this is safe to run against a development database."""
+    from backend.seed import generate  # seed imports this module
 
     try:
-        db.session.commit()
-    except IntegrityError:
+        counts = generate(orgs=orgs, athletes=athletes, meets_per_season=meets_per_season, commit=False)
+    except ValueError as e:
+        db.session.rollback()
+        raise click.ClickException(str(e))
+    org_id, meet_id, athlete_id = counts["first_org_id"], counts["first_meet_id"], counts["first_athlete_id"]
+
+    failed = 0
+    try:
+        conn = db.session.connection()
+        conn.exec_driver_sql("ANALYZE")
+        for name, stmt, tables in hot_queries(org_id, meet_id, athlete_id):
+            sql = str(stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+            plan, scans = seq_scans(conn, sql, tables)
+            print(f"{'FAIL' if scans else 'ok'}  {name}" + (f": sequential scan on {', '.join(scans)}" if scans else ""))
+            if scans or verbose:
+                print("    " + plan.replace("\n", "\n    "))
+            failed += bool(scans)
+    finally:
+        db.session.rollback()
+    if failed:
+        raise SystemExit(1)
+
+
+def budget_requests(meet_id):
+    """(endpoint, path) for the read endpoints in QUERY_BUDGETS, against one generated meet."""
+    return [
+        ("meet_page_bootstrap", f"/api/meets/{meet_id}/page?gender=M"),
+        ("meet_page_bootstrap", f"/api/meets/{meet_id}/page?gender=F"),
+        ("list_meets", "/api/meets"),
+        ("list_athletes", "/api/athletes"),
+        ("list_seasons", "/api/seasons"),
+    ]
+
+
+@app.cli.command("check-query-budgets")
+@click.option("--orgs", default=10, show_default=True, help="synthetic orgs to add before the requests")
+@click.option("--athletes", default=300, show_default=True, help="athletes per org")
+@click.option("--meets-per-season", default=8, show_default=True, help="meets per org and season")
+def check_query_budgets_command(orgs, athletes, meets_per_season):
+    """Request the budgeted read endpoints at a realistic data size; exit 1 over budget.
+
+    Each request runs under max_queries with its QUERY_BUDGETS entry and the N+1
+    threshold, as the first org of the synthetic data. Write endpoints commit, so
+    they are left to the per-request check. The rows are rolled back afterwards."""
+    global CURRENT_ORG_ID, QUERY_BUDGET_MODE
+    from backend.seed import generate  # seed imports this module
+
+    try:
+        counts = generate(orgs=orgs, athletes=athletes, meets_per_season=meets_per_season, commit=False)
+    except ValueError as e:
+        db.session.rollback()
+        raise click.ClickException(str(e))
+
+    # the test client's requests reuse this app context, so they see the uncommitted
+    # rows; the per-request budget hooks are off so each request is counted once
+    saved = CURRENT_ORG_ID, QUERY_BUDGET_MODE
+    CURRENT_ORG_ID, QUERY_BUDGET_MODE = counts["first_org_id"], "off"
+    client = app.test_client()
+    failed = 0
+    try:
+        for endpoint, path in budget_requests(counts["first_meet_id"]):
+            for name in list(g):  # a request would start with an empty g
+                g.pop(name)
+            budget = QUERY_BUDGETS[endpoint]
+            try:
+                with max_queries(budget, max_repeats=REPEAT_THRESHOLD - 1, label=f"GET {path}") as scope:
+                    resp = client.get(path)
+            except QueryBudgetExceeded as e:
+                print(f"FAIL  {e}")
+                failed += 1
+                continue
+            if resp.status_code != 200:
+                print(f"FAIL  GET {path}: status {resp.status_code}")
+                failed += 1
+                continue
+            print(f"ok  GET {path}: {scope.count} SQL statements (budget {budget})")
+    finally:
+        CURRENT_ORG_ID, QUERY_BUDGET_MODE = saved
         db.session.rollback()
-        # ignore duplicates if it somehow runs twice
+    if failed:
+        raise SystemExit(1)
+
+
+class CacheVersion(db.Model):
+    # one row per versioned resource; bumped in the same transaction as any write to it
+    __tablename__ = "cache_versions"
+    name = db.Column(db.String(40), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+
+REFERENCE_MODELS = {
+    "organizations": Organization,
+    "teams": Team,
+    "event_groups": EventGroup,
+    "events": Event,
+    "seasons": Season,
+}
+
+# every model whose writes bump a version row (reference tables plus the list APIs)
+RESOURCE_KINDS_BY_MODEL = {model: kind for kind, model in REFERENCE_MODELS.items()}
+RESOURCE_KINDS_BY_MODEL.update({Meet: "meets", Athlete: "athletes"})
+
+
+def resource_versions():
+    """{name: (version, updated_at)} from cache_versions, read at most once per request."""
+    if has_request_context() and "resource_versions" in g:
+        return g.resource_versions
+    versions = {
+        name: (version, updated_at)
+        for name, version, updated_at in db.session.query(
+            CacheVersion.name, CacheVersion.version, CacheVersion.updated_at
+        )
+    }
+    if has_request_context():
+        g.resource_versions = versions
+    return versions
+
+
+def forget_resource_versions():
+    if has_request_context():
+        g.pop("resource_versions", None)
+
+
+class RefCache:
+    """Per-process cache of the small reference tables.
+
+    Each table is held as {pk: {column: value}} together with the version it
+    was loaded at. Versions live in the cache_versions table so a write in one
+    gunicorn worker invalidates every other worker; each request reads all
+    versions once (a single-row-per-table query) and reloads only stale tables.
+    Returned dicts are shared, so callers must not mutate them.
+    """
+
+    def __init__(self, models):
+        self.models = models
+        self._lock = threading.Lock()
+        self._tables = {}  # kind -> (version, rows)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind):
+        version = resource_versions().get(kind, (0, None))[0]
+        with self._lock:
+            cached = self._tables.get(kind)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        model = self.models[kind]
+        mapper = inspect(model)
+        pk = mapper.primary_key[0]
+        cols = list(mapper.columns)
+        rows = {
+            r._mapping[pk.key]: dict(r._mapping)
+            for r in db.session.query(*cols).order_by(pk.asc())
+        }
+        with self._lock:
+            self._tables[kind] = (version, rows)
+        return rows
+
+    def invalidate(self, kinds=None):
+        with self._lock:
+            for kind in list(kinds or self._tables):
+                self._tables.pop(kind, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "tables": {kind: {"version": v, "rows": len(rows)} for kind, (v, rows) in self._tables.items()},
+            }
+
+
+ref_cache = RefCache(REFERENCE_MODELS)
+
+
+def bump_resource_versions(connection, kinds):
+    # one upsert, so two writers creating the same kind's row can't collide on its key;
+    # sorted so concurrent bumps lock the rows in the same order
+    kinds = sorted(set(kinds))
+    if not kinds:
         return
+    now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    stmt = upsert_insert(CacheVersion).values([{"name": kind, "version": 1, "updated_at": now} for kind in kinds])
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"version": CacheVersion.version + 1, "updated_at": now},
+    ))
+
+
+def mark_changed(*kinds):
+    # for bulk insert()/update() statements, which bypass the flush hook below
+    bump_resource_versions(db.session.connection(), kinds)
+    db.session.info.setdefault("changed_kinds", set()).update(kinds)
+
+
+@event.listens_for(db.session, "after_flush")
+def _bump_versions_on_flush(session, flush_context):
+    kinds = set()
+    for obj in list(session.new) + list(session.deleted):
+        kind = RESOURCE_KINDS_BY_MODEL.get(type(obj))
+        if kind:
+            kinds.add(kind)
+    for obj in session.dirty:
+        kind = RESOURCE_KINDS_BY_MODEL.get(type(obj))
+        if kind and session.is_modified(obj, include_collections=False):
+            kinds.add(kind)
+    if kinds:
+        bump_resource_versions(session.connection(), sorted(kinds))
+        session.info.setdefault("changed_kinds", set()).update(kinds)
+
+
+@event.listens_for(db.session, "after_commit")
+def _invalidate_on_commit(session):
+    kinds = session.info.pop("changed_kinds", None)
+    if kinds:
+        ref_cache.invalidate(kinds)
+        forget_resource_versions()
+
+
+@event.listens_for(db.session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop("changed_kinds", None)
+
+
+def conditional(*kinds):
+    """Strong ETag / Last-Modified for a GET whose body depends only on `kinds`.
+
+    The tag covers the resource versions, the org and the full query string, so
+    a matching If-None-Match returns 304 before the view queries anything.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = resource_versions()
+            parts = [f"{k}:{versions.get(k, (0, None))[0]}" for k in kinds]
+            parts += [str(CURRENT_ORG_ID), request.full_path]
+            etag = hashlib.sha1("|".join(parts).encode()).hexdigest()
+            stamps = [versions[k][1] for k in kinds if k in versions and versions[k][1]]
+            last_modified = max(stamps).replace(tzinfo=timezone.utc) if stamps else None
+
+            not_modified = False
+            if request.if_none_match:
+                not_modified = request.if_none_match.contains(etag)
+            elif last_modified and request.if_modified_since:
+                not_modified = last_modified <= request.if_modified_since
+
+            if not_modified:
+                resp = make_response("", 304)
+            else:
+                resp = make_response(view(*args, **kwargs))
+                if resp.status_code != 200:
+                    return resp
+            resp.set_etag(etag)
+            if last_modified:
+                resp.last_modified = last_modified
+            resp.headers["Cache-Control"] = "no-cache"
+            return resp
+        return wrapper
+    return decorator
+
+
+def org_team_ids():
+    return {tid for tid, t in ref_cache.get("teams").items() if t["org_id"] == CURRENT_ORG_ID}
+
+
+def event_group_ids():
+    return set(ref_cache.get("event_groups"))
+
+
+def populate_meet_events(meet_ids):
+    """Give each meet one meet_event per active event per gender, in a single INSERT ... SELECT.
+
+    Indoor meets get indoor/both events; everything else gets outdoor/both.
+    """
+    if not meet_ids:
+        return 0
+    genders = union_all(select(literal("M").label("gender")), select(literal("F").label("gender"))).subquery()
+    meet_venue = case((func.lower(Meet.venue_type) == "indoor", "indoor"), else_="outdoor")
+    sel = (select(Meet.meet_id, Event.event_id, genders.c.gender, Event.sort_order, literal(True))
+        .select_from(Meet)
+        .join(Event, and_(Event.is_active == True, Event.venue_type.in_([meet_venue, "both"])))
+        .join(genders, true())
+        .where(Meet.meet_id.in_(list(meet_ids))))
+    return db.session.execute(
+        insert(MeetEvent).from_select(["meet_id", "event_id", "gender", "sort_order", "is_scored"], sel)
+    ).rowcount
 
 def get_event_group_id(name: str) -> int:
-    eg = EventGroup.query.filter_by(name=name).first()
-    if not eg:
-        eg = EventGroup(name=name)
-        db.session.add(eg)
-        db.session.flush()  # gets eg.event_group_id without commit
+    for gid, eg in ref_cache.get("event_groups").items():
+        if eg["name"] == name:
+            return gid
+    eg = EventGroup(name=name)
+    db.session.add(eg)
+    db.session.flush()  # gets eg.event_group_id without commit
     return eg.event_group_id
 
 @app.get("/health")
@@ -305,175 +1251,527 @@ def meets_page():
 # ---------- Lookup APIs ----------
 
 @app.get("/api/teams")
+@conditional("teams")
 def list_teams():
-    teams = Team.query.filter_by(org_id=CURRENT_ORG_ID).order_by(Team.name.asc()).all()
-    return jsonify([t.to_dict() for t in teams]), 200
+    teams = [t for t in ref_cache.get("teams").values() if t["org_id"] == CURRENT_ORG_ID]
+    teams.sort(key=lambda t: t["name"])
+    return jsonify(teams), 200
 
 
 @app.get("/api/event-groups")
+@conditional("event_groups")
 def list_event_groups():
-    groups = EventGroup.query.order_by(EventGroup.event_group_id.asc()).all()
-    return jsonify([g.to_dict() for g in groups]), 200
+    groups = ref_cache.get("event_groups")  # already in event_group_id order
+    return jsonify([{"event_group_id": gid, "name": eg["name"]} for gid, eg in groups.items()]), 200
 
 
 # ---------- Athletes APIs ----------
 
+ATHLETE_FIELDS = (
+    "athlete_id",
+    "org_id",
+    "team_id",
+    "event_group_id",
+    "varsity",
+    "first_name",
+    "last_name",
+    "gender",
+    "unavailable",
+    "expected_return",
+    "grad_year",
+    "is_active",
+)
+
+ATHLETE_PAGE_DEFAULT = 100
+ATHLETE_PAGE_MAX = 500
+
+
+def encode_cursor(values):
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("cursor is not valid")
+    if not isinstance(values, list):
+        raise ValueError("cursor is not valid")
+    return values
+
+
 @app.get("/api/athletes")
+@conditional("athletes")
 def list_athletes():
-    include_inactive = (request.args.get("include_inactive") or "").lower() in {"1", "true", "yes", "y"}
+    # keyset pagination: ?limit=&cursor= (cursor comes from the previous page's next_cursor)
+    # filters: team_id, event_group_id, gender, varsity, unavailable, grad_year_min/max, q
+    # projection: ?fields=first_name,last_name (athlete_id is always included)
+    args = request.args
+    include_inactive = (args.get("include_inactive") or "").lower() in {"1", "true", "yes", "y"}
+
+    fields = [f.strip() for f in (args.get("fields") or "").split(",") if f.strip()]
+    if fields:
+        unknown = [f for f in fields if f not in ATHLETE_FIELDS]
+        if unknown:
+            return {"error": f"unknown fields: {', '.join(unknown)}"}, 400
+        if "athlete_id" not in fields:
+            fields.insert(0, "athlete_id")
+    else:
+        fields = list(ATHLETE_FIELDS)
+
+    sort = (args.get("sort") or "name").strip().lower()
+    if sort == "name":
+        sort_cols = [Athlete.last_name, Athlete.first_name, Athlete.athlete_id]
+    elif sort == "id":
+        sort_cols = [Athlete.athlete_id]
+    else:
+        return {"error": "sort must be 'name' or 'id'"}, 400
+
+    try:
+        limit = int(args.get("limit") or ATHLETE_PAGE_DEFAULT)
+    except ValueError:
+        return {"error": "limit must be an integer"}, 400
+    limit = max(1, min(limit, ATHLETE_PAGE_MAX))
 
-    q = Athlete.query.filter(Athlete.org_id == CURRENT_ORG_ID)
+    # only select what was asked for, plus whatever the cursor needs
+    select_names = list(dict.fromkeys(fields + [c.key for c in sort_cols]))
+    q = (db.session.query(*[getattr(Athlete, f) for f in select_names])
+         .filter(Athlete.org_id == CURRENT_ORG_ID))
     if not include_inactive:
         q = q.filter(Athlete.is_active == True)
 
-    athletes = q.order_by(Athlete.athlete_id.asc()).all()
-    return jsonify([a.to_dict() for a in athletes]), 200
+    for k in ("team_id", "event_group_id"):
+        v = args.get(k)
+        if v not in (None, ""):
+            try:
+                q = q.filter(getattr(Athlete, k) == int(v))
+            except ValueError:
+                return {"error": f"{k} must be an integer"}, 400
 
+    gender = (args.get("gender") or "").strip().upper()
+    if gender:
+        if gender not in {"M", "F", "X"}:
+            return {"error": "gender must be 'M' or 'F' or 'X'"}, 400
+        q = q.filter(Athlete.gender == gender)
 
-@app.post("/api/athletes")
-def create_athlete():
-    data = request.get_json(silent=True) or {}
+    for k in ("varsity", "unavailable"):
+        v = args.get(k)
+        if v not in (None, ""):
+            try:
+                q = q.filter(getattr(Athlete, k) == parse_bool(v))
+            except ValueError:
+                return {"error": f"{k} must be True/False"}, 400
+
+    try:
+        grad_min = int(args["grad_year_min"]) if args.get("grad_year_min") else None
+        grad_max = int(args["grad_year_max"]) if args.get("grad_year_max") else None
+    except ValueError:
+        return {"error": "grad_year_min/grad_year_max must be integers"}, 400
+    if grad_min is not None:
+        q = q.filter(Athlete.grad_year >= grad_min)
+    if grad_max is not None:
+        q = q.filter(Athlete.grad_year <= grad_max)
+
+    # every word must match the first or last name, so "jane smith" finds Jane Smith
+    for term in (args.get("q") or "").split():
+        like = f"%{term}%"
+        q = q.filter(or_(Athlete.first_name.ilike(like), Athlete.last_name.ilike(like)))
+
+    cursor = args.get("cursor")
+    if cursor:
+        try:
+            after = decode_cursor(cursor)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+        if len(after) != len(sort_cols) or not all(
+            type(v) is c.type.python_type for v, c in zip(after, sort_cols)
+        ):
+            return {"error": "cursor is not valid"}, 400
+        q = q.filter(tuple_(*sort_cols) > tuple_(*after))
+
+    rows = q.order_by(*[c.asc() for c in sort_cols]).limit(limit + 1).all()
 
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor([last[c.key] for c in sort_cols])
+
+    items = [{f: r._mapping[f] for f in fields} for r in rows]
+    return jsonify({"items": items, "next_cursor": next_cursor}), 200
+
+
+def clean_new_athlete(data, team_ids, event_group_ids):
+    """Validate a new-athlete payload against preloaded id sets.
+
+    Returns the column values for an Athlete insert; raises ValueError with the
+    same messages the single-create endpoint has always returned.
+    """
     first = (data.get("first_name") or "").strip()
     last = (data.get("last_name") or "").strip()
     if not first or not last:
-        return {"error": "first_name and last_name are required"}, 400
-    
-    # TODO make sure the M in data.get doesn't cause error
-    gender = data.get("gender", "M")
+        raise ValueError("first_name and last_name are required")
+
+    # missing or blank gender defaults to M; anything else must be one of the form's options
+    gender = data.get("gender")
+    gender = "M" if gender in (None, "") else str(gender).strip().upper()
     if gender not in {"M", "F", "X"}:
-        return {"error": "gender must be 'M' or 'F'"}, 400
+        raise ValueError("gender must be 'M' or 'F' or 'X'")
 
     # team/event group come from dropdowns; still validate
-    team_id = data.get("team_id")
-    event_group_id = data.get("event_group_id")
-    varsity = data.get("varsity", False)
-    unavailable = data.get("unavailable", False)
-    expected_return = data.get("expected_return") or None
-    grad_year = data.get("grad_year", None)
-
     try:
-        team_id = int(team_id)
+        team_id = int(data.get("team_id"))
     except (TypeError, ValueError):
-        return {"error": "team_id must be an integer"}, 400
-
-    if Team.query.filter_by(team_id=team_id, org_id=CURRENT_ORG_ID).first() is None:
-        return {"error": "team_id is not valid for this organization"}, 400
+        raise ValueError("team_id must be an integer")
+    if team_id not in team_ids:
+        raise ValueError("team_id is not valid for this organization")
 
     try:
-        event_group_id = int(event_group_id)
+        event_group_id = int(data.get("event_group_id"))
     except (TypeError, ValueError):
-        return {"error": "event_group_id must be an integer"}, 400
-
-    if EventGroup.query.filter_by(event_group_id=event_group_id).first() is None:
-        return {"error": "event_group_id is not valid"}, 400
+        raise ValueError("event_group_id must be an integer")
+    if event_group_id not in event_group_ids:
+        raise ValueError("event_group_id is not valid")
 
     try:
         varsity = parse_bool(data.get("varsity"), default=False)
     except ValueError:
-        return {"error": "varsity must be True/False"}, 400
+        raise ValueError("varsity must be True/False")
 
     try:
         unavailable = parse_bool(data.get("unavailable"), default=False)
     except ValueError:
-        return {"error": "unavailable must be True/False"}, 400
+        raise ValueError("unavailable must be True/False")
 
+    grad_year = data.get("grad_year", None)
     if grad_year in ("", None):
         grad_year = None
     else:
         try:
             grad_year = int(grad_year)
         except (TypeError, ValueError):
-            return {"error": "grad_year must be an integer"}, 400
+            raise ValueError("grad_year must be an integer")
 
-    if expected_return == "":
-        expected_return = None
+    expected_return = data.get("expected_return") or None
 
-    a = Athlete(
-        org_id=CURRENT_ORG_ID,
-        team_id=team_id,
-        event_group_id=event_group_id,
-        varsity=varsity,
-        first_name=first,
-        last_name=last,
-        gender=gender,
-        unavailable=unavailable,
-        expected_return=expected_return,
-        grad_year=grad_year,
-        is_active=True,
-    )
+    return {
+        "org_id": CURRENT_ORG_ID,
+        "team_id": team_id,
+        "event_group_id": event_group_id,
+        "varsity": varsity,
+        "first_name": first,
+        "last_name": last,
+        "gender": gender,
+        "unavailable": unavailable,
+        "expected_return": expected_return,
+        "grad_year": grad_year,
+        "is_active": True,
+    }
+
+
+@app.post("/api/athletes")
+def create_athlete():
+    data = request.get_json(silent=True) or {}
+
+    try:
+        values = clean_new_athlete(data, org_team_ids(), event_group_ids())
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    a = Athlete(**values)
     db.session.add(a)
     db.session.commit()
     return jsonify(a.to_dict()), 201
 
 
-@app.patch("/api/athletes/<int:athlete_id>")
-def update_athlete(athlete_id: int):
-    a = Athlete.query.filter_by(athlete_id=athlete_id, org_id=CURRENT_ORG_ID).first()
-    if not a:
-        return {"error": "Not found"}, 404
+ATHLETE_IMPORT_CHUNK = 500
 
-    data = request.get_json(silent=True) or {}
 
-    allowed = {
-        "team_id",
-        "event_group_id",
-        "varsity",
-        "first_name",
-        "last_name",
-        "gender",
-        "unavailable",
-        "expected_return",
-        "grad_year",
-        "is_active",  # background for soft delete later
-    }
+def import_header(name):
+    # "Last Name", "last-name" and "last_name" all name the last_name column
+    return re.sub(r"[\s-]+", "_", (name or "").strip().lower())
 
-    for k, v in data.items():
-        if k not in allowed:
+
+def iter_import_rows(stream, fmt):
+    """Yield (row_number, dict_or_error) from a CSV or NDJSON byte stream without buffering it."""
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        reader = csv.DictReader(text_stream)
+        for i, row in enumerate(reader, start=1):
+            yield i, {import_header(k): (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
+        return
+
+    i = 0
+    for line in text_stream:
+        line = line.strip()
+        if not line:
+            continue
+        i += 1
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield i, ValueError("invalid JSON")
+            continue
+        if not isinstance(row, dict):
+            yield i, ValueError("each line must be a JSON object")
             continue
+        yield i, row
 
-        if k in {"team_id", "event_group_id", "grad_year"}:
-            if v in ("", None):
-                v = None
-            else:
-                try:
-                    v = int(v)
-                except (TypeError, ValueError):
-                    return {"error": f"{k} must be an integer"}, 400
 
-            if k == "team_id":
-                if v is None or Team.query.filter_by(team_id=v, org_id=CURRENT_ORG_ID).first() is None:
-                    return {"error": "team_id is not valid for this organization"}, 400
+@app.post("/api/athletes/import")
+def import_athletes():
+    # Body is the raw file (or a multipart "file" field).
+    # ?format=csv|ndjson (defaults from Content-Type), ?dry_run=1 validates without inserting.
+    # Rows may name their team/event group ("team", "event_group") instead of giving ids.
+    try:
+        dry_run = parse_bool(request.args.get("dry_run"), default=False)
+    except ValueError:
+        return {"error": "dry_run must be True/False"}, 400
 
-            if k == "event_group_id":
-                if v is None or EventGroup.query.filter_by(event_group_id=v).first() is None:
-                    return {"error": "event_group_id is not valid"}, 400
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+    content_type = (upload.mimetype if upload else request.mimetype) or ""
 
-        if k in {"varsity", "unavailable", "is_active"}:
-            try:
-                v = parse_bool(v)
-            except ValueError:
-                return {"error": f"{k} must be True or False"}, 400
+    fmt = (request.args.get("format") or "").strip().lower()
+    if not fmt:
+        fmt = "ndjson" if "ndjson" in content_type or "jsonl" in content_type else "csv"
+    if fmt not in {"csv", "ndjson"}:
+        return {"error": "format must be 'csv' or 'ndjson'"}, 400
 
-        if k in {"first_name", "last_name"}:
+    teams_by_name = {
+        t["name"].strip().lower(): tid
+        for tid, t in ref_cache.get("teams").items() if t["org_id"] == CURRENT_ORG_ID
+    }
+    groups_by_name = {eg["name"].strip().lower(): gid for gid, eg in ref_cache.get("event_groups").items()}
+    team_ids = org_team_ids()
+    group_ids = event_group_ids()
+
+    errors = []
+    pending = []
+    total = 0
+    inserted = 0
+
+    def flush():
+        nonlocal inserted
+        if pending and not dry_run:
+            db.session.execute(insert(Athlete), pending)
+        inserted += len(pending)
+        pending.clear()
+
+    try:
+        for row_num, row in iter_import_rows(stream, fmt):
+            total += 1
+            if isinstance(row, Exception):
+                errors.append({"row": row_num, "error": str(row)})
+                continue
+
+            if row.get("team_id") in (None, "") and row.get("team"):
+                tid = teams_by_name.get(str(row["team"]).strip().lower())
+                if tid is None:
+                    errors.append({"row": row_num, "error": f"team '{row['team']}' not found"})
+                    continue
+                row["team_id"] = tid
+            if row.get("event_group_id") in (None, "") and row.get("event_group"):
+                gid = groups_by_name.get(str(row["event_group"]).strip().lower())
+                if gid is None:
+                    errors.append({"row": row_num, "error": f"event_group '{row['event_group']}' not found"})
+                    continue
+                row["event_group_id"] = gid
+
+            try:
+                pending.append(clean_new_athlete(row, team_ids, group_ids))
+            except ValueError as e:
+                errors.append({"row": row_num, "error": str(e)})
+                continue
+
+            if len(pending) >= ATHLETE_IMPORT_CHUNK:
+                flush()
+        flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        return {"error": f"could not parse file: {e}"}, 400
+
+    if dry_run:
+        db.session.rollback()
+    else:
+        if inserted:
+            mark_changed("athletes")
+        db.session.commit()
+
+    return jsonify({
+        "dry_run": dry_run,
+        "rows": total,
+        "inserted": 0 if dry_run else inserted,
+        "valid": inserted,
+        "errors": errors,
+    }), 200
+
+
+ATHLETE_EDITABLE = {
+    "team_id",
+    "event_group_id",
+    "varsity",
+    "first_name",
+    "last_name",
+    "gender",
+    "unavailable",
+    "expected_return",
+    "grad_year",
+    "is_active",  # background for soft delete later
+}
+
+
+def clean_athlete_changes(data, team_ids, event_group_ids):
+    """Validate a partial athlete update; unknown keys are ignored. Raises ValueError."""
+    out = {}
+    for k, v in data.items():
+        if k not in ATHLETE_EDITABLE:
+            continue
+
+        if k in {"team_id", "event_group_id", "grad_year"}:
+            if v in ("", None):
+                v = None
+            else:
+                try:
+                    v = int(v)
+                except (TypeError, ValueError):
+                    raise ValueError(f"{k} must be an integer")
+
+            if k == "team_id":
+                if v is None or v not in team_ids:
+                    raise ValueError("team_id is not valid for this organization")
+
+            if k == "event_group_id":
+                if v is None or v not in event_group_ids:
+                    raise ValueError("event_group_id is not valid")
+
+        if k in {"varsity", "unavailable", "is_active"}:
+            try:
+                v = parse_bool(v)
+            except ValueError:
+                raise ValueError(f"{k} must be True or False")
+
+        if k in {"first_name", "last_name"}:
             v = (v or "").strip()
             if not v:
-                return {"error": f"{k} is required"}, 400
-        
+                raise ValueError(f"{k} is required")
+
         if k == "gender":
             if v not in {"M", "F", "X"}:
-                return {"error": "gender must be 'M' or 'F' or 'X'"}, 400
+                raise ValueError("gender must be 'M' or 'F' or 'X'")
 
         if k == "expected_return" and (v == "" or v is None):
             v = None
 
+        out[k] = v
+    return out
+
+
+@app.patch("/api/athletes/<int:athlete_id>")
+def update_athlete(athlete_id: int):
+    a = Athlete.query.filter_by(athlete_id=athlete_id, org_id=CURRENT_ORG_ID).first()
+    if not a:
+        return {"error": "Not found"}, 404
+
+    data = request.get_json(silent=True) or {}
+
+    try:
+        changes = clean_athlete_changes(data, org_team_ids(), event_group_ids())
+    except ValueError as e:
+        return {"error": str(e)}, 400
+
+    for k, v in changes.items():
         setattr(a, k, v)
 
     db.session.commit()
     return jsonify(a.to_dict()), 200
 
+
+@app.patch("/api/athletes")
+def update_athletes_batch():
+    # Body: [{"athlete_id": 1, "changes": {...}}, ...] (or {"updates": [...]}).
+    # Invalid items are reported and skipped; the rest are applied in one transaction,
+    # one UPDATE per distinct change set.
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("updates")
+    if not isinstance(data, list):
+        return {"error": "body must be a list of {athlete_id, changes}"}, 400
+
+    team_ids = org_team_ids()
+    group_ids = event_group_ids()
+
+    requested = set()
+    for item in data:
+        if isinstance(item, dict):
+            try:
+                requested.add(int(item.get("athlete_id")))
+            except (TypeError, ValueError):
+                pass
+    known = set()
+    if requested:
+        known = {
+            aid for (aid,) in db.session.query(Athlete.athlete_id)
+            .filter(Athlete.org_id == CURRENT_ORG_ID, Athlete.athlete_id.in_(requested))
+        }
+
+    # later items for the same athlete win, like sequential PATCHes would
+    merged = {}
+    results = []
+    for item in data:
+        if not isinstance(item, dict):
+            results.append({"athlete_id": None, "ok": False, "error": "item must be an object"})
+            continue
+        try:
+            athlete_id = int(item.get("athlete_id"))
+        except (TypeError, ValueError):
+            results.append({"athlete_id": item.get("athlete_id"), "ok": False, "error": "athlete_id must be an integer"})
+            continue
+        if athlete_id not in known:
+            results.append({"athlete_id": athlete_id, "ok": False, "error": "Not found"})
+            continue
+        changes = item.get("changes")
+        if not isinstance(changes, dict):
+            results.append({"athlete_id": athlete_id, "ok": False, "error": "changes must be an object"})
+            continue
+        try:
+            cleaned = clean_athlete_changes(changes, team_ids, group_ids)
+        except ValueError as e:
+            results.append({"athlete_id": athlete_id, "ok": False, "error": str(e)})
+            continue
+        merged.setdefault(athlete_id, {}).update(cleaned)
+        results.append({"athlete_id": athlete_id, "ok": True})
+
+    groups = {}
+    for athlete_id, changes in merged.items():
+        if changes:
+            key = tuple(sorted(changes.items()))
+            groups.setdefault(key, []).append(athlete_id)
+
+    for key, ids in groups.items():
+        (db.session.query(Athlete)
+            .filter(Athlete.org_id == CURRENT_ORG_ID, Athlete.athlete_id.in_(ids))
+            .update(dict(key), synchronize_session=False))
+    if groups:
+        mark_changed("athletes")
+    db.session.commit()
+
+    updated = {}
+    if merged:
+        cols = [getattr(Athlete, f) for f in ATHLETE_FIELDS]
+        for row in db.session.query(*cols).filter(Athlete.athlete_id.in_(list(merged))):
+            updated[row.athlete_id] = dict(row._mapping)
+    for r in results:
+        if r["ok"]:
+            r["athlete"] = updated.get(r["athlete_id"])
+
+    return jsonify({"results": results}), 200
+
 # ------- meet apis ---------
 @app.get("/api/meets")
+@conditional("meets", "seasons")
 def list_meets():
     rows = (
         db.session.query(Meet, Season)
@@ -504,7 +1802,7 @@ def create_meet():
             season_id = int(season_id)
         except (TypeError, ValueError):
             return {"error": "season_id must be an integer or null"}, 400
-        if db.session.get(Season, season_id) is None:
+        if season_id not in ref_cache.get("seasons"):
             return {"error": "season_id is not valid"}, 400
 
     m = Meet(
@@ -518,18 +1816,106 @@ def create_meet():
         notes=(str(data.get("notes")).strip() or None) if data.get("notes") is not None else None,
     )
     db.session.add(m)
+    db.session.flush()
+    populate_meet_events([m.meet_id])
     db.session.commit()
-    autopopulate_meet_events(m)
     return jsonify(m.to_dict()), 201
 
+@app.post("/api/meets/<int:meet_id>/clone")
+def clone_meet(meet_id):
+    # Copies the meet row and its meet events; with include_entries, also the entries of
+    # athletes who are still active and available. Statement count doesn't grow with meet size.
+    src = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True) or {}
+
+    season_id = src.season_id
+    if "season_id" in data:
+        season_id = data.get("season_id")
+        if season_id in ("", None):
+            season_id = None
+        else:
+            try:
+                season_id = int(season_id)
+            except (TypeError, ValueError):
+                return {"error": "season_id must be an integer or null"}, 400
+            if season_id not in ref_cache.get("seasons"):
+                return {"error": "season_id is not valid"}, 400
+
+    try:
+        include_entries = parse_bool(data.get("include_entries"), default=False)
+        is_varsity = parse_bool(data.get("is_varsity"), default=src.is_varsity)
+    except ValueError:
+        return {"error": "include_entries/is_varsity must be True/False"}, 400
+
+    m = Meet(
+        org_id=CURRENT_ORG_ID,
+        name=(str(data.get("name") or "").strip() or f"{src.name} (copy)"),
+        meet_date=data.get("meet_date") or None,
+        location=data["location"] if "location" in data else src.location,
+        is_varsity=is_varsity,
+        season_id=season_id,
+        venue_type=src.venue_type,
+        notes=src.notes,
+    )
+    db.session.add(m)
+    db.session.flush()
+
+    src_me = MeetEvent.__table__.alias("src_me")
+    me_cols = ["meet_id", "event_id", "gender", "sort_order", "max_entries", "is_scored",
+               "start_minute", "duration_minutes"]
+    cloned_events = db.session.execute(
+        insert(MeetEvent).from_select(me_cols, select(
+            literal(m.meet_id), src_me.c.event_id, src_me.c.gender,
+            src_me.c.sort_order, src_me.c.max_entries, src_me.c.is_scored,
+            src_me.c.start_minute, src_me.c.duration_minutes,
+        ).where(src_me.c.meet_id == src.meet_id))
+    ).rowcount
+
+    cloned_entries = 0
+    if include_entries:
+        new_me = MeetEvent.__table__.alias("new_me")
+        ent = MeetEntry.__table__
+        sel = (select(new_me.c.meet_event_id, ent.c.athlete_id, literal("entered"),
+                      ent.c.seed_time, ent.c.seed_mark, ent.c.seed_time_ms, ent.c.seed_mark_mm)
+            .select_from(ent)
+            .join(src_me, ent.c.meet_event_id == src_me.c.meet_event_id)
+            .join(new_me, and_(
+                new_me.c.meet_id == m.meet_id,
+                new_me.c.event_id == src_me.c.event_id,
+                new_me.c.gender == src_me.c.gender,
+            ))
+            .join(Athlete, Athlete.athlete_id == ent.c.athlete_id)
+            .where(
+                src_me.c.meet_id == src.meet_id,
+                ent.c.entry_status == "entered",
+                Athlete.is_active == True,
+                Athlete.unavailable == False,
+            ))
+        cloned_entries = db.session.execute(
+            insert(MeetEntry).from_select(
+                ["meet_event_id", "athlete_id", "entry_status", "seed_time", "seed_mark", "seed_time_ms", "seed_mark_mm"], sel
+            )
+        ).rowcount
+
+        if cloned_entries and meet_counts_as_varsity(m):
+            athlete_ids = [aid for (aid,) in db.session.query(MeetEntry.athlete_id)
+                .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+                .filter(MeetEvent.meet_id == m.meet_id)
+                .distinct()]
+            adjust_varsity_counts(athlete_ids, m.season_id, +1)
+        if cloned_entries:
+            refresh_conflicts(m.meet_id)
+
+    db.session.commit()
+    return jsonify({**m.to_dict(), "cloned_meet_events": cloned_events, "cloned_entries": cloned_entries}), 201
+
 # ------ events -----
 @app.get("/api/events")
+@conditional("events")
 def list_events():
-    events = (Event.query
-              .filter_by(is_active=True)
-              .order_by(Event.sort_order.asc())
-              .all())
-    return jsonify([e.to_dict() for e in events])
+    events = [e for e in ref_cache.get("events").values() if e["is_active"]]
+    events.sort(key=lambda e: e["sort_order"])
+    return jsonify(events)
 
 # add events to meet
 @app.post("/api/meets/<int:meet_id>/meet-events")
@@ -554,21 +1940,187 @@ def add_meet_event(meet_id):
     )
     db.session.add(me)
     try:
-        db.session.commit()
+        db.session.flush()
     except Exception:
         db.session.rollback()
         return jsonify({"error": "event already added for this meet+gender (or invalid ids)"}), 400
+    version = touch_meet_page(meet_id, [me.meet_event_id])
+    db.session.commit()
+    publish_meet_change(meet_id, "meet_event_added", {**me.to_dict(), "page_version": version})
 
     return jsonify(me.to_dict()), 201
 
+def touch_meet_page(meet_id, meet_event_ids=()):
+    """Bump the meet's page_version and stamp the given meet events with it."""
+    db.session.execute(
+        update(Meet).where(Meet.meet_id == meet_id).values(page_version=Meet.page_version + 1)
+    )
+    version = db.session.query(Meet.page_version).filter(Meet.meet_id == meet_id).scalar()
+    if meet_event_ids:
+        db.session.execute(
+            update(MeetEvent)
+            .where(MeetEvent.meet_event_id.in_(list(meet_event_ids)))
+            .values(entries_version=version)
+        )
+    return version
+
+
+# everything outside the meet row that the meet events / entries part of the page is built
+# from; bests are also versioned per season (the meet's season and ALL_TIME, see record_bests)
+MEET_PAGE_EVENT_KINDS = ("athletes", "bests", "events", "event_groups", "seasons")
+# the roster panel is the same for every meet of a season, and versioned on its own so a
+# varsity count moving refreshes the panel without reloading any meet's events
+MEET_PAGE_ROSTER_KINDS = ("athletes", "varsity_counts", "teams", "event_groups")
+MEET_PAGE_CACHE_SIZE = 256
+
+
+class MeetPageCache:
+    """LRU of built payloads, e.g. meet pages keyed by (meet_id, gender).
+
+    An entry is valid while the versions it was built from (the meet's
+    page_version and the resource versions in its token) still match, so every
+    worker agrees on freshness without any cross-process messaging.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (meet_id, gender) -> (token, payload)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, token):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == token:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            return None
+
+    def put(self, key, token, payload):
+        with self._lock:
+            self._entries[key] = (token, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+meet_page_cache = MeetPageCache(MEET_PAGE_CACHE_SIZE)
+roster_cache = MeetPageCache(MEET_PAGE_CACHE_SIZE)  # (season key, gender) -> athletes
+
+
+def version_stamp(kinds):
+    versions = resource_versions()
+    return "-".join(str(versions.get(k, (0, None))[0]) for k in kinds)
+
+
+def meet_events_token(meet):
+    """Version of the meet events / entries part of the page: "<page_version>.<stamp>"."""
+    stamp = version_stamp(MEET_PAGE_EVENT_KINDS + (
+        season_kind("bests", meet.season_id), season_kind("bests", ALL_TIME),
+    ))
+    return f"{meet.page_version}.{stamp}"
+
+
+def roster_token(season_id):
+    return version_stamp(MEET_PAGE_ROSTER_KINDS + (season_kind("varsity_counts", season_id),))
+
+
 @app.get("/api/meets/<int:meet_id>/page")
 def meet_page_bootstrap(meet_id):
+    # ?since=<version from a previous response> returns only the meet events whose
+    # entries changed since then, plus the roster panel only if it changed (or
+    # everything if the reference data behind the events moved)
     gender = (request.args.get("gender") or "M").upper()
     if gender not in {"M", "F"}:
         return jsonify({"error": "gender must be M or F"}), 400
 
     meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
 
+    events_token = meet_events_token(meet)
+    payload = meet_page_cache.get((meet_id, gender), events_token)
+    if payload is None:
+        payload = build_meet_page(meet, gender)
+        meet_page_cache.put((meet_id, gender), events_token, payload)
+
+    roster_stamp = roster_token(meet.season_id)
+    roster_key = (season_key(meet.season_id), gender)
+    athletes = roster_cache.get(roster_key, roster_stamp)
+    if athletes is None:
+        athletes = build_roster(meet.season_id, gender)
+        roster_cache.put(roster_key, roster_stamp, athletes)
+    token = f"{events_token}.{roster_stamp}"
+
+    since_page, _, since_rest = (request.args.get("since") or "").partition(".")
+    since_events, _, since_roster = since_rest.partition(".")
+    _, _, events_stamp = events_token.partition(".")
+    if since_page.isdigit() and since_events == events_stamp:
+        since_page = int(since_page)
+        delta = {
+            "meet": payload["meet"],
+            "gender": gender,
+            "version": token,
+            "delta": True,
+            "meet_events": [me for me in payload["meet_events"] if me["entries_version"] > since_page],
+            "conflicts": payload["conflicts"],
+        }
+        if since_roster != roster_stamp:
+            delta["athletes"] = athletes
+        return jsonify(delta)
+
+    return jsonify({**payload, "athletes": athletes, "version": token, "delta": False})
+
+
+def entries_for_meet_events(meet_event_ids):
+    """{meet_event_id: [entry dicts as shown on the meet page]} in one query."""
+    entries_by_meet_event = {}
+    if not meet_event_ids:
+        return entries_by_meet_event
+    pr = db.aliased(AthleteBest)
+    sb = db.aliased(AthleteBest)
+    entries = (db.session.query(MeetEntry, Athlete, pr.best_mark, sb.best_mark)
+        .join(Athlete, MeetEntry.athlete_id == Athlete.athlete_id)
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .join(Meet, MeetEvent.meet_id == Meet.meet_id)
+        .outerjoin(pr, and_(
+            pr.athlete_id == MeetEntry.athlete_id, pr.event_id == MeetEvent.event_id, pr.season_id == ALL_TIME,
+        ))
+        .outerjoin(sb, and_(
+            sb.athlete_id == MeetEntry.athlete_id, sb.event_id == MeetEvent.event_id,
+            sb.season_id == func.coalesce(Meet.season_id, 0),
+        ))
+        .filter(MeetEntry.meet_event_id.in_(list(meet_event_ids)), Athlete.org_id == CURRENT_ORG_ID)
+        .order_by(Athlete.last_name.asc(), Athlete.first_name.asc())
+        .all()
+    )
+    for ent, ath, pr_mark, sb_mark in entries:
+        entries_by_meet_event.setdefault(ent.meet_event_id, []).append({
+            "athlete_id": ath.athlete_id,
+            "first_name": ath.first_name,
+            "last_name": ath.last_name,
+            "gender": ath.gender,
+            "unavailable": ath.unavailable,
+            "seed_time": ent.seed_time,
+            "seed_mark": ent.seed_mark,
+            "heat": ent.heat,
+            "lane": ent.lane,
+            "relay_leg": ent.relay_leg,
+            "pr": pr_mark,
+            "sb": sb_mark,
+        })
+    return entries_by_meet_event
+
+
+def build_meet_page(meet, gender):
+    """The meet's own part of the page: meet events with entries, and conflicts."""
+    meet_id = meet.meet_id
+
     # meet events for tab
     meet_events = (db.session.query(MeetEvent, Event, EventGroup)
         .join(Event, MeetEvent.event_id == Event.event_id)
@@ -579,48 +2131,40 @@ def meet_page_bootstrap(meet_id):
     )
     meet_event_ids = [me.meet_event_id for (me, e, g) in meet_events]
 
-    varsity_counts = dict(
-        db.session.query(
-            MeetEntry.athlete_id,
-            func.count(distinct(MeetEvent.meet_id)).label("varsity_meets"),
-        )
-        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
-        .join(Meet, MeetEvent.meet_id == Meet.meet_id)
-        .filter(
-            Meet.org_id == CURRENT_ORG_ID,
-            Meet.is_archived == False,
-            Meet.is_varsity == True,
-            MeetEntry.entry_status == "entered",
-            Meet.season_id == meet.season_id,
-        )
-        .group_by(MeetEntry.athlete_id)
-        .all()
-    )
     # entries for those meet events
-    entries = []
-    if meet_event_ids:
-        entries = (db.session.query(MeetEntry, Athlete)
-            .join(Athlete, MeetEntry.athlete_id == Athlete.athlete_id)
-            .filter(MeetEntry.meet_event_id.in_(meet_event_ids), Athlete.org_id == CURRENT_ORG_ID)
-            .order_by(Athlete.last_name.asc(), Athlete.first_name.asc())
-            .all()
-        )
+    entries_by_meet_event = entries_for_meet_events(meet_event_ids)
 
-    entries_by_meet_event = {}
-    for ent, ath in entries:
-        entries_by_meet_event.setdefault(ent.meet_event_id, []).append({
-            "athlete_id": ath.athlete_id,
-            "first_name": ath.first_name,
-            "last_name": ath.last_name,
-            "gender": ath.gender,
-            "unavailable": ath.unavailable,
+    payload_meet_events = []
+    for me, ev, grp in meet_events:
+        payload_meet_events.append({
+            "meet_event_id": me.meet_event_id,
+            "event_id": ev.event_id,
+            "event_name": ev.name,
+            "event_group": (grp.name if grp else None),
+            "sort_order": me.sort_order,
+            "start_time": format_clock(me.start_minute),
+            "duration_minutes": me.duration_minutes,
+            "entries_version": me.entries_version,
+            "entries": entries_by_meet_event.get(me.meet_event_id, []),
         })
 
+    return {
+        "meet": meet.to_dict(),
+        "gender": gender,
+        "meet_events": payload_meet_events,
+        "conflicts": meet_conflicts(meet_id, gender),
+    }
 
-    # athlete list for right side (with names)
-    ath_rows = (db.session.query(Athlete, Team, EventGroup)
+
+def build_roster(season_id, gender):
+    """Athlete list for the right side of the meet page, with the season's varsity counts."""
+    ath_rows = (db.session.query(Athlete, Team, EventGroup, VarsityMeetCount.varsity_meets)
         .outerjoin(Team, and_(Athlete.team_id == Team.team_id, Team.org_id == CURRENT_ORG_ID))
         .outerjoin(EventGroup, Athlete.event_group_id == EventGroup.event_group_id)
+        .outerjoin(VarsityMeetCount, and_(
+            VarsityMeetCount.athlete_id == Athlete.athlete_id,
+            VarsityMeetCount.season_id == season_key(season_id),
+        ))
         .filter(
             Athlete.org_id == CURRENT_ORG_ID,
             Athlete.is_active == True,
@@ -631,7 +2175,7 @@ def meet_page_bootstrap(meet_id):
     )
 
     payload_athletes = []
-    for a, t, g in ath_rows:
+    for a, t, g, varsity_meets in ath_rows:
         payload_athletes.append({
         "athlete_id": a.athlete_id,
         "first_name": a.first_name,
@@ -644,27 +2188,10 @@ def meet_page_bootstrap(meet_id):
         "team_name": (t.name if t else None),
         "event_group_id": a.event_group_id,
         "event_group_name": (g.name if g else None),
-        "varsity_meets": int(varsity_counts.get(a.athlete_id, 0)),
-        "varsity": bool(a.varsity) if hasattr(a, "varsity") else (int(varsity_counts.get(a.athlete_id, 0)) > 0),
+        "varsity_meets": int(varsity_meets or 0),
+        "varsity": bool(a.varsity),
         })
-
-    payload_meet_events = []
-    for me, ev, grp in meet_events:
-        payload_meet_events.append({
-            "meet_event_id": me.meet_event_id,
-            "event_id": ev.event_id,
-            "event_name": ev.name,
-            "event_group": (grp.name if grp else None),
-            "sort_order": me.sort_order,
-            "entries": entries_by_meet_event.get(me.meet_event_id, []),
-        })
-
-    return jsonify({
-        "meet": meet.to_dict(),
-        "gender": gender,
-        "meet_events": payload_meet_events,
-        "athletes": payload_athletes,
-    })
+    return payload_athletes
 
 
 @app.post("/api/meet-events/<int:meet_event_id>/entries")
@@ -674,11 +2201,12 @@ def add_entry(meet_event_id):
     if not athlete_id:
         return jsonify({"error": "athlete_id required"}), 400
 
-    me = (db.session.query(MeetEvent)
+    me, meet = (db.session.query(MeetEvent, Meet)
         .join(Meet, MeetEvent.meet_id == Meet.meet_id)
         .filter(MeetEvent.meet_event_id == meet_event_id,Meet.org_id == CURRENT_ORG_ID)
         .first_or_404())
-    ath = Athlete.query.filter_by(athlete_id=int(athlete_id), org_id=CURRENT_ORG_ID).first_or_404()
+    # locked: see lock_athletes
+    ath = Athlete.query.filter_by(athlete_id=int(athlete_id), org_id=CURRENT_ORG_ID).with_for_update().first_or_404()
 
     if ath.gender != me.gender:
         return jsonify({"error": "athlete gender does not match event gender"}), 400
@@ -686,17 +2214,1090 @@ def add_entry(meet_event_id):
     entry = MeetEntry(meet_event_id=meet_event_id, athlete_id=ath.athlete_id)
     db.session.add(entry)
     try:
-        db.session.commit()
+        db.session.flush()
     except Exception:
         db.session.rollback()
         return jsonify({"error": "athlete already entered in this event"}), 400
 
+    # first entry in this meet -> one more varsity meet for the season
+    if meet_counts_as_varsity(meet) and entered_meet_count(ath.athlete_id, meet.meet_id) == 1:
+        adjust_varsity_counts([ath.athlete_id], meet.season_id, +1)
+    if me.start_minute is not None:
+        refresh_conflicts(meet.meet_id, [ath.athlete_id])
+    version = touch_meet_page(meet.meet_id, [meet_event_id])
+    db.session.commit()
+    publish_meet_change(meet.meet_id, "entry_added", {
+        "meet_event_id": meet_event_id,
+        "athlete_id": ath.athlete_id,
+        "gender": me.gender,
+        "page_version": version,
+    })
+
     return jsonify(entry.to_dict()), 201
 
 
+@app.post("/api/meets/<int:meet_id>/entries/bulk")
+def bulk_entries(meet_id):
+    # Body: {"operations": [{"meet_event_id", "athlete_id", "op": "add"|"remove"}, ...]}
+    # Ops apply in order; invalid ones are reported and skipped, the rest commit together.
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(force=True)
+    ops = data.get("operations") if isinstance(data, dict) else data
+    if not isinstance(ops, list):
+        return jsonify({"error": "operations must be a list"}), 400
+    return jsonify(apply_entry_operations(meet, ops))
+
+
+def apply_entry_operations(meet, ops, before_commit=None, atomic=False):
+    """Apply [{"meet_event_id", "athlete_id", "op"}] to a meet's entries and commit.
+
+    before_commit, if given, runs after the inserts/deletes in the same transaction
+    and returns the ids of any further meet events it changed. With atomic, nothing
+    is written (or it is rolled back) when any op fails. Returns the bulk endpoint's
+    response body (per-op results, page_version and the changed meet events' entries).
+    """
+    meet_id = meet.meet_id
+    parsed = []
+    for op in ops:
+        try:
+            parsed.append((int(op["meet_event_id"]), int(op["athlete_id"]), str(op.get("op") or "add").lower()))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            parsed.append(None)
+
+    me_ids = {p[0] for p in parsed if p}
+    ath_ids = {p[1] for p in parsed if p}
+    me_gender = dict(
+        db.session.query(MeetEvent.meet_event_id, MeetEvent.gender)
+        .filter(MeetEvent.meet_id == meet_id, MeetEvent.meet_event_id.in_(me_ids))
+    ) if me_ids else {}
+    ath_gender = dict(
+        db.session.query(Athlete.athlete_id, Athlete.gender)
+        .filter(Athlete.org_id == CURRENT_ORG_ID, Athlete.athlete_id.in_(ath_ids))
+    ) if ath_ids else {}
+
+    # every current entry in this meet for the athletes involved: duplicate checks + varsity counts
+    lock_athletes(ath_gender)
+    existing = {}  # (meet_event_id, athlete_id) -> entry_status
+    if ath_gender:
+        existing = {
+            (me_id, aid): status
+            for me_id, aid, status in db.session.query(MeetEntry.meet_event_id, MeetEntry.athlete_id, MeetEntry.entry_status)
+            .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+            .filter(MeetEvent.meet_id == meet_id, MeetEntry.athlete_id.in_(list(ath_gender)))
+        }
+
+    state = {pair: True for pair in existing}
+    results = []
+    for op, p in zip(ops, parsed):
+        if p is None:
+            results.append({"ok": False, "error": "meet_event_id and athlete_id must be integers"})
+            continue
+        me_id, aid, kind = p
+        res = {"meet_event_id": me_id, "athlete_id": aid, "op": kind}
+        if kind not in {"add", "remove"}:
+            results.append({**res, "ok": False, "error": "op must be 'add' or 'remove'"})
+        elif me_id not in me_gender:
+            results.append({**res, "ok": False, "error": "meet event not found in this meet"})
+        elif aid not in ath_gender:
+            results.append({**res, "ok": False, "error": "athlete not found"})
+        elif kind == "add" and ath_gender[aid] != me_gender[me_id]:
+            results.append({**res, "ok": False, "error": "athlete gender does not match event gender"})
+        else:
+            state[(me_id, aid)] = kind == "add"
+            results.append({**res, "ok": True})
+
+    unchanged = {"results": results, "page_version": meet.page_version, "meet_events": []}
+    if atomic and not all(r["ok"] for r in results):
+        db.session.rollback()
+        return unchanged
+
+    to_add = [pair for pair, on in state.items() if on and pair not in existing]
+    to_remove = [pair for pair, on in state.items() if not on and pair in existing]
+
+    if to_add:
+        # another request may have entered the same athlete since `existing` was read;
+        # those rows are skipped (uq_meet_entry) and reported instead of failing the batch
+        inserted = set()
+        for i in range(0, len(to_add), 300):  # stay under SQLite's bound-parameter limit
+            stmt = upsert_insert(MeetEntry).values([
+                {"meet_event_id": me_id, "athlete_id": aid, "entry_status": "entered"} for me_id, aid in to_add[i:i + 300]
+            ]).on_conflict_do_nothing(index_elements=["meet_event_id", "athlete_id"])
+            inserted.update(tuple(r) for r in db.session.execute(
+                stmt.returning(MeetEntry.meet_event_id, MeetEntry.athlete_id)
+            ))
+        raced = set(to_add) - inserted
+        if raced and atomic:
+            db.session.rollback()
+            for res in results:
+                if res["op"] == "add" and (res["meet_event_id"], res["athlete_id"]) in raced:
+                    res.update(ok=False, error="athlete is already entered in this event")
+            return unchanged
+        if raced:
+            to_add = [pair for pair in to_add if pair in inserted]
+            for res in results:
+                if res.get("ok") and res["op"] == "add" and (res["meet_event_id"], res["athlete_id"]) in raced:
+                    res.update(ok=False, error="athlete is already entered in this event")
+    if to_remove:
+        (db.session.query(MeetEntry)
+            .filter(tuple_(MeetEntry.meet_event_id, MeetEntry.athlete_id).in_(to_remove))
+            .delete(synchronize_session=False))
+
+    if meet_counts_as_varsity(meet) and (to_add or to_remove):
+        before, after = {}, {}
+        for (me_id, aid), status in existing.items():
+            if status == "entered":
+                before[aid] = before.get(aid, 0) + 1
+        after.update(before)
+        for me_id, aid in to_add:
+            after[aid] = after.get(aid, 0) + 1
+        for pair in to_remove:
+            if existing[pair] == "entered":
+                after[pair[1]] -= 1
+        adjust_varsity_counts([a for a in after if after[a] > 0 and not before.get(a)], meet.season_id, +1)
+        adjust_varsity_counts([a for a in before if before[a] > 0 and not after.get(a)], meet.season_id, -1)
+
+    if to_add or to_remove:
+        refresh_conflicts(meet_id, {aid for _, aid in to_add + to_remove})
+
+    changed_me_ids = {me_id for me_id, _ in to_add + to_remove}
+    if before_commit is not None:
+        changed_me_ids.update(before_commit())
+    changed_me_ids = sorted(changed_me_ids)
+    version = touch_meet_page(meet_id, changed_me_ids) if changed_me_ids else meet.page_version
+    db.session.commit()
+
+    for me_id, aid in to_add:
+        publish_meet_change(meet_id, "entry_added", {
+            "meet_event_id": me_id, "athlete_id": aid, "gender": me_gender[me_id], "page_version": version,
+        })
+    for me_id, aid in to_remove:
+        publish_meet_change(meet_id, "entry_removed", {
+            "meet_event_id": me_id, "athlete_id": aid, "gender": me_gender[me_id], "page_version": version,
+        })
+
+    entries = entries_for_meet_events(changed_me_ids)
+    return {
+        "results": results,
+        "page_version": version,
+        "meet_events": [{"meet_event_id": me_id, "entries": entries.get(me_id, [])} for me_id in changed_me_ids],
+    }
+
+
+def parse_seeding_options(data):
+    """(lanes, flight_size, method) from a seeding request body; raises ValueError."""
+    try:
+        lanes = int(data.get("lanes") or 8)
+        flight_size = int(data.get("flight_size") or 12)
+    except (TypeError, ValueError):
+        raise ValueError("lanes/flight_size must be integers")
+    if not 1 <= lanes <= 12 or not 1 <= flight_size <= 50:
+        raise ValueError("lanes must be 1-12 and flight_size 1-50")
+    method = str(data.get("method") or "fastest_last").strip().lower()
+    if method not in SEEDING_METHODS:
+        raise ValueError(f"method must be one of {', '.join(SEEDING_METHODS)}")
+    return lanes, flight_size, method
+
+
+def seed_meet_events(meet_event_ids, lanes=8, flight_size=12, method="fastest_last"):
+    """Assign heat/lane to every entry of the given meet events.
+
+    One read for all entries, seeding in memory, one executemany UPDATE for the
+    lot. Scratched entries are cleared. Returns {meet_event_id: seeded count}.
+    """
+    rows = (db.session.query(
+            MeetEntry.meet_entry_id, MeetEntry.meet_event_id, MeetEntry.entry_status,
+            MeetEntry.seed_time_ms, MeetEntry.seed_mark_mm, Event.event_type)
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEntry.meet_event_id.in_(list(meet_event_ids)))
+        .all())
+
+    by_event, field_events, params, seeded = {}, set(), [], {}
+    for entry_id, me_id, status, time_ms, mark_mm, event_type in rows:
+        if status != "entered":
+            params.append({"meet_entry_id": entry_id, "heat": None, "lane": None})
+            seeded.setdefault(me_id, 0)
+            continue
+        field = event_type == "field"
+        if field:
+            field_events.add(me_id)
+        by_event.setdefault(me_id, []).append((entry_id, mark_mm if field else time_ms))
+
+    for me_id, entries in by_event.items():
+        field = me_id in field_events
+        assigned = seed_event(entries, flight_size if field else lanes, method, field=field)
+        params.extend({"meet_entry_id": eid, "heat": heat, "lane": lane} for eid, heat, lane in assigned)
+        seeded[me_id] = len(assigned)
+
+    if params:
+        db.session.execute(update(MeetEntry), params)
+    return seeded
+
+
+@app.post("/api/meet-events/<int:meet_event_id>/seed")
+def seed_meet_event(meet_event_id):
+    # Body: {"lanes": 8, "flight_size": 12, "method": "fastest_last"|"serpentine"}
+    me = (db.session.query(MeetEvent)
+        .join(Meet, MeetEvent.meet_id == Meet.meet_id)
+        .filter(MeetEvent.meet_event_id == meet_event_id, Meet.org_id == CURRENT_ORG_ID)
+        .first_or_404())
+    try:
+        lanes, flight_size, method = parse_seeding_options(request.get_json(silent=True) or {})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    seeded = seed_meet_events([meet_event_id], lanes, flight_size, method)
+    meet_id = me.meet_id
+    version = touch_meet_page(meet_id, [meet_event_id])
+    db.session.commit()
+    publish_meet_change(meet_id, "entries_seeded", {
+        "meet_event_ids": [meet_event_id], "gender": me.gender, "page_version": version,
+    })
+    return jsonify({
+        "meet_event_id": meet_event_id,
+        "seeded": seeded.get(meet_event_id, 0),
+        "page_version": version,
+        "entries": entries_for_meet_events([meet_event_id]).get(meet_event_id, []),
+    })
+
+
+@app.post("/api/meets/<int:meet_id>/seed")
+def seed_meet(meet_id):
+    # Seeds every meet event in the meet (or one gender's): same body as the single-event
+    # endpoint plus an optional "gender".
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True) or {}
+    try:
+        lanes, flight_size, method = parse_seeding_options(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    q = db.session.query(MeetEvent.meet_event_id).filter(MeetEvent.meet_id == meet_id)
+    gender = (data.get("gender") or "").strip().upper()
+    if gender:
+        if gender not in {"M", "F"}:
+            return jsonify({"error": "gender must be M or F"}), 400
+        q = q.filter(MeetEvent.gender == gender)
+    me_ids = [me_id for (me_id,) in q]
+
+    seeded = seed_meet_events(me_ids, lanes, flight_size, method)
+    version = touch_meet_page(meet_id, list(seeded)) if seeded else meet.page_version
+    db.session.commit()
+    if seeded:
+        publish_meet_change(meet_id, "entries_seeded", {
+            "meet_event_ids": sorted(seeded), "gender": gender or None, "page_version": version,
+        })
+    return jsonify({
+        "meet_id": meet_id,
+        "page_version": version,
+        "meet_events": [{"meet_event_id": me_id, "seeded": n} for me_id, n in sorted(seeded.items())],
+    })
+
+
+def parse_scoring(value):
+    """Points per place from a table name ("dual") or an explicit list; raises ValueError."""
+    if value is None:
+        return SCORING_TABLES["dual"]
+    if isinstance(value, str):
+        if value.strip().lower() not in SCORING_TABLES:
+            raise ValueError(f"scoring must be one of {', '.join(SCORING_TABLES)} or a list of points")
+        return SCORING_TABLES[value.strip().lower()]
+    try:
+        points = [float(p) for p in value]
+    except (TypeError, ValueError):
+        raise ValueError("scoring must be a table name or a list of points")
+    if not points or any(p < 0 for p in points):
+        raise ValueError("scoring points must be non-negative")
+    return points
+
+
+def athlete_event_marks(meet, athlete_ids, event_ids):
+    """{(athlete_id, event_id): mark_value}: season best, else PR, else seed in this meet."""
+    marks, seeds = {}, {}
+    if not athlete_ids or not event_ids:
+        return marks
+    key = season_key(meet.season_id)
+    for aid, eid, sid, value in (db.session.query(
+            AthleteBest.athlete_id, AthleteBest.event_id, AthleteBest.season_id, AthleteBest.best_value)
+            .filter(AthleteBest.athlete_id.in_(list(athlete_ids)), AthleteBest.event_id.in_(list(event_ids)),
+                    AthleteBest.season_id.in_([key, ALL_TIME]))):
+        if sid == key or (aid, eid) not in marks:
+            marks[(aid, eid)] = value
+    for aid, eid, event_type, time_ms, mark_mm in (db.session.query(
+            MeetEntry.athlete_id, MeetEvent.event_id, Event.event_type, MeetEntry.seed_time_ms, MeetEntry.seed_mark_mm)
+            .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+            .join(Event, MeetEvent.event_id == Event.event_id)
+            .filter(MeetEvent.meet_id == meet.meet_id, MeetEntry.athlete_id.in_(list(athlete_ids)))):
+        value = mark_mm if higher_is_better(event_type) else time_ms
+        if value is not None:
+            seeds[(aid, eid)] = value
+    return {**seeds, **marks}
+
+
+@app.post("/api/meets/<int:meet_id>/lineup")
+def optimize_meet_lineup(meet_id):
+    # Proposes the entry set for one gender that maximizes projected points.
+    # Body: {"gender": "M", "scoring": "dual"|"tri"|"invitational"|[points...],
+    #        "max_entries": 3 (events without their own max_entries), "max_events_per_athlete": 4,
+    #        "opponents": {"<event_id>": ["11.20", ...]}, "fill": false, "apply": false}
+    # Relays are left alone (their entries still count toward the athlete's event limit).
+    # With apply, the proposal replaces the gender's individual entries through the bulk path.
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True) or {}
+    gender = (data.get("gender") or "").strip().upper()
+    if gender not in {"M", "F"}:
+        return jsonify({"error": "gender must be M or F"}), 400
+    try:
+        points = parse_scoring(data.get("scoring"))
+        fill = parse_bool(data.get("fill"), False)
+        apply = parse_bool(data.get("apply"), False)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    try:
+        default_max = int(data.get("max_entries") or 3)
+        max_events = int(data.get("max_events_per_athlete") or 4)
+    except (TypeError, ValueError):
+        return jsonify({"error": "max_entries and max_events_per_athlete must be integers"}), 400
+    if default_max < 1 or max_events < 1:
+        return jsonify({"error": "max_entries and max_events_per_athlete must be at least 1"}), 400
+    opponents_in = data.get("opponents") or {}
+    if not isinstance(opponents_in, dict):
+        return jsonify({"error": "opponents must map event_id to a list of marks"}), 400
+
+    meet_events = (db.session.query(MeetEvent.meet_event_id, MeetEvent.event_id, MeetEvent.max_entries, Event.event_type)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEvent.meet_id == meet_id, MeetEvent.gender == gender)
+        .all())
+    individual = {me_id: (eid, cap, et) for me_id, eid, cap, et in meet_events if et != "relay"}
+    relay_me_ids = [me_id for me_id, _, _, et in meet_events if et == "relay"]
+
+    athlete_ids = [aid for (aid,) in db.session.query(Athlete.athlete_id).filter(
+        Athlete.org_id == CURRENT_ORG_ID, Athlete.gender == gender,
+        Athlete.is_active == True, Athlete.unavailable == False,
+    )]
+    relay_counts = dict(db.session.query(MeetEntry.athlete_id, func.count(MeetEntry.meet_entry_id))
+        .filter(MeetEntry.meet_event_id.in_(relay_me_ids), MeetEntry.entry_status == "entered")
+        .group_by(MeetEntry.athlete_id)) if relay_me_ids else {}
+    athlete_caps = {aid: max_events - relay_counts.get(aid, 0) for aid in athlete_ids}
+
+    event_me = {eid: me_id for me_id, (eid, _, _) in individual.items()}
+    all_marks = athlete_event_marks(meet, athlete_ids, list(event_me))
+    marks, higher_by_event, opponents = {}, {}, {}
+    for me_id, (eid, _, event_type) in individual.items():
+        higher_by_event[me_id] = higher_is_better(event_type)
+        opp = opponents_in.get(str(eid), opponents_in.get(eid, []))
+        opponents[me_id] = [v for v in (result_mark_value(str(m), event_type) for m in opp or []) if v is not None]
+    for (aid, eid), value in all_marks.items():
+        if eid in event_me:
+            marks.setdefault(event_me[eid], {})[aid] = value
+
+    caps = {me_id: (cap if cap is not None else default_max) for me_id, (_, cap, _) in individual.items()}
+    candidates = build_candidates(marks, opponents, higher_by_event)
+    chosen, optimal = optimize_lineup(candidates, caps, athlete_caps, points, fill=fill)
+
+    by_event = {}
+    for aid, me_id in chosen:
+        by_event.setdefault(me_id, {})[aid] = marks[me_id][aid]
+    proposal, total = [], 0
+    for me_id, chosen_marks in sorted(by_event.items()):
+        pts = projected_points(chosen_marks, opponents[me_id], higher_by_event[me_id], points)
+        for aid, value in chosen_marks.items():
+            total += pts[aid]
+            proposal.append({
+                "meet_event_id": me_id, "event_id": individual[me_id][0], "athlete_id": aid,
+                "mark_value": value, "projected_points": pts[aid],
+            })
+
+    current = set(db.session.query(MeetEntry.meet_event_id, MeetEntry.athlete_id)
+        .filter(MeetEntry.meet_event_id.in_(list(individual))).all()) if individual else set()
+    wanted = {(p["meet_event_id"], p["athlete_id"]) for p in proposal}
+    operations = (
+        [{"meet_event_id": me_id, "athlete_id": aid, "op": "remove"} for me_id, aid in sorted(current - wanted)]
+        + [{"meet_event_id": me_id, "athlete_id": aid, "op": "add"} for me_id, aid in sorted(wanted - current)]
+    )
+
+    body = {
+        "gender": gender,
+        "projected_points": total,
+        "optimal": optimal,
+        "entries": proposal,
+        "operations": operations,
+        "applied": False,
+    }
+    if apply:
+        body.update(apply_entry_operations(meet, operations), applied=True)
+    return jsonify(body)
+
+
+def set_relay_legs(meet, legs_by_meet_event):
+    """Enter the legs ({meet_event_id: [(leg, athlete_id)]}) and mark their order.
+
+    Missing entries are added through the bulk entry path; other entries in those
+    relays stay as alternates (relay_leg cleared). Commits only if every leg could
+    be entered; otherwise nothing changes and the failures are in "results".
+    """
+    me_ids = list(legs_by_meet_event)
+    ops = [
+        {"meet_event_id": me_id, "athlete_id": aid, "op": "add"}
+        for me_id, legs in legs_by_meet_event.items() for _, aid in legs
+    ]
+    t = MeetEntry.__table__
+
+    def write_legs():
+        db.session.execute(t.update().where(t.c.meet_event_id.in_(me_ids)).values(relay_leg=None))
+        params = [
+            {"me": me_id, "aid": aid, "leg": leg}
+            for me_id, legs in legs_by_meet_event.items() for leg, aid in legs
+        ]
+        if params:
+            db.session.connection().execute(
+                t.update()
+                .where(t.c.meet_event_id == bindparam("me"), t.c.athlete_id == bindparam("aid"))
+                .values(relay_leg=bindparam("leg")),
+                params,
+            )
+        return me_ids
+
+    return apply_entry_operations(meet, ops, before_commit=write_legs, atomic=True)
+
+
+@app.put("/api/meet-events/<int:meet_event_id>/legs")
+def put_relay_legs(meet_event_id):
+    # Body: {"legs": [athlete_id for leg 1, leg 2, leg 3, leg 4]} (null for an open leg)
+    me, meet, event_type = (db.session.query(MeetEvent, Meet, Event.event_type)
+        .join(Meet, MeetEvent.meet_id == Meet.meet_id)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEvent.meet_event_id == meet_event_id, Meet.org_id == CURRENT_ORG_ID)
+        .first_or_404())
+    if event_type != "relay":
+        return jsonify({"error": "not a relay event"}), 400
+    data = request.get_json(silent=True) or {}
+    legs = data.get("legs")
+    if not isinstance(legs, list) or len(legs) > RELAY_LEGS:
+        return jsonify({"error": f"legs must be a list of up to {RELAY_LEGS} athlete ids"}), 400
+    try:
+        legs = [(i, int(aid)) for i, aid in enumerate(legs, start=1) if aid not in (None, "")]
+    except (TypeError, ValueError):
+        return jsonify({"error": "legs must be athlete ids"}), 400
+    if len({aid for _, aid in legs}) != len(legs):
+        return jsonify({"error": "an athlete can only run one leg"}), 400
+
+    body = set_relay_legs(meet, {meet_event_id: legs})
+    failed = [r for r in body["results"] if not r["ok"]]
+    if failed:
+        return jsonify({**body, "error": failed[0]["error"]}), 400
+    return jsonify(body)
+
+
+@app.post("/api/meets/<int:meet_id>/relays/optimize")
+def optimize_meet_relays(meet_id):
+    # Picks legs for every relay of one gender at once.
+    # Body: {"gender": "M", "max_events_per_athlete": 4,
+    #        "splits": {"<athlete_id>": {"<relay meet_event_id>": "10.9"}}, "apply": false}
+    # Legs come from splits, else the open mark at the relay distance (season best, PR,
+    # seed). Individual entries already made count against each athlete's limit.
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True) or {}
+    gender = (data.get("gender") or "").strip().upper()
+    if gender not in {"M", "F"}:
+        return jsonify({"error": "gender must be M or F"}), 400
+    try:
+        max_events = int(data.get("max_events_per_athlete") or 4)
+    except (TypeError, ValueError):
+        return jsonify({"error": "max_events_per_athlete must be an integer"}), 400
+    if max_events < 1:
+        return jsonify({"error": "max_events_per_athlete must be at least 1"}), 400
+    try:
+        apply = parse_bool(data.get("apply"), False)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    splits = data.get("splits") or {}
+    if not isinstance(splits, dict) or not all(isinstance(v, dict) for v in splits.values()):
+        return jsonify({"error": "splits must map athlete_id to {meet_event_id: split}"}), 400
+
+    meet_events = (db.session.query(MeetEvent.meet_event_id, Event.name, Event.event_type)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEvent.meet_id == meet_id, MeetEvent.gender == gender)
+        .all())
+    relays = {me_id: name for me_id, name, et in meet_events if et == "relay"}
+    individual_ids = [me_id for me_id, _, et in meet_events if et != "relay"]
+    if not relays:
+        return jsonify({"gender": gender, "relays": [], "optimal": True, "applied": False})
+
+    athlete_ids = [aid for (aid,) in db.session.query(Athlete.athlete_id).filter(
+        Athlete.org_id == CURRENT_ORG_ID, Athlete.gender == gender,
+        Athlete.is_active == True, Athlete.unavailable == False,
+    )]
+    individual_counts = dict(db.session.query(MeetEntry.athlete_id, func.count(MeetEntry.meet_entry_id))
+        .filter(MeetEntry.meet_event_id.in_(individual_ids), MeetEntry.entry_status == "entered")
+        .group_by(MeetEntry.athlete_id)) if individual_ids else {}
+    athlete_caps = {aid: max_events - individual_counts.get(aid, 0) for aid in athlete_ids}
+
+    # relay -> open event id (4x400 -> 400m) among the active events
+    open_events = {}
+    events_by_key = {event_name_key(e["name"]): eid for eid, e in ref_cache.get("events").items()
+                     if e["event_type"] == "track" and e["is_active"]}
+    for me_id, name in relays.items():
+        distance = open_distance(name)
+        if distance and distance in events_by_key:
+            open_events[me_id] = events_by_key[distance]
+    open_marks = athlete_event_marks(meet, athlete_ids, list(set(open_events.values())))
+
+    marks = {me_id: {} for me_id in relays}
+    for me_id, eid in open_events.items():
+        for aid in athlete_ids:
+            if (aid, eid) in open_marks:
+                marks[me_id][aid] = open_marks[(aid, eid)]
+    eligible = set(athlete_ids)
+    for aid, by_relay in splits.items():
+        for me_id, split in by_relay.items():
+            try:
+                aid_i, me_i = int(aid), int(me_id)
+            except (TypeError, ValueError):
+                return jsonify({"error": "splits must map athlete_id to {meet_event_id: split}"}), 400
+            value = parse_time(split)
+            if me_i in marks and aid_i in eligible and value is not None:
+                marks[me_i][aid_i] = value
+
+    legs, optimal = optimize_relays(marks, athlete_caps)
+    out = []
+    for me_id in sorted(relays):
+        picked = legs.get(me_id, [])
+        out.append({
+            "meet_event_id": me_id,
+            "event_name": relays[me_id],
+            "legs": [{"leg": leg, "athlete_id": aid, "mark_value": mark} for leg, aid, mark in picked],
+            "projected_ms": sum(mark for _, _, mark in picked) if len(picked) == RELAY_LEGS else None,
+            "complete": len(picked) == RELAY_LEGS,
+        })
+
+    body = {"gender": gender, "relays": out, "optimal": optimal, "applied": False}
+    if apply:
+        applied = set_relay_legs(meet, {
+            r["meet_event_id"]: [(leg["leg"], leg["athlete_id"]) for leg in r["legs"]] for r in out
+        })
+        failed = [r for r in applied["results"] if not r["ok"]]
+        if failed:
+            return jsonify({**body, **applied, "error": failed[0]["error"]}), 400
+        body.update(applied, applied=True)
+    return jsonify(body)
+
+
+@app.post("/api/meets/<int:meet_id>/timeline")
+def build_meet_timeline(meet_id):
+    # Body: {"start_time": "15:30", "lanes": 8, "dry_run": false}
+    # Estimates every meet event's duration from its entries (and seeded heats), lays
+    # track events end to end in meet order (girls before boys) and field events in
+    # parallel by venue, then stores the times and rebuilds the meet's conflict index.
+    Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True) or {}
+    try:
+        start = parse_clock(data.get("start_time") or "15:00")
+        lanes = int(data.get("lanes") or 8)
+        dry_run = parse_bool(data.get("dry_run"), False)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+    if not 1 <= lanes <= 12:
+        return jsonify({"error": "lanes must be 1-12"}), 400
+
+    counts = {
+        me_id: (n, heats)
+        for me_id, n, heats in db.session.query(
+            MeetEntry.meet_event_id, func.count(MeetEntry.meet_entry_id), func.max(MeetEntry.heat))
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .filter(MeetEvent.meet_id == meet_id, MeetEntry.entry_status == "entered")
+        .group_by(MeetEntry.meet_event_id)
+    }
+    rows = (db.session.query(MeetEvent.meet_event_id, MeetEvent.gender, Event.name, Event.event_type)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEvent.meet_id == meet_id)
+        .order_by(MeetEvent.sort_order, Event.sort_order, MeetEvent.gender, MeetEvent.meet_event_id)
+        .all())
+    schedule = build_timeline(
+        [(me_id, name, event_type, *counts.get(me_id, (0, None))) for me_id, _, name, event_type in rows],
+        start, lanes,
+    )
+
+    if not dry_run and schedule:
+        db.session.execute(update(MeetEvent), [
+            {"meet_event_id": me_id, "start_minute": begin, "duration_minutes": minutes}
+            for me_id, (begin, minutes) in schedule.items()
+        ])
+        refresh_conflicts(meet_id)
+        version = touch_meet_page(meet_id, list(schedule))
+        db.session.commit()
+        publish_meet_change(meet_id, "schedule_changed", {"page_version": version})
+
+    end = max((begin + minutes for begin, minutes in schedule.values()), default=start)
+    return jsonify({
+        "meet_id": meet_id,
+        "dry_run": dry_run,
+        "start_time": format_clock(start),
+        "end_time": format_clock(end),
+        "meet_events": [
+            {
+                "meet_event_id": me_id,
+                "gender": gender,
+                "event_name": name,
+                "start_time": format_clock(schedule[me_id][0]),
+                "duration_minutes": schedule[me_id][1],
+            }
+            for me_id, gender, name, _ in rows
+        ],
+        "conflicts": 0 if dry_run else AthleteConflict.query.filter_by(meet_id=meet_id).count(),
+    })
+
+
+@app.patch("/api/meet-events/<int:meet_event_id>/schedule")
+def patch_meet_event_schedule(meet_event_id):
+    # Body: {"start_time": "HH:MM" | null, "duration_minutes": int | null}
+    me = (db.session.query(MeetEvent)
+        .join(Meet, MeetEvent.meet_id == Meet.meet_id)
+        .filter(MeetEvent.meet_event_id == meet_event_id, Meet.org_id == CURRENT_ORG_ID)
+        .first_or_404())
+    data = request.get_json(force=True) or {}
+    try:
+        if "start_time" in data:
+            me.start_minute = parse_clock(data["start_time"]) if data["start_time"] not in (None, "") else None
+        if "duration_minutes" in data:
+            minutes = data["duration_minutes"]
+            me.duration_minutes = int(minutes) if minutes not in (None, "") else None
+            if me.duration_minutes is not None and me.duration_minutes < 0:
+                raise ValueError("duration_minutes must be >= 0")
+    except (TypeError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+
+    meet_id = me.meet_id
+    db.session.flush()
+    athlete_ids = [aid for (aid,) in db.session.query(MeetEntry.athlete_id).filter(MeetEntry.meet_event_id == meet_event_id)]
+    refresh_conflicts(meet_id, athlete_ids)
+    version = touch_meet_page(meet_id, [meet_event_id])
+    db.session.commit()
+    publish_meet_change(meet_id, "schedule_changed", {"gender": me.gender, "page_version": version})
+    return jsonify(me.to_dict())
+
+
+# built projections, same freshness token as the meet page (entries, bests, roster)
+projection_cache = MeetPageCache(64)
+
+
+def build_meet_projection(meet, gender, points, relay_points, teams):
+    """(MeetProjection, {(athlete_id, meet_event_id): mark}) for the meet's entered athletes.
+
+    teams: {team name: {event_id: [mark strings]}}. The mark map covers every eligible
+    athlete, so what-if adds of athletes not yet entered can be projected too.
+    """
+    q = (db.session.query(MeetEvent.meet_event_id, MeetEvent.event_id, MeetEvent.gender,
+                          MeetEvent.is_scored, Event.event_type)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEvent.meet_id == meet.meet_id))
+    if gender:
+        q = q.filter(MeetEvent.gender == gender)
+    meet_events = q.all()
+
+    aq = db.session.query(Athlete.athlete_id).filter(Athlete.org_id == CURRENT_ORG_ID, Athlete.is_active == True)
+    if gender:
+        aq = aq.filter(Athlete.gender == gender)
+    by_event_id = athlete_event_marks(meet, [aid for (aid,) in aq], list({me[1] for me in meet_events}))
+
+    org = ref_cache.get("organizations").get(CURRENT_ORG_ID) or {}
+    projection = MeetProjection(org.get("name") or CURRENT_ORG_NAME)
+    marks = {}
+    events = {}
+    for me_id, event_id, me_gender, is_scored, event_type in meet_events:
+        higher = higher_is_better(event_type)
+        relay = event_type == "relay"
+        ev = EventProjection(me_id, higher, relay_points if relay else points, is_scored, relay)
+        for team, team_marks in teams.items():
+            for m in team_marks.get(str(event_id), team_marks.get(event_id)) or []:
+                value = result_mark_value(str(m), event_type)
+                if value is not None:
+                    ev.opponents.append((value, team))
+        for (aid, eid), value in by_event_id.items():
+            if eid == event_id:
+                marks[(aid, me_id)] = value
+        events[me_id] = ev
+
+    for me_id, aid in (db.session.query(MeetEntry.meet_event_id, MeetEntry.athlete_id)
+            .filter(MeetEntry.meet_event_id.in_(list(events)), MeetEntry.entry_status == "entered")):
+        events[me_id].ours[aid] = marks.get((aid, me_id))
+    for ev in events.values():
+        projection.add_event(ev)
+    return projection, marks
+
+
+@app.post("/api/meets/<int:meet_id>/projection")
+def project_meet_score(meet_id):
+    # Body: {"gender": "M"|"F" (both when omitted), "scoring": "dual"|[points...], "relay_scoring": ...,
+    #        "teams": {"Central": {"<event_id>": ["11.20", ...]}, ...},
+    #        "what_if": [{"op": "add"|"remove", "meet_event_id", "athlete_id"}, ...]}
+    # Without what_if: per-event places and team totals. With it: the totals after the
+    # changes and only the events they touch, re-scored against the cached projection.
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True) or {}
+    gender = (data.get("gender") or "").strip().upper() or None
+    if gender not in {None, "M", "F"}:
+        return jsonify({"error": "gender must be M or F"}), 400
+    try:
+        points = parse_scoring(data.get("scoring"))
+        relay_points = parse_scoring(data.get("relay_scoring")) if data.get("relay_scoring") is not None else points
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    teams = data.get("teams") or {}
+    if not isinstance(teams, dict) or not all(isinstance(v, dict) for v in teams.values()):
+        return jsonify({"error": "teams must map team name to {event_id: [marks]}"}), 400
+
+    changes = []
+    for op in data.get("what_if") or []:
+        try:
+            kind = str(op.get("op") or "add").lower()
+            changes.append((kind, int(op["meet_event_id"]), int(op["athlete_id"])))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return jsonify({"error": "what_if items need integer meet_event_id and athlete_id"}), 400
+        if kind not in {"add", "remove"}:
+            return jsonify({"error": "what_if op must be 'add' or 'remove'"}), 400
+
+    config = json.dumps([gender, points, relay_points, teams], sort_keys=True, default=str)
+    key = (meet_id, hashlib.sha1(config.encode()).hexdigest())
+    token = meet_events_token(meet)  # projections don't use the roster panel
+    cached = projection_cache.get(key, token)
+    if cached is None:
+        cached = build_meet_projection(meet, gender, points, relay_points, teams)
+        projection_cache.put(key, token, cached)
+    projection, marks = cached
+
+    if not changes:
+        return jsonify({
+            "team": projection.team,
+            "totals": dict(projection.totals),
+            "events": [ev.to_dict() for _, ev in sorted(projection.events.items())],
+        })
+
+    totals, changed = projection.what_if(changes, lambda aid, me_id: marks.get((aid, me_id)))
+    return jsonify({
+        "team": projection.team,
+        "base_totals": dict(projection.totals),
+        "totals": totals,
+        "events": [ev.to_dict() for _, ev in sorted(changed.items())],
+    })
+
+
+@app.get("/api/meets/<int:meet_id>/results")
+def list_meet_results(meet_id):
+    Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    rows = Result.query.filter_by(meet_id=meet_id).order_by(Result.event_id, Result.place, Result.result_id).all()
+    return jsonify([r.to_dict() for r in rows])
+
+
+@app.post("/api/meets/<int:meet_id>/results")
+def add_meet_results(meet_id):
+    # Body: [{"meet_event_id", "athlete_id", "mark", "place"}, ...] (or {"results": [...]}).
+    # Every result must match an entry in this meet; any invalid row rejects the batch.
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("results")
+    if not isinstance(data, list) or not data:
+        return jsonify({"error": "body must be a non-empty list of results"}), 400
+
+    parsed, errors = [], []
+    for i, item in enumerate(data):
+        try:
+            pair = (int(item["meet_event_id"]), int(item["athlete_id"]))
+            place = int(item["place"]) if item.get("place") not in (None, "") else None
+        except (KeyError, TypeError, ValueError, AttributeError):
+            errors.append({"index": i, "error": "meet_event_id/athlete_id (and place) must be integers"})
+            continue
+        mark = str(item.get("mark") or "").strip()
+        if not mark or len(mark) > 20:
+            errors.append({"index": i, "error": "mark is required (max 20 chars)"})
+            continue
+        parsed.append((i, pair, mark, place))
+
+    pairs = {pair for _, pair, _, _ in parsed}
+    entries = {
+        (me_id, aid): (entry_id, event_id, event_type)
+        for entry_id, me_id, aid, event_id, event_type in db.session.query(
+            MeetEntry.meet_entry_id, MeetEntry.meet_event_id, MeetEntry.athlete_id, MeetEvent.event_id, Event.event_type)
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .join(Event, MeetEvent.event_id == Event.event_id)
+        .filter(MeetEvent.meet_id == meet_id, tuple_(MeetEntry.meet_event_id, MeetEntry.athlete_id).in_(list(pairs)))
+    } if pairs else {}
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows, event_types = [], []
+    for i, pair, mark, place in parsed:
+        if pair not in entries:
+            errors.append({"index": i, "error": "athlete is not entered in that meet event"})
+            continue
+        entry_id, event_id, event_type = entries[pair]
+        value = result_mark_value(mark, event_type)
+        rows.append({
+            "meet_entry_id": entry_id, "athlete_id": pair[1], "event_id": event_id, "meet_id": meet_id,
+            "mark": mark, "mark_value": value, "place": place, "created_at": now,
+        })
+        event_types.append(event_type)
+    if errors:
+        return jsonify({"error": "results have invalid rows", "errors": sorted(errors, key=lambda e: e["index"])}), 400
+
+    inserted = insert_results(rows, event_types, meet.season_id)
+    changed_me_ids = sorted({pair[0] for _, pair, _, _ in parsed})
+    version = touch_meet_page(meet_id, changed_me_ids)
+    db.session.commit()
+    publish_meet_change(meet_id, "results_added", {"meet_event_ids": changed_me_ids, "page_version": version})
+
+    return jsonify({"results": inserted, "page_version": version}), 201
+
+
+RESULTS_IMPORT_CHUNK = 1000
+GENDER_WORDS = {"m": "M", "boys": "M", "men": "M", "male": "M", "f": "F", "girls": "F", "women": "F", "female": "F"}
+
+
+def result_mark_value(mark, event_type):
+    return parse_distance(mark) if higher_is_better(event_type) else parse_time(mark)
+
+
+def event_name_key(name):
+    # "100 Meter Dash" / "100m" -> "100", "4x400 Meter Relay" -> "4x400", "110 Meter Hurdles" -> "110h"
+    s = name.lower().replace("meters", "m").replace("meter", "m").replace("hurdles", "h")
+    s = re.sub(r"\b(dash|run|relay)\b", "", s)
+    s = re.sub(r"(\d)\s*m\b", r"\1", s)
+    return re.sub(r"[^a-z0-9]", "", s)
+
+
+def split_event_gender(event_name, gender):
+    """("Boys 100 Meter Dash", "") -> ("100 Meter Dash", "M")."""
+    words = event_name.split()
+    if words and words[0].lower() in GENDER_WORDS:
+        return " ".join(words[1:]), gender or GENDER_WORDS[words[0].lower()]
+    return event_name, gender
+
+
+def split_athlete_name(row):
+    """(first, last) from first_name/last_name columns or a "Last, First" / "First Last" name."""
+    if row.get("last_name"):
+        return (row.get("first_name") or "").strip(), row["last_name"].strip()
+    name = (row.get("name") or row.get("athlete") or "").strip()
+    if "," in name:
+        last, first = name.split(",", 1)
+        return first.strip(), last.strip()
+    first, _, last = name.partition(" ")
+    return first.strip(), last.strip()
+
+
+@app.post("/api/meets/<int:meet_id>/results/import")
+def import_meet_results(meet_id):
+    # Meet-manager style CSV (raw body or multipart "file"), one mark per line:
+    #   name ("Last, First") or first_name/last_name, grad_year (optional), event, gender
+    #   (optional when the event says "Boys"/"Girls"), mark (or time/result), place
+    # Rows are matched against in-memory indexes of the roster and this meet's events and
+    # inserted in chunks; unmatched rows come back in the report. ?dry_run=1 only matches.
+    # Importing replaces earlier results of the entries in the file, so re-importing the
+    # same (or a corrected) file doesn't duplicate them.
+    meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+    try:
+        dry_run = parse_bool(request.args.get("dry_run"), default=False)
+    except ValueError:
+        return {"error": "dry_run must be True/False"}, 400
+
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+
+    athletes_by_name = {}  # (last, first) -> [(athlete_id, grad_year, gender)]
+    for aid, first, last, grad_year, gender in db.session.query(
+            Athlete.athlete_id, Athlete.first_name, Athlete.last_name, Athlete.grad_year, Athlete.gender
+    ).filter(Athlete.org_id == CURRENT_ORG_ID):
+        athletes_by_name.setdefault((last.strip().lower(), first.strip().lower()), []).append((aid, grad_year, gender))
+
+    meet_events = {}  # (event key, gender) -> (meet_event_id, event_id, event_type)
+    for me_id, gender, event_id, name, event_type in db.session.query(
+            MeetEvent.meet_event_id, MeetEvent.gender, Event.event_id, Event.name, Event.event_type
+    ).join(Event, MeetEvent.event_id == Event.event_id).filter(MeetEvent.meet_id == meet_id):
+        for part in name.split("/"):  # "110H/100H"
+            meet_events[(event_name_key(part), gender)] = (me_id, event_id, event_type)
+
+    entry_ids = {
+        (me_id, aid): entry_id
+        for entry_id, me_id, aid in db.session.query(MeetEntry.meet_entry_id, MeetEntry.meet_event_id, MeetEntry.athlete_id)
+        .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+        .filter(MeetEvent.meet_id == meet_id)
+    }
+
+    errors = []
+    unmatched_athletes, unmatched_events = {}, {}
+    pending, pending_types = [], []
+    changed_me_ids = set()
+    replaced_entry_ids = set()  # entries whose earlier results were already deleted
+    replaced_pairs = set()      # (athlete_id, event_id) of deleted results, for their bests
+    total = inserted = replaced = 0
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def flush():
+        nonlocal inserted, replaced
+        if pending and not dry_run:
+            new_entry_ids = {r["meet_entry_id"] for r in pending} - replaced_entry_ids
+            if new_entry_ids:
+                gone = db.session.execute(
+                    Result.__table__.delete()
+                    .where(Result.meet_id == meet_id, Result.meet_entry_id.in_(new_entry_ids))
+                    .returning(Result.athlete_id, Result.event_id)
+                ).all()
+                replaced += len(gone)
+                replaced_pairs.update(tuple(r) for r in gone)
+                replaced_entry_ids.update(new_entry_ids)
+            insert_results(pending, pending_types, meet.season_id)
+        inserted += len(pending)
+        pending.clear()
+        pending_types.clear()
+
+    try:
+        for row_num, row in iter_import_rows(stream, "csv"):
+            total += 1
+            mark = row.get("mark") or row.get("time") or row.get("result") or ""
+            if not mark or len(mark) > 20:
+                errors.append({"row": row_num, "error": "mark is required (max 20 chars)"})
+                continue
+
+            event_name, gender = split_event_gender(row.get("event") or "", (row.get("gender") or "").strip().lower())
+            gender = GENDER_WORDS.get(gender, gender.upper())
+            me = meet_events.get((event_name_key(event_name), gender))
+            if me is None:
+                label = f"{gender} {event_name}".strip()
+                unmatched_events[label] = unmatched_events.get(label, 0) + 1
+                errors.append({"row": row_num, "error": f"event '{label}' is not in this meet"})
+                continue
+            me_id, event_id, event_type = me
+
+            first, last = split_athlete_name(row)
+            candidates = [c for c in athletes_by_name.get((last.lower(), first.lower()), ()) if c[2] == gender]
+            grad_year = row.get("grad_year") or row.get("year")
+            if grad_year and len(candidates) > 1:
+                candidates = [c for c in candidates if str(c[1]) == str(grad_year)]
+            if len(candidates) != 1:
+                label = f"{last}, {first}" + (f" ({grad_year})" if grad_year else "")
+                unmatched_athletes[label] = unmatched_athletes.get(label, 0) + 1
+                problem = "matches several athletes" if candidates else "not on the roster"
+                errors.append({"row": row_num, "error": f"athlete '{label}' {problem}"})
+                continue
+            aid = candidates[0][0]
+            entry_id = entry_ids.get((me_id, aid))
+            if entry_id is None:
+                errors.append({"row": row_num, "error": "athlete is not entered in that meet event"})
+                continue
+
+            place = row.get("place") or ""
+            pending.append({
+                "meet_entry_id": entry_id, "athlete_id": aid, "event_id": event_id,
+                "meet_id": meet_id, "mark": mark, "mark_value": result_mark_value(mark, event_type),
+                "place": int(place) if place.isdigit() else None, "created_at": now,
+            })
+            pending_types.append(event_type)
+            changed_me_ids.add(me_id)
+            if len(pending) >= RESULTS_IMPORT_CHUNK:
+                flush()
+        flush()
+    except (UnicodeDecodeError, csv.Error) as e:
+        db.session.rollback()
+        return {"error": f"could not parse file: {e}"}, 400
+    recompute_bests(replaced_pairs)  # a replaced result may have been someone's best
+
+    version = meet.page_version
+    if dry_run:
+        db.session.rollback()
+    elif inserted:
+        version = touch_meet_page(meet_id, sorted(changed_me_ids))
+        db.session.commit()
+        publish_meet_change(meet_id, "results_added", {"meet_event_ids": sorted(changed_me_ids), "page_version": version})
+
+    return jsonify({
+        "dry_run": dry_run,
+        "rows": total,
+        "inserted": 0 if dry_run else inserted,
+        "replaced": replaced,
+        "matched": inserted,
+        "page_version": version,
+        "unmatched_athletes": unmatched_athletes,
+        "unmatched_events": unmatched_events,
+        "errors": errors,
+    }), 200
+
+
+@app.get("/api/bests")
+def list_bests():
+    # ?meet_id=  -> season bests and PRs for every (athlete, event) entered in the meet
+    # otherwise  -> the org's roster, optionally ?season_id= (plus PRs), ?athlete_ids=1,2, ?event_id=
+    q = (db.session.query(AthleteBest)
+        .join(Athlete, AthleteBest.athlete_id == Athlete.athlete_id)
+        .filter(Athlete.org_id == CURRENT_ORG_ID))
+
+    meet_id = request.args.get("meet_id", type=int)
+    if meet_id is not None:
+        meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
+        entered = (db.session.query(MeetEntry.athlete_id, MeetEvent.event_id)
+            .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+            .filter(MeetEvent.meet_id == meet_id)
+            .distinct()
+            .subquery())
+        q = (q.join(entered, and_(
+                entered.c.athlete_id == AthleteBest.athlete_id, entered.c.event_id == AthleteBest.event_id))
+            .filter(AthleteBest.season_id.in_([season_key(meet.season_id), ALL_TIME])))
+    else:
+        q = q.filter(Athlete.is_active == True)
+        if request.args.get("season_id"):
+            season_id = request.args.get("season_id", type=int)
+            if season_id is None:
+                return {"error": "season_id must be an integer"}, 400
+            q = q.filter(AthleteBest.season_id.in_([season_id, ALL_TIME]))
+        if request.args.get("athlete_ids"):
+            try:
+                athlete_ids = [int(x) for x in request.args["athlete_ids"].split(",") if x.strip()]
+            except ValueError:
+                return {"error": "athlete_ids must be comma-separated integers"}, 400
+            q = q.filter(AthleteBest.athlete_id.in_(athlete_ids))
+        event_id = request.args.get("event_id", type=int)
+        if event_id is not None:
+            q = q.filter(AthleteBest.event_id == event_id)
+
+    return jsonify([
+        {
+            "athlete_id": b.athlete_id,
+            "event_id": b.event_id,
+            "season_id": b.season_id,
+            "is_pr": b.season_id == ALL_TIME,
+            "best_mark": b.best_mark,
+            "best_value": b.best_value,
+            "result_id": b.result_id,
+        }
+        for b in q.order_by(AthleteBest.athlete_id, AthleteBest.event_id, AthleteBest.season_id)
+    ])
+
+
+@app.get("/api/meets/<int:meet_id>/stream")
+def meet_stream(meet_id):
+    # SSE feed of entry_added / entry_removed / meet_event_added for one meet
+    if db.session.query(Meet.meet_id).filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first() is None:
+        return jsonify({"error": "meet not found"}), 404
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    meet_stream_backend.start()
+    db.session.remove()  # don't hold a pooled connection for the life of the stream
+    return Response(
+        sse_stream(meet_broker, meet_id, last_event_id),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.delete("/api/meet-events/<int:meet_event_id>/entries/<int:athlete_id>")
 def remove_entry(meet_event_id, athlete_id):
-    ent = (db.session.query(MeetEntry)
+    lock_athletes([athlete_id])  # before reading the entry, so a concurrent remove is seen
+    row = (db.session.query(MeetEntry, Meet, MeetEvent.gender)
            .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
            .join(Meet, MeetEvent.meet_id == Meet.meet_id)
            .filter(
@@ -705,16 +3306,36 @@ def remove_entry(meet_event_id, athlete_id):
                Meet.org_id == CURRENT_ORG_ID,
            )
            .first())
-    if not ent:
+    if not row:
         return jsonify({"ok": True})  # idempotent
+    ent, meet, gender = row
+    was_entered = ent.entry_status == "entered"
     db.session.delete(ent)
+    db.session.flush()
+    # last entry in this meet gone -> one fewer varsity meet for the season
+    if was_entered and meet_counts_as_varsity(meet) and entered_meet_count(athlete_id, meet.meet_id) == 0:
+        adjust_varsity_counts([athlete_id], meet.season_id, -1)
+    (db.session.query(AthleteConflict)
+        .filter(AthleteConflict.athlete_id == athlete_id, or_(
+            AthleteConflict.meet_event_id_a == meet_event_id, AthleteConflict.meet_event_id_b == meet_event_id,
+        ))
+        .delete(synchronize_session=False))
+    version = touch_meet_page(meet.meet_id, [meet_event_id])
+    meet_id = meet.meet_id
     db.session.commit()
+    publish_meet_change(meet_id, "entry_removed", {
+        "meet_event_id": meet_event_id,
+        "athlete_id": athlete_id,
+        "gender": gender,
+        "page_version": version,
+    })
     return jsonify({"ok": True})
 
 @app.patch("/api/meets/<int:meet_id>")
 def patch_meet(meet_id):
     meet = Meet.query.filter_by(meet_id=meet_id, org_id=CURRENT_ORG_ID).first_or_404()
     data = request.get_json(force=True) or {}
+    was_counted, old_season_id = meet_counts_as_varsity(meet), meet.season_id
 
     if "is_archived" in data:
         meet.is_archived = parse_bool(data.get("is_archived"), meet.is_archived)
@@ -745,53 +3366,93 @@ def patch_meet(meet_id):
                 v = int(v)
             except (TypeError, ValueError):
                 return {"error": "season_id must be an integer or null"}, 400
-            if db.session.get(Season, v) is None:
+            if v not in ref_cache.get("seasons"):
                 return {"error": "season_id is not valid"}, 400
             meet.season_id = v
     if "notes" in data:
         meet.notes = (str(data["notes"]).strip() or None) if data["notes"] is not None else None
+
+    now_counted = meet_counts_as_varsity(meet)
+    if (was_counted, old_season_id) != (now_counted, meet.season_id) and (was_counted or now_counted):
+        athlete_ids = [aid for (aid,) in db.session.query(MeetEntry.athlete_id)
+            .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+            .filter(MeetEvent.meet_id == meet.meet_id, MeetEntry.entry_status == "entered")
+            .distinct()]
+        if was_counted:
+            adjust_varsity_counts(athlete_ids, old_season_id, -1)
+        if now_counted:
+            adjust_varsity_counts(athlete_ids, meet.season_id, +1)
+    meet.page_version = Meet.page_version + 1
     db.session.commit()
     return jsonify(meet.to_dict())
 
-@app.get("/api/debug/groups-and-events")
-def debug_groups_and_events():
-    rows = (db.session.query(EventGroup, Event)
-        .join(Event, Event.event_group_id == EventGroup.event_group_id)
-        .order_by(EventGroup.sort_order.asc(), Event.sort_order.asc(), Event.name.asc())
-        .all()
-    )
-    out = []
-    for g, e in rows:
-        out.append({
-            "group": g.name,
-            "group_sort": g.sort_order,
-            "event": e.name,
-            "event_sort": e.sort_order,
-        })
-    return jsonify(out)
+@app.get("/api/debug/profiles")
+def debug_profiles():
+    if not is_admin():
+        return jsonify({"error": "admin token required"}), 403
+    limit = min(int(request.args.get("limit", 50)), 500)
+    try:
+        names = os.listdir(PROFILE_DIR)
+    except FileNotFoundError:
+        names = []
+    profiles = {}
+    for name in names:
+        profile_id, _, kind = name.partition(".")
+        if kind in PROFILE_KINDS and PROFILE_ID_RE.match(profile_id):
+            stat = os.stat(os.path.join(PROFILE_DIR, name))
+            p = profiles.setdefault(profile_id, {"profile_id": profile_id, "files": {}})
+            p["files"][kind] = stat.st_size
+            p["written_at"] = datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat()
+    # ids start with the UTC timestamp, so newest first is a reverse sort
+    return jsonify(sorted(profiles.values(), key=lambda p: p["profile_id"], reverse=True)[:limit])
+
+
+@app.get("/api/debug/profiles/<filename>")
+def debug_profile_file(filename):
+    if not is_admin():
+        return jsonify({"error": "admin token required"}), 403
+    profile_id, _, kind = filename.partition(".")
+    if kind not in PROFILE_KINDS or not PROFILE_ID_RE.match(profile_id):
+        return jsonify({"error": "profile not found"}), 404
+    if not os.path.exists(os.path.join(PROFILE_DIR, filename)):
+        return jsonify({"error": "profile not found"}), 404
+    return send_from_directory(PROFILE_DIR, filename, mimetype=PROFILE_KINDS[kind], max_age=0)
+
+@app.get("/api/debug/cache")
+def debug_cache():
+    if not is_admin():
+        return jsonify({"error": "admin token required"}), 403
+    return jsonify({
+        "reference": ref_cache.stats(),
+        "meet_pages": meet_page_cache.stats(),
+        "rosters": roster_cache.stats(),
+        "projections": projection_cache.stats(),
+    })
 
 @app.get("/api/seasons")
+@conditional("seasons")
 def list_seasons():
-    q = Season.query
+    seasons = list(ref_cache.get("seasons").values())
 
     year = request.args.get("year")
     if year not in (None, ""):
         try:
-            q = q.filter(Season.year == int(year))
+            year = int(year)
         except ValueError:
             return {"error": "year must be an integer"}, 400
+        seasons = [s for s in seasons if s["year"] == year]
 
     discipline = (request.args.get("discipline") or "").strip().lower()
     if discipline:
-        q = q.filter(Season.discipline == discipline)
+        seasons = [s for s in seasons if s["discipline"] == discipline]
 
-    search = (request.args.get("q") or "").strip()
+    search = (request.args.get("q") or "").strip().lower()
     if search:
-        # SQLite: ilike is okay; this keeps it simple
-        q = q.filter(Season.name.ilike(f"%{search}%"))
+        seasons = [s for s in seasons if search in s["name"].lower()]
 
-    seasons = q.order_by(Season.year.desc(), Season.name.asc()).all()
-    return jsonify([s.to_dict() for s in seasons]), 200
+    seasons.sort(key=lambda s: s["name"])
+    seasons.sort(key=lambda s: s["year"], reverse=True)
+    return jsonify(seasons), 200
 
 @app.post("/api/seasons")
 def create_season():
@@ -813,15 +3474,78 @@ def create_season():
         return {"error": "year must be an integer"}, 400
 
     # Optional: prevent exact duplicates
-    existing = Season.query.filter_by(name=name, year=year, discipline=discipline).first()
-    if existing:
-        return jsonify(existing.to_dict()), 200
+    for existing in ref_cache.get("seasons").values():
+        if (existing["name"], existing["year"], existing["discipline"]) == (name, year, discipline):
+            return jsonify(existing), 200
 
     s = Season(name=name, year=year, discipline=discipline)
     db.session.add(s)
     db.session.commit()
     return jsonify(s.to_dict()), 201
 
+@app.post("/api/seasons/<int:season_id>/schedule")
+def import_season_schedule(season_id: int):
+    # Body: [{"name", "meet_date", "location", "venue_type", "is_varsity", "notes"}, ...]
+    # (or {"meets": [...]}). All meets and their meet events go in one transaction;
+    # any invalid row rejects the whole schedule.
+    season = ref_cache.get("seasons").get(season_id)
+    if season is None:
+        return {"error": "Not found"}, 404
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("meets")
+    if not isinstance(data, list) or not data:
+        return {"error": "body must be a non-empty list of meets"}, 400
+
+    default_venue = "indoor" if season["discipline"] == "indoor" else "outdoor"
+    rows, errors = [], []
+    for i, item in enumerate(data):
+        if not isinstance(item, dict):
+            errors.append({"index": i, "error": "meet must be an object"})
+            continue
+        name = str(item.get("name") or "").strip()
+        if not name:
+            errors.append({"index": i, "error": "name is required"})
+            continue
+        venue = str(item.get("venue_type") or default_venue).strip().lower()
+        if venue not in {"indoor", "outdoor"}:
+            errors.append({"index": i, "error": "venue_type must be indoor or outdoor"})
+            continue
+        try:
+            is_varsity = parse_bool(item.get("is_varsity"), False)
+        except ValueError:
+            errors.append({"index": i, "error": "is_varsity must be True/False"})
+            continue
+        notes = item.get("notes")
+        rows.append({
+            "org_id": CURRENT_ORG_ID,
+            "name": name,
+            "meet_date": (str(item.get("meet_date")).strip() or None) if item.get("meet_date") else None,
+            "location": (str(item.get("location")).strip() or None) if item.get("location") else None,
+            "is_varsity": is_varsity,
+            "venue_type": venue,
+            "is_archived": False,
+            "season_id": season_id,
+            "notes": (str(notes).strip() or None) if notes is not None else None,
+            "page_version": 0,
+        })
+    if errors:
+        return jsonify({"error": "schedule has invalid meets", "errors": errors}), 400
+
+    # unordered RETURNING stays one batched statement on SQLite too
+    cols = [getattr(Meet, k) for k in rows[0] if k != "page_version"]
+    meets = sorted(
+        (dict(r._mapping) for r in db.session.execute(insert(Meet).returning(Meet.meet_id, *cols), rows)),
+        key=lambda m: m["meet_id"],
+    )
+    meet_events = populate_meet_events([m["meet_id"] for m in meets])
+    mark_changed("meets")
+    db.session.commit()
+
+    return jsonify({"meets": meets, "meet_events": meet_events}), 201
+
+
 @app.patch("/api/seasons/<int:season_id>")
 def update_season(season_id: int):
     s = Season.query.get_or_404(season_id)
@@ -863,8 +3587,8 @@ def delete_season(season_id: int):
 
 @app.get("/api/org")
 def current_org():
-    org = Organization.query.get(CURRENT_ORG_ID)
-    return jsonify(org.to_dict() if org else {"org_id": CURRENT_ORG_ID, "name": None})
+    org = ref_cache.get("organizations").get(CURRENT_ORG_ID)
+    return jsonify(org or {"org_id": CURRENT_ORG_ID, "name": None})
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -0,0 +1,356 @@
+# backend/benchmark.py
+"""Endpoint benchmarks against a generated dataset, served by gunicorn.
+
+    python -m backend.benchmark                                   # SQLite, temp database
+    python -m backend.benchmark --database-url postgresql+psycopg2://.../meet_bench
+
+Steps: build the schema and a synthetic dataset (backend.seed.generate; a
+Postgres database is filled once and reused while it has synthetic orgs),
+start gunicorn with the config and flags from the Dockerfile's CMD,
+then run each scenario (after --warmup unmeasured seconds) with --clients
+concurrent keep-alive connections, --rounds times for --duration seconds. Per
+operation it reports requests, errors, and the median round's throughput and
+p50/p95/p99 latency, writes them as JSON (--out) and compares them with the
+stored baseline for the same backend (benchmark_baseline.json): p95 more than
+--tolerance slower, throughput that much lower, or new errors fail the run.
+
+Scenarios: list_athletes, list_meets, meet_page_bootstrap (cycling through the
+org's meets and both genders), add_entry/remove_entry (each client adds and
+removes its own entries) and create_meet.
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import shlex
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, "backend", "benchmark_baseline.json")
+SCENARIOS = ("list_athletes", "list_meets", "meet_page_bootstrap", "add_remove_entry", "create_meet")
+
+
+def dockerfile_gunicorn_args():
+    """gunicorn arguments from the Dockerfile's CMD, without the bind address."""
+    with open(os.path.join(ROOT, "Dockerfile")) as f:
+        cmd = next(line for line in f if line.startswith("CMD"))
+    args = json.loads(cmd[3:].strip())[1:]
+    out = []
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in ("-b", "--bind"):
+            skip = True
+        else:
+            out.append(arg)
+    return out
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    k = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[k]
+
+
+def summarize(latencies, errors, seconds):
+    values = sorted(latencies)
+    ms = lambda v: None if v is None else round(v * 1000, 2)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "throughput_rps": round(len(values) / seconds, 1) if seconds else 0.0,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+    }
+
+
+# ---- dataset ----
+
+def prepare_dataset(args, env):
+    """Schema + reference data + synthetic orgs; returns the facts the scenarios need."""
+    os.environ.update(env)
+    from backend.app import app, db, Athlete, Meet, MeetEvent, MeetEntry, Organization
+    from backend.seed import seed, generate
+
+    with app.app_context():
+        db.create_all()
+        seed()
+        org = (db.session.query(Organization.org_id)
+               .filter(Organization.name.like("Synthetic Org %")).order_by(Organization.org_id).first())
+        if org is None:
+            counts = generate(orgs=args.orgs, athletes=args.athletes, random_seed=args.random_seed)
+            org_id = counts["first_org_id"]
+        else:
+            org_id = org[0]
+
+        meet_ids = [mid for (mid,) in db.session.query(Meet.meet_id)
+                    .filter(Meet.org_id == org_id, Meet.is_archived == False).order_by(Meet.meet_id)]
+        # (meet_event_id, athlete_id) pairs with no entry yet, for add/remove
+        meet_id = meet_ids[-1]
+        entered = {(me, a) for me, a in db.session.query(MeetEntry.meet_event_id, MeetEntry.athlete_id)
+                   .join(MeetEvent, MeetEntry.meet_event_id == MeetEvent.meet_event_id)
+                   .filter(MeetEvent.meet_id == meet_id)}
+        athletes = {"M": [], "F": []}
+        for aid, gender in (db.session.query(Athlete.athlete_id, Athlete.gender)
+                            .filter(Athlete.org_id == org_id, Athlete.is_active == True,
+                                    Athlete.gender.in_(["M", "F"]))):
+            athletes[gender].append(aid)
+        pairs = [
+            (me_id, aid)
+            for me_id, gender in db.session.query(MeetEvent.meet_event_id, MeetEvent.gender)
+            .filter(MeetEvent.meet_id == meet_id).order_by(MeetEvent.meet_event_id)
+            for aid in athletes[gender]
+            if (me_id, aid) not in entered
+        ]
+        random.Random(args.random_seed).shuffle(pairs)
+        dataset = {
+            "orgs": db.session.query(Organization).count(),
+            "athletes": db.session.query(Athlete).count(),
+            "meets": db.session.query(Meet).count(),
+            "meet_entries": db.session.query(MeetEntry).count(),
+        }
+        db.session.remove()
+    return org_id, meet_ids, pairs, dataset
+
+
+# ---- server ----
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(env, port, log_path):
+    cmd = [sys.executable, "-m", "gunicorn", "-b", f"127.0.0.1:{port}"] + dockerfile_gunicorn_args()
+    log = open(log_path, "w")
+    proc = subprocess.Popen(cmd, cwd=ROOT, env={**os.environ, **env}, stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"gunicorn exited ({proc.returncode}); see {log_path}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+            conn.request("GET", "/metrics")
+            if conn.getresponse().status == 200:
+                conn.close()
+                return proc, " ".join(shlex.quote(c) for c in cmd[1:])
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"gunicorn did not start; see {log_path}")
+
+
+# ---- load ----
+
+class Client:
+    def __init__(self, port):
+        self.port = port
+        self.conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+
+    def call(self, method, path, body=None):
+        """(status, seconds); reconnects once if the server closed the connection."""
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        payload = json.dumps(body) if body is not None else None
+        for attempt in (0, 1):
+            try:
+                started = time.perf_counter()
+                self.conn.request(method, path, payload, headers)
+                resp = self.conn.getresponse()
+                resp.read()
+                return resp.status, time.perf_counter() - started
+            except (http.client.HTTPException, OSError):
+                self.conn.close()
+                self.conn = http.client.HTTPConnection("127.0.0.1", self.port, timeout=60)
+                if attempt:
+                    return 599, time.perf_counter() - started
+
+    def close(self):
+        self.conn.close()
+
+
+def run_scenario(name, port, clients, duration, org_id, meet_ids, pairs):
+    """{operation: summary} for one scenario; add_remove_entry measures two operations."""
+    results = {}
+    lock = threading.Lock()
+    stop = time.monotonic() + duration
+
+    def record(op, status, seconds, ok_statuses):
+        with lock:
+            latencies, errors = results.setdefault(op, ([], [0]))
+            latencies.append(seconds)
+            if status not in ok_statuses:
+                errors[0] += 1
+
+    def worker(n):
+        client = Client(port)
+        rng = random.Random(n)
+        mine = pairs[n::clients]
+        i = 0
+        try:
+            while time.monotonic() < stop:
+                if name == "list_athletes":
+                    record(name, *client.call("GET", "/api/athletes"), (200,))
+                elif name == "list_meets":
+                    record(name, *client.call("GET", "/api/meets"), (200,))
+                elif name == "meet_page_bootstrap":
+                    path = f"/api/meets/{rng.choice(meet_ids)}/page?gender={rng.choice('MF')}"
+                    record(name, *client.call("GET", path), (200,))
+                elif name == "add_remove_entry":
+                    if not mine:
+                        return
+                    me_id, aid = mine[i % len(mine)]
+                    record("add_entry", *client.call("POST", f"/api/meet-events/{me_id}/entries", {"athlete_id": aid}), (201,))
+                    record("remove_entry", *client.call("DELETE", f"/api/meet-events/{me_id}/entries/{aid}"), (200, 204))
+                elif name == "create_meet":
+                    body = {"name": f"Bench {n}-{i}", "meet_date": "2025-05-01", "is_varsity": i % 2 == 0}
+                    record(name, *client.call("POST", "/api/meets", body), (200, 201))
+                i += 1
+        finally:
+            client.close()
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(clients)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.monotonic() - started
+    return {op: summarize(latencies, errors[0], elapsed) for op, (latencies, errors) in results.items()}
+
+
+def combine_rounds(rounds):
+    """Per operation: requests and errors summed, throughput and latencies the median round."""
+    out = {}
+    for op in rounds[0]:
+        summaries = [r[op] for r in rounds if op in r]
+        combined = {"requests": sum(x["requests"] for x in summaries), "errors": sum(x["errors"] for x in summaries)}
+        for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            values = sorted(x[key] for x in summaries if x[key] is not None)
+            combined[key] = values[len(values) // 2] if values else None
+        out[op] = combined
+    return out
+
+
+# ---- baseline ----
+
+def compare(results, baseline, tolerance):
+    """[(operation, message)] for every regression against the baseline."""
+    out = []
+    for op, now in results.items():
+        base = baseline.get(op)
+        if not base:
+            continue
+        if base["p95_ms"] and now["p95_ms"] and now["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            out.append((op, f"p95 {now['p95_ms']}ms vs baseline {base['p95_ms']}ms"))
+        if base["throughput_rps"] and now["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            out.append((op, f"throughput {now['throughput_rps']}/s vs baseline {base['throughput_rps']}/s"))
+        if now["errors"] > base.get("errors", 0):
+            out.append((op, f"{now['errors']} errors vs baseline {base.get('errors', 0)}"))
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the API under gunicorn against generated data.")
+    parser.add_argument("--database-url", help="Postgres (or other) URL of a scratch database; default: temp SQLite")
+    parser.add_argument("--orgs", type=int, default=4)
+    parser.add_argument("--athletes", type=int, default=600, help="athletes per org")
+    parser.add_argument("--random-seed", type=int, default=0)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario round")
+    parser.add_argument("--rounds", type=int, default=3, help="rounds per scenario; medians are reported")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before each scenario")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--out", default="benchmark-results.json")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95/throughput change")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="meet-bench-")
+    if args.database_url:
+        env = {"DATABASE_URL": args.database_url}
+    else:
+        env = {"DB_PATH": os.path.join(workdir, "bench.db")}
+    env["SEED_EVENTS"] = "1"
+    org_id, meet_ids, pairs, dataset = prepare_dataset(args, env)
+    backend = "sqlite" if not args.database_url else args.database_url.split(":", 1)[0].split("+", 1)[0]
+    env["CURRENT_ORG_ID"] = str(org_id)
+    print(f"{backend}: {dataset}")
+
+    port = free_port()
+    server, server_cmd = start_server(env, port, os.path.join(workdir, "gunicorn.log"))
+    results = {}
+    try:
+        for name in args.scenarios.split(","):
+            if name not in SCENARIOS:
+                parser.error(f"unknown scenario {name!r}")
+            if args.warmup > 0:  # fill caches and connection pools
+                run_scenario(name, port, args.clients, args.warmup, org_id, meet_ids, pairs)
+            rounds = [run_scenario(name, port, args.clients, args.duration, org_id, meet_ids, pairs)
+                      for _ in range(args.rounds)]
+            results.update(combine_rounds(rounds))
+    finally:
+        server.terminate()
+        server.wait(10)
+
+    print(f"{'operation':<22}{'requests':>9}{'errors':>7}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for op, r in results.items():
+        print(f"{op:<22}{r['requests']:>9}{r['errors']:>7}{r['throughput_rps']:>9}"
+              f"{r['p50_ms'] or '-':>9}{r['p95_ms'] or '-':>9}{r['p99_ms'] or '-':>9}")
+
+    report = {
+        "backend": backend,
+        "server": server_cmd,
+        "clients": args.clients,
+        "duration_s": args.duration,
+        "rounds": args.rounds,
+        "dataset": dataset,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print("results written to", args.out)
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    if args.update_baseline:
+        baselines[backend] = {k: report[k] for k in ("clients", "duration_s", "rounds", "dataset", "machine", "results")}
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print("baseline updated for", backend)
+        return 0
+    if backend not in baselines:
+        print(f"no {backend} baseline in {args.baseline}; run with --update-baseline to record one")
+        return 0
+    base = baselines[backend]
+    if (base["clients"], base["duration_s"], base.get("rounds"), base["dataset"]) != (
+            args.clients, args.duration, args.rounds, dataset):
+        print(f"note: baseline ran {base.get('rounds')}x{base['duration_s']}s with {base['clients']} clients"
+              f" on {base['dataset']}")
+    regressions = compare(results, base["results"], args.tolerance)
+    for op, message in regressions:
+        print(f"REGRESSION {op}: {message}")
+    if not regressions:
+        print(f"within {args.tolerance:.0%} of the {backend} baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
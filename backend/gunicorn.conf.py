@@ -0,0 +1,21 @@
+# backend/gunicorn.conf.py
+"""gunicorn settings for the container (see Dockerfile and README "Server").
+
+With Postgres the worker is gevent: requests and open meet streams are
+greenlets, and psycopg2 waits cooperatively (psycogreen). sqlite3 has no
+cooperative mode, so a SQLite query would block every greenlet in the worker;
+SQLite deployments keep the threaded worker, where each open meet stream holds
+one of its threads.
+"""
+import os
+
+bind = "0.0.0.0:5000"
+workers = 1
+timeout = 60
+
+if os.environ.get("DATABASE_URL", "").startswith("postgresql"):
+    worker_class = "gevent"
+    worker_connections = 1000
+else:
+    worker_class = "gthread"
+    threads = 8
@@ -0,0 +1,194 @@
+# backend/lineup.py
+"""Lineup optimizer: choose entries that maximize a meet's projected team score.
+
+The problem is an assignment with capacities (entries per event, events per
+athlete). It is solved exactly as a max-profit flow:
+
+  source -> athlete (cap = event limit) -> (athlete, event) (cap 1)
+         -> event slot j (cap 1, profit) -> sink
+
+Slot j of an event is the team's j-th best entrant there, so an athlete with
+`ahead` opponent marks better than theirs projects to place ahead + j and earns
+points[ahead + j - 1]. For the usual scoring tables (points that drop by the
+same or less at each place) the solver fills slots in mark order, so slot
+profits equal the real merged-field points.
+
+Profits are integers: points * SCALE plus a small tiebreak favouring athletes
+in events where they rank highest on the roster, so ties in points go to the
+stronger fit without ever outweighing a point.
+"""
+import heapq
+import time
+
+SCORING_TABLES = {
+    "dual": [5, 3, 1],
+    "tri": [6, 4, 3, 2, 1],
+    "invitational": [10, 8, 6, 5, 4, 3, 2, 1],
+}
+SCALE = 1_000_000
+TIEBREAK_MAX = 999
+
+
+def places_ahead(mark, opponent_marks, higher_is_better):
+    """How many opponent marks beat this one (ties go to the athlete)."""
+    if higher_is_better:
+        return sum(1 for m in opponent_marks if m > mark)
+    return sum(1 for m in opponent_marks if m < mark)
+
+
+def build_candidates(marks, opponents, higher_by_event):
+    """{(athlete_id, event_key): (mark, ahead, tiebreak)} for every athlete with a mark.
+
+    marks: {event_key: {athlete_id: mark}}; opponents: {event_key: [marks]}.
+    """
+    candidates = {}
+    for event_key, by_athlete in marks.items():
+        higher = higher_by_event[event_key]
+        opp = opponents.get(event_key, ())
+        ranked = sorted(by_athlete.items(), key=lambda kv: -kv[1] if higher else kv[1])
+        n = len(ranked)
+        for rank, (athlete_id, mark) in enumerate(ranked):
+            tiebreak = round(TIEBREAK_MAX * (n - rank) / n)
+            candidates[(athlete_id, event_key)] = (mark, places_ahead(mark, opp, higher), tiebreak)
+    return candidates
+
+
+class _Flow:
+    def __init__(self):
+        self.to, self.cap, self.cost, self.adj = [], [], [], []
+
+    def node(self):
+        self.adj.append([])
+        return len(self.adj) - 1
+
+    def edge(self, u, v, cap, cost):
+        self.adj[u].append(len(self.to))
+        self.to.append(v); self.cap.append(cap); self.cost.append(cost)
+        self.adj[v].append(len(self.to))
+        self.to.append(u); self.cap.append(0); self.cost.append(-cost)
+        return len(self.to) - 2
+
+    def min_cost_flow(self, s, t, deadline):
+        """Augment along cheapest paths while they reduce cost. Returns False if cut short."""
+        n = len(self.adj)
+        # nodes are created in topological order and every initial edge points forward,
+        # so one pass gives exact starting potentials despite negative costs
+        inf = float("inf")
+        pot = [inf] * n
+        pot[s] = 0
+        for u in range(n):
+            if pot[u] == inf:
+                continue
+            for e in self.adj[u]:
+                if self.cap[e] > 0 and pot[u] + self.cost[e] < pot[self.to[e]]:
+                    pot[self.to[e]] = pot[u] + self.cost[e]
+        pot = [p if p != inf else 0 for p in pot]
+
+        while True:
+            if time.monotonic() > deadline:
+                return False
+            dist = [inf] * n
+            prev = [-1] * n
+            dist[s] = 0
+            heap = [(0, s)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                pu = pot[u]
+                for e in self.adj[u]:
+                    if self.cap[e] <= 0:
+                        continue
+                    v = self.to[e]
+                    nd = d + self.cost[e] + pu - pot[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        prev[v] = e
+                        heapq.heappush(heap, (nd, v))
+            if dist[t] == inf or dist[t] + pot[t] - pot[s] >= 0:
+                return True  # no augmenting path that still adds profit
+            for v in range(n):
+                if dist[v] < inf:
+                    pot[v] += dist[v]
+            v = t
+            while v != s:
+                e = prev[v]
+                self.cap[e] -= 1
+                self.cap[e ^ 1] += 1
+                v = self.to[e ^ 1]
+
+
+def optimize_lineup(candidates, event_caps, athlete_caps, points, fill=False, time_limit=2.0):
+    """Best entry set for the candidates.
+
+    candidates: from build_candidates; event_caps: {event_key: max entries};
+    athlete_caps: {athlete_id: max events}. With fill, entries that can't score
+    are still made (to fill empty slots) when nothing better is available.
+    Returns ([(athlete_id, event_key)], optimal).
+    """
+    g = _Flow()
+    source = g.node()
+    athlete_node = {aid: g.node() for aid in sorted(athlete_caps) if athlete_caps[aid] > 0}
+    pairs = sorted(k for k in candidates if k[0] in athlete_node and event_caps.get(k[1], 0) > 0)
+    pair_node = {k: g.node() for k in pairs}
+    slot_node = {(ek, j): g.node() for ek, cap in event_caps.items() for j in range(cap)}
+    sink = g.node()
+
+    for aid, node in athlete_node.items():
+        g.edge(source, node, athlete_caps[aid], 0)
+    assign_edges = {}
+    for k in pairs:
+        aid, event_key = k
+        _, ahead, tiebreak = candidates[k]
+        g.edge(athlete_node[aid], pair_node[k], 1, 0)
+        for j in range(event_caps[event_key]):
+            place = ahead + j
+            pts = points[place] if place < len(points) else 0
+            if pts <= 0 and not fill:
+                break
+            assign_edges[g.edge(pair_node[k], slot_node[(event_key, j)], 1, -(round(pts * SCALE) + tiebreak))] = k
+    for node in slot_node.values():
+        g.edge(node, sink, 1, 0)
+
+    optimal = g.min_cost_flow(source, sink, time.monotonic() + time_limit)
+    chosen = [k for e, k in assign_edges.items() if g.cap[e] == 0]
+    return chosen, optimal
+
+
+def assign_min_cost(costs, athlete_caps, group_caps, time_limit=2.0):
+    """Fill as many group slots as possible, then at least total cost.
+
+    costs: {(athlete_id, group): non-negative int}; athlete_caps: {athlete_id: max groups};
+    group_caps: {group: slots}. Every slot earns the same large profit, so the flow
+    is maximal first and cheapest second. Returns ([(athlete_id, group)], optimal).
+    """
+    big = sum(costs.values()) + 1
+    g = _Flow()
+    source = g.node()
+    athlete_node = {aid: g.node() for aid in sorted(athlete_caps) if athlete_caps[aid] > 0}
+    pairs = sorted(k for k in costs if k[0] in athlete_node and group_caps.get(k[1], 0) > 0)
+    pair_node = {k: g.node() for k in pairs}
+    group_node = {grp: g.node() for grp in group_caps}
+    sink = g.node()
+
+    for aid, node in athlete_node.items():
+        g.edge(source, node, athlete_caps[aid], 0)
+    assign_edges = {}
+    for k in pairs:
+        g.edge(athlete_node[k[0]], pair_node[k], 1, 0)
+        assign_edges[g.edge(pair_node[k], group_node[k[1]], 1, costs[k] - big)] = k
+    for grp, node in group_node.items():
+        g.edge(node, sink, group_caps[grp], 0)
+
+    optimal = g.min_cost_flow(source, sink, time.monotonic() + time_limit)
+    return [k for e, k in assign_edges.items() if g.cap[e] == 0], optimal
+
+
+def projected_points(chosen_marks, opponent_marks, higher, points):
+    """{athlete_id: points} for a team's entrants in one event against the opponents' marks."""
+    ranked = sorted(chosen_marks.items(), key=lambda kv: -kv[1] if higher else kv[1])
+    out = {}
+    for j, (athlete_id, mark) in enumerate(ranked):
+        place = places_ahead(mark, opponent_marks, higher) + j
+        out[athlete_id] = points[place] if place < len(points) else 0
+    return out
@@ -0,0 +1,98 @@
+# backend/marks.py
+"""Parse free-form seed marks into integers that sort and compare in SQL.
+
+Times become milliseconds, distances/heights become millimeters:
+
+  "10.8"        -> 10800          "21-04.5"   -> 6515   (feet-inches)
+  "4:32.15"     -> 272150         "21' 4.5\"" -> 6515
+  "1:02:03.4"   -> 3723400        "6.45m"     -> 6450   (bare numbers are meters)
+
+Anything unparseable ("NT", "DNF", "", None) becomes None. The batch helpers
+parse each distinct string once, so a whole meet (or table) of seeds costs one
+pass over its unique values.
+"""
+import re
+
+MM_PER_FOOT = 304.8
+MM_PER_INCH = 25.4
+
+_TIME_RE = re.compile(r"^(?:(\d+):)?(?:(\d+):)?(\d+(?:\.\d*)?)$")
+_FEET_INCHES_RE = re.compile(r"""^(\d+)\s*(?:-|'|ft)\s*(\d+(?:\.\d*)?)?\s*(?:"|''|in)?$""")
+_INCHES_RE = re.compile(r"""^(\d+(?:\.\d*)?)\s*(?:"|''|in)$""")
+_METERS_RE = re.compile(r"^(\d+(?:\.\d*)?)\s*m?$")
+_CM_RE = re.compile(r"^(\d+(?:\.\d*)?)\s*cm$")
+
+
+def _clean(raw):
+    if raw is None:
+        return ""
+    return str(raw).strip().lower().rstrip("h").strip()  # "10.8h" (hand time) parses like "10.8"
+
+
+def parse_time(raw):
+    """'4:32.15' -> 272150 (ms); None if unparseable."""
+    m = _TIME_RE.match(_clean(raw))
+    if not m:
+        return None
+    first, second, seconds = m.groups()
+    hours, minutes = (first, second) if second is not None else (None, first)
+    total = float(seconds) + 60 * int(minutes or 0) + 3600 * int(hours or 0)
+    return round(total * 1000)
+
+
+def parse_distance(raw):
+    """'21-04.5' / '6.45m' -> millimeters; None if unparseable."""
+    s = _clean(raw)
+    if not s:
+        return None
+    m = _FEET_INCHES_RE.match(s)
+    if m:
+        return round(int(m.group(1)) * MM_PER_FOOT + float(m.group(2) or 0) * MM_PER_INCH)
+    m = _INCHES_RE.match(s)
+    if m:
+        return round(float(m.group(1)) * MM_PER_INCH)
+    m = _CM_RE.match(s)
+    if m:
+        return round(float(m.group(1)) * 10)
+    m = _METERS_RE.match(s)
+    if m:
+        return round(float(m.group(1)) * 1000)
+    return None
+
+
+def parse_times(values):
+    """Batch parse_time: returns a list aligned with values."""
+    return _parse_many(parse_time, values)
+
+
+def parse_distances(values):
+    """Batch parse_distance: returns a list aligned with values."""
+    return _parse_many(parse_distance, values)
+
+
+def _parse_many(parse, values):
+    memo = {}
+    out = []
+    for v in values:
+        if v not in memo:
+            memo[v] = parse(v)
+        out.append(memo[v])
+    return out
+
+
+def format_time(ms):
+    if ms is None:
+        return None
+    minutes, ms = divmod(int(ms), 60000)
+    seconds = f"{ms / 1000:05.2f}" if minutes else f"{ms / 1000:.2f}"
+    return f"{minutes}:{seconds}" if minutes else seconds
+
+
+def format_distance(mm, unit="m"):
+    if mm is None:
+        return None
+    if unit == "ft":
+        inches = round(mm / MM_PER_INCH * 4) / 4  # field marks are quarter inches; mm rounding undone
+        feet, inches = divmod(inches, 12)
+        return f"{int(feet)}-{inches:05.2f}"
+    return f"{mm / 1000:.2f}m"
@@ -0,0 +1,168 @@
+# backend/meet_stream.py
+"""Fan-out of meet change notifications to Server-Sent Events clients.
+
+MeetBroker keeps one queue per connected client and a short per-meet history
+so reconnecting clients (Last-Event-ID) can catch up. A backend decides how a
+published change reaches the broker of every process:
+
+  LocalBackend  delivers straight to this process's broker (single worker).
+  TableBackend  inserts a row into a notifications table that every process
+                polls, so several gunicorn workers (or a test process using
+                SQLite) see the same ordered stream.
+"""
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+
+
+class MeetBroker:
+    def __init__(self, history=200, queue_size=1000):
+        self.history = history
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = {}  # meet_id -> set(queue.Queue)
+        self._recent = {}       # meet_id -> deque[(seq, event_type, data)]
+
+    def subscribe(self, meet_id, last_event_id=None):
+        q = queue.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(meet_id, set()).add(q)
+            if last_event_id is not None:
+                for item in self._recent.get(meet_id, ()):
+                    if item[0] > last_event_id:
+                        q.put_nowait(item)
+        return q
+
+    def unsubscribe(self, meet_id, q):
+        with self._lock:
+            subs = self._subscribers.get(meet_id)
+            if subs:
+                subs.discard(q)
+                if not subs:
+                    del self._subscribers[meet_id]
+
+    def deliver(self, meet_id, seq, event_type, data):
+        item = (seq, event_type, data)
+        with self._lock:
+            self._recent.setdefault(meet_id, deque(maxlen=self.history)).append(item)
+            subs = list(self._subscribers.get(meet_id, ()))
+        for q in subs:
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                pass  # slow client; it resyncs through ?since= when it catches up
+
+    def subscriber_count(self):
+        with self._lock:
+            return sum(len(s) for s in self._subscribers.values())
+
+
+class LocalBackend:
+    def __init__(self, broker):
+        self.broker = broker
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def start(self):
+        pass
+
+    def publish(self, meet_id, event_type, data):
+        with self._lock:
+            seq = next(self._seq)
+        self.broker.deliver(meet_id, seq, event_type, data)
+
+
+class TableBackend:
+    def __init__(self, broker, engine_getter, table, interval=0.5, retention=timedelta(minutes=10), logger=None):
+        self.broker = broker
+        self.engine_getter = engine_getter
+        self.table = table
+        self.interval = interval
+        self.retention = retention
+        self.logger = logger or logging.getLogger(__name__)
+        self._engine = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _engine_or_resolve(self):
+        if self._engine is None:
+            self._engine = self.engine_getter()
+        return self._engine
+
+    def start(self):
+        # called from a request (so the engine can be resolved); the poller starts once per process
+        with self._lock:
+            if self._thread is not None:
+                return
+            engine = self._engine_or_resolve()
+            t = self.table
+            with engine.connect() as conn:
+                last_id = conn.execute(select(func.max(t.c.notification_id))).scalar() or 0
+            self._thread = threading.Thread(target=self._poll, args=(engine, last_id), daemon=True)
+            self._thread.start()
+
+    def publish(self, meet_id, event_type, data):
+        with self._engine_or_resolve().begin() as conn:
+            conn.execute(self.table.insert().values(
+                meet_id=meet_id,
+                event_type=event_type,
+                payload=json.dumps(data),
+                created_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            ))
+
+    def _poll(self, engine, last_id):
+        t = self.table
+        next_prune = 0.0
+        while True:
+            try:
+                with engine.connect() as conn:
+                    rows = conn.execute(
+                        t.select().where(t.c.notification_id > last_id).order_by(t.c.notification_id)
+                    ).all()
+                for row in rows:
+                    last_id = row.notification_id
+                    self.broker.deliver(row.meet_id, row.notification_id, row.event_type, json.loads(row.payload))
+
+                if time.monotonic() >= next_prune:
+                    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - self.retention
+                    with engine.begin() as conn:
+                        conn.execute(t.delete().where(t.c.created_at < cutoff))
+                    next_prune = time.monotonic() + 60
+            except Exception as e:  # keep polling through transient DB errors
+                self.logger.warning("meet stream poll failed: %s", e)
+            time.sleep(self.interval)
+
+
+def format_sse(seq, event_type, data):
+    return f"id: {seq}\nevent: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def sse_stream(broker, meet_id, last_event_id=None, keepalive=15, max_duration=300):
+    """Generator of SSE text for one client.
+
+    With Postgres, streams are served by gunicorn's gevent worker, where an
+    open stream is an idle greenlet waiting on its queue; with SQLite each one
+    holds a worker thread (backend/gunicorn.conf.py). Streams end after
+    max_duration so dead connections are reclaimed; EventSource
+    reconnects on its own and resumes via Last-Event-ID.
+    """
+    q = broker.subscribe(meet_id, last_event_id)
+    deadline = time.monotonic() + max_duration
+    try:
+        yield "retry: 3000\n\n"
+        while time.monotonic() < deadline:
+            try:
+                seq, event_type, data = q.get(timeout=keepalive)
+            except queue.Empty:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(seq, event_type, data)
+    finally:
+        broker.unsubscribe(meet_id, q)
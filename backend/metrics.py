@@ -0,0 +1,152 @@
+# backend/metrics.py
+"""Per-route request metrics in Prometheus text format.
+
+RequestMetrics keeps, for every (method, route template):
+
+  request latency histogram   meet_assist_http_request_duration_seconds
+  responses by status         meet_assist_http_requests_total
+  SQL statements and time     meet_assist_sql_statements_total,
+                              meet_assist_sql_duration_seconds_total
+
+SQL is counted per thread between start_request() and finish(), from
+SQLAlchemy cursor events (sql_before / sql_after; a thread runs one statement
+at a time; under gevent "thread" means greenlet). Totals live in process
+memory behind one lock, which is right for the single gunicorn worker; with
+more workers each one would report only its own requests.
+"""
+import bisect
+import threading
+import time
+
+# seconds; the +Inf bucket is implied
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _RouteStats:
+    __slots__ = ("buckets", "sum", "count", "statuses", "sql_statements", "sql_seconds")
+
+    def __init__(self, n_buckets):
+        self.buckets = [0] * (n_buckets + 1)  # per bucket (not cumulative); last is +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.statuses = {}
+        self.sql_statements = 0
+        self.sql_seconds = 0.0
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class RequestMetrics:
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix="meet_assist"):
+        self.bucket_bounds = tuple(buckets)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._routes = {}  # (method, route) -> _RouteStats
+        self._local = threading.local()
+
+    # ---- per request (called on the request's thread) ----
+
+    def start_request(self):
+        local = self._local
+        local.active = True
+        local.started = time.perf_counter()
+        local.sql_statements = 0
+        local.sql_seconds = 0.0
+
+    def sql_before(self):
+        local = self._local
+        if getattr(local, "active", False):
+            local.sql_started = time.perf_counter()
+
+    def sql_after(self):
+        local = self._local
+        if getattr(local, "active", False):
+            local.sql_statements += 1
+            local.sql_seconds += time.perf_counter() - local.sql_started
+
+    def current_sql(self):
+        """(statements, seconds) so far in this thread's request."""
+        local = self._local
+        if not getattr(local, "active", False):
+            return 0, 0.0
+        return local.sql_statements, local.sql_seconds
+
+    def finish(self, method, route, status):
+        """Record the current request once; later calls (e.g. teardown after after_request) are ignored."""
+        local = self._local
+        if not getattr(local, "active", False):
+            return
+        local.active = False
+        self.observe(method, route, status, time.perf_counter() - local.started,
+                     local.sql_statements, local.sql_seconds)
+
+    # ---- aggregation ----
+
+    def observe(self, method, route, status, seconds, sql_statements=0, sql_seconds=0.0):
+        i = bisect.bisect_left(self.bucket_bounds, seconds)
+        key = (method, route)
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = _RouteStats(len(self.bucket_bounds))
+            stats.buckets[i] += 1
+            stats.sum += seconds
+            stats.count += 1
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            stats.sql_statements += sql_statements
+            stats.sql_seconds += sql_seconds
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                key: (list(s.buckets), s.sum, s.count, dict(s.statuses), s.sql_statements, s.sql_seconds)
+                for key, s in self._routes.items()
+            }
+
+    def render(self):
+        """Prometheus text exposition format (0.0.4)."""
+        p = self.prefix
+        snap = sorted(self.snapshot().items())
+        bounds = [_number(b) for b in self.bucket_bounds] + ["+Inf"]
+        lines = [
+            f"# HELP {p}_http_request_duration_seconds Request latency by route.",
+            f"# TYPE {p}_http_request_duration_seconds histogram",
+        ]
+        for (method, route), (buckets, total, count, _, _, _) in snap:
+            labels = f'method="{_label(method)}",route="{_label(route)}"'
+            cumulative = 0
+            for le, n in zip(bounds, buckets):
+                cumulative += n
+                lines.append(f'{p}_http_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{p}_http_request_duration_seconds_sum{{{labels}}} {_number(total)}")
+            lines.append(f"{p}_http_request_duration_seconds_count{{{labels}}} {count}")
+
+        lines += [
+            f"# HELP {p}_http_requests_total Responses by route and status.",
+            f"# TYPE {p}_http_requests_total counter",
+        ]
+        for (method, route), (_, _, _, statuses, _, _) in snap:
+            labels = f'method="{_label(method)}",route="{_label(route)}"'
+            for status, n in sorted(statuses.items()):
+                lines.append(f'{p}_http_requests_total{{{labels},status="{status}"}} {n}')
+
+        lines += [
+            f"# HELP {p}_sql_statements_total SQL statements executed by route.",
+            f"# TYPE {p}_sql_statements_total counter",
+        ]
+        for (method, route), (_, _, _, _, statements, _) in snap:
+            lines.append(f'{p}_sql_statements_total{{method="{_label(method)}",route="{_label(route)}"}} {statements}')
+
+        lines += [
+            f"# HELP {p}_sql_duration_seconds_total Time spent executing SQL by route.",
+            f"# TYPE {p}_sql_duration_seconds_total counter",
+        ]
+        for (method, route), (_, _, _, _, _, seconds) in snap:
+            lines.append(f'{p}_sql_duration_seconds_total{{method="{_label(method)}",route="{_label(route)}"}} {_number(seconds)}')
+        return "\n".join(lines) + "\n"
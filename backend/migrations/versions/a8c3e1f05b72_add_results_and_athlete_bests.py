@@ -0,0 +1,68 @@
+"""add results and athlete_bests
+
+Revision ID: a8c3e1f05b72
+Revises: f3b86a2d4c19
+Create Date: 2026-10-18 15:20:44.137905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3e1f05b72'
+down_revision: Union[str, Sequence[str], None] = 'f3b86a2d4c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('results',
+    sa.Column('result_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('meet_entry_id', sa.Integer(), nullable=True),
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('meet_id', sa.Integer(), nullable=False),
+    sa.Column('mark', sa.String(length=20), nullable=False),
+    sa.Column('mark_value', sa.Integer(), nullable=True),
+    sa.Column('place', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.athlete_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.event_id'], ),
+    sa.ForeignKeyConstraint(['meet_entry_id'], ['meet_entries.meet_entry_id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['meet_id'], ['meets.meet_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('result_id')
+    )
+    op.create_index('ix_results_athlete_event', 'results', ['athlete_id', 'event_id'], unique=False)
+    op.create_index(op.f('ix_results_meet_entry_id'), 'results', ['meet_entry_id'], unique=False)
+    op.create_index(op.f('ix_results_meet_id'), 'results', ['meet_id'], unique=False)
+    op.create_table('athlete_bests',
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('season_id', sa.Integer(), nullable=False),
+    sa.Column('best_value', sa.Integer(), nullable=False),
+    sa.Column('best_mark', sa.String(length=20), nullable=False),
+    sa.Column('result_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.athlete_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('athlete_id', 'event_id', 'season_id')
+    )
+    op.create_index('ix_athlete_bests_season_event', 'athlete_bests', ['season_id', 'event_id'], unique=False)
+    cache_versions = sa.table('cache_versions',
+        sa.column('name', sa.String),
+        sa.column('version', sa.Integer),
+    )
+    op.bulk_insert(cache_versions, [{'name': 'bests', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM cache_versions WHERE name = 'bests'")
+    op.drop_index('ix_athlete_bests_season_event', table_name='athlete_bests')
+    op.drop_table('athlete_bests')
+    op.drop_index(op.f('ix_results_meet_id'), table_name='results')
+    op.drop_index(op.f('ix_results_meet_entry_id'), table_name='results')
+    op.drop_index('ix_results_athlete_event', table_name='results')
+    op.drop_table('results')
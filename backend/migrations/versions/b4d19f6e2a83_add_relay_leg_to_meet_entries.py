@@ -0,0 +1,28 @@
+"""add relay_leg to meet_entries
+
+Revision ID: b4d19f6e2a83
+Revises: a8c3e1f05b72
+Create Date: 2026-10-18 16:02:37.550184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d19f6e2a83'
+down_revision: Union[str, Sequence[str], None] = 'a8c3e1f05b72'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meet_entries', sa.Column('relay_leg', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('meet_entries', 'relay_leg')
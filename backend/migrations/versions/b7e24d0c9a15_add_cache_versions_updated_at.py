@@ -0,0 +1,37 @@
+"""add cache_versions updated_at and list resources
+
+Revision ID: b7e24d0c9a15
+Revises: 3f1c9a7b2d40
+Create Date: 2026-10-18 10:03:17.552904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e24d0c9a15'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7b2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('cache_versions', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    cache_versions = sa.table('cache_versions',
+        sa.column('name', sa.String),
+        sa.column('version', sa.Integer),
+    )
+    op.bulk_insert(cache_versions, [
+        {'name': 'meets', 'version': 0},
+        {'name': 'athletes', 'version': 0},
+    ])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM cache_versions WHERE name IN ('meets', 'athletes')")
+    op.drop_column('cache_versions', 'updated_at')
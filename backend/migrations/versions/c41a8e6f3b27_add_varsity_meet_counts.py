@@ -0,0 +1,47 @@
+"""add varsity_meet_counts
+
+Revision ID: c41a8e6f3b27
+Revises: b7e24d0c9a15
+Create Date: 2026-10-18 11:26:05.114732
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41a8e6f3b27'
+down_revision: Union[str, Sequence[str], None] = 'b7e24d0c9a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('varsity_meet_counts',
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('season_id', sa.Integer(), nullable=False),
+    sa.Column('varsity_meets', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.athlete_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('athlete_id', 'season_id')
+    )
+    op.create_index('ix_varsity_meet_counts_season_athlete', 'varsity_meet_counts', ['season_id', 'athlete_id'], unique=False)
+
+    # backfill (same query as `flask rebuild-varsity-counts`)
+    op.execute("""
+        INSERT INTO varsity_meet_counts (athlete_id, season_id, varsity_meets)
+        SELECT me.athlete_id, COALESCE(m.season_id, 0), COUNT(DISTINCT m.meet_id)
+        FROM meet_entries me
+        JOIN meet_events mev ON me.meet_event_id = mev.meet_event_id
+        JOIN meets m ON mev.meet_id = m.meet_id
+        WHERE m.is_archived = false AND m.is_varsity = true AND me.entry_status = 'entered'
+        GROUP BY me.athlete_id, COALESCE(m.season_id, 0)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_varsity_meet_counts_season_athlete', table_name='varsity_meet_counts')
+    op.drop_table('varsity_meet_counts')
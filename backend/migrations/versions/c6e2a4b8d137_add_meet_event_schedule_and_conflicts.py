@@ -0,0 +1,44 @@
+"""add meet event schedule and athlete_conflicts
+
+Revision ID: c6e2a4b8d137
+Revises: b4d19f6e2a83
+Create Date: 2026-10-18 16:47:09.283615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2a4b8d137'
+down_revision: Union[str, Sequence[str], None] = 'b4d19f6e2a83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meet_events', sa.Column('start_minute', sa.Integer(), nullable=True))
+    op.add_column('meet_events', sa.Column('duration_minutes', sa.Integer(), nullable=True))
+    op.create_table('athlete_conflicts',
+    sa.Column('athlete_id', sa.Integer(), nullable=False),
+    sa.Column('meet_event_id_a', sa.Integer(), nullable=False),
+    sa.Column('meet_event_id_b', sa.Integer(), nullable=False),
+    sa.Column('meet_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['athlete_id'], ['athletes.athlete_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['meet_event_id_a'], ['meet_events.meet_event_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['meet_event_id_b'], ['meet_events.meet_event_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['meet_id'], ['meets.meet_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('athlete_id', 'meet_event_id_a', 'meet_event_id_b')
+    )
+    op.create_index(op.f('ix_athlete_conflicts_meet_id'), 'athlete_conflicts', ['meet_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_athlete_conflicts_meet_id'), table_name='athlete_conflicts')
+    op.drop_table('athlete_conflicts')
+    op.drop_column('meet_events', 'duration_minutes')
+    op.drop_column('meet_events', 'start_minute')
@@ -0,0 +1,38 @@
+"""add composite indexes for hot queries
+
+Revision ID: d7f3b5c9e248
+Revises: c6e2a4b8d137
+Create Date: 2026-10-18 17:32:41.507926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f3b5c9e248'
+down_revision: Union[str, Sequence[str], None] = 'c6e2a4b8d137'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_athletes_org_active_gender_name', 'athletes', ['org_id', 'is_active', 'gender', 'last_name', 'first_name'], unique=False)
+    op.create_index('ix_meets_org_archived_date', 'meets', ['org_id', 'is_archived', 'meet_date'], unique=False)
+    op.create_index('ix_meet_events_meet_gender_sort', 'meet_events', ['meet_id', 'gender', 'sort_order'], unique=False)
+    op.create_index('ix_meet_entries_athlete_status', 'meet_entries', ['athlete_id', 'entry_status'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_meet_entries_entered_athlete_event', 'meet_entries', ['athlete_id', 'meet_event_id'], unique=False, postgresql_where=sa.text("entry_status = 'entered'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_meet_entries_entered_athlete_event', table_name='meet_entries', postgresql_where=sa.text("entry_status = 'entered'"))
+    op.drop_index('ix_meet_entries_athlete_status', table_name='meet_entries')
+    op.drop_index('ix_meet_events_meet_gender_sort', table_name='meet_events')
+    op.drop_index('ix_meets_org_archived_date', table_name='meets')
+    op.drop_index('ix_athletes_org_active_gender_name', table_name='athletes')
@@ -0,0 +1,36 @@
+"""add meet page versions
+
+Revision ID: d92f5b1e7c08
+Revises: c41a8e6f3b27
+Create Date: 2026-10-18 12:40:52.870311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd92f5b1e7c08'
+down_revision: Union[str, Sequence[str], None] = 'c41a8e6f3b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meets', sa.Column('page_version', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('meet_events', sa.Column('entries_version', sa.Integer(), server_default='0', nullable=False))
+    cache_versions = sa.table('cache_versions',
+        sa.column('name', sa.String),
+        sa.column('version', sa.Integer),
+    )
+    op.bulk_insert(cache_versions, [{'name': 'varsity_counts', 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM cache_versions WHERE name = 'varsity_counts'")
+    op.drop_column('meet_events', 'entries_version')
+    op.drop_column('meets', 'page_version')
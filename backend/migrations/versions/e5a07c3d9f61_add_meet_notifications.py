@@ -0,0 +1,37 @@
+"""add meet_notifications
+
+Revision ID: e5a07c3d9f61
+Revises: d92f5b1e7c08
+Create Date: 2026-10-18 13:58:30.401266
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a07c3d9f61'
+down_revision: Union[str, Sequence[str], None] = 'd92f5b1e7c08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('meet_notifications',
+    sa.Column('notification_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('meet_id', sa.Integer(), nullable=False),
+    sa.Column('event_type', sa.String(length=30), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('notification_id')
+    )
+    op.create_index(op.f('ix_meet_notifications_meet_id'), 'meet_notifications', ['meet_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_meet_notifications_meet_id'), table_name='meet_notifications')
+    op.drop_table('meet_notifications')
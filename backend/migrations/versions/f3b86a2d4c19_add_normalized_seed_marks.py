@@ -0,0 +1,49 @@
+"""add normalized seed marks
+
+Revision ID: f3b86a2d4c19
+Revises: e5a07c3d9f61
+Create Date: 2026-10-18 14:41:12.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.marks import parse_times, parse_distances
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b86a2d4c19'
+down_revision: Union[str, Sequence[str], None] = 'e5a07c3d9f61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('meet_entries', sa.Column('seed_time_ms', sa.Integer(), nullable=True))
+    op.add_column('meet_entries', sa.Column('seed_mark_mm', sa.Integer(), nullable=True))
+    op.create_index('ix_meet_entries_event_seed_time', 'meet_entries', ['meet_event_id', 'seed_time_ms'], unique=False)
+    op.create_index('ix_meet_entries_event_seed_mark', 'meet_entries', ['meet_event_id', 'seed_mark_mm'], unique=False)
+
+    # backfill: parse each distinct string once, one UPDATE per distinct value
+    conn = op.get_bind()
+    for raw_col, num_col, parse_many in (
+        ('seed_time', 'seed_time_ms', parse_times),
+        ('seed_mark', 'seed_mark_mm', parse_distances),
+    ):
+        raws = conn.execute(sa.text(
+            f"SELECT DISTINCT {raw_col} FROM meet_entries WHERE {raw_col} IS NOT NULL"
+        )).scalars().all()
+        params = [{"raw": r, "val": v} for r, v in zip(raws, parse_many(raws)) if v is not None]
+        if params:
+            conn.execute(sa.text(f"UPDATE meet_entries SET {num_col} = :val WHERE {raw_col} = :raw"), params)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_meet_entries_event_seed_mark', table_name='meet_entries')
+    op.drop_index('ix_meet_entries_event_seed_time', table_name='meet_entries')
+    op.drop_column('meet_entries', 'seed_mark_mm')
+    op.drop_column('meet_entries', 'seed_time_ms')
@@ -0,0 +1,214 @@
+# backend/profiling.py
+"""On-demand request profiles: sampled call stacks plus a SQL trace.
+
+While a request is profiled, a helper thread samples the request thread's
+stack every `interval` seconds (sys._current_frames) and counts each stack in
+collapsed form, one "outer;inner;leaf count" line per distinct stack, which
+flamegraph.pl / speedscope / inferno read directly. SQL statements executed on
+the request thread are recorded with their duration; write() can add an
+EXPLAIN plan for each distinct SELECT and stores both files under one profile id:
+
+  <id>.collapsed   sampled stacks
+  <id>.sql.json    request info and [{statement, parameters, ms, plan}]
+
+Under gunicorn's gevent worker the request is a greenlet. The sampler is then
+still a real OS thread (gevent's original _thread functions), and reads the
+greenlet's suspended frame while it waits, or the OS thread's frame while it
+runs.
+"""
+import _thread
+import json
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+MAX_EXPLAINS = 50
+MAX_PARAMS_CHARS = 500
+PROFILE_ID_RE = re.compile(r"^\d{8}T\d{12}-[0-9a-f]{8}$")  # UTC time to the microsecond, so ids sort by age
+
+
+def _native():
+    """(start_new_thread, allocate_lock, sleep, get_ident) as they were before any gevent patching."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        monkey = None
+    if monkey is None or not monkey.is_module_patched("threading"):
+        return _thread.start_new_thread, _thread.allocate_lock, time.sleep, _thread.get_ident
+    return (monkey.get_original("_thread", "start_new_thread"), monkey.get_original("_thread", "allocate_lock"),
+            monkey.get_original("time", "sleep"), monkey.get_original("_thread", "get_ident"))
+
+
+def _current_greenlet():
+    try:
+        from gevent import monkey
+    except ImportError:
+        return None
+    if not monkey.is_module_patched("threading"):
+        return None
+    from greenlet import getcurrent
+    return getcurrent()
+
+
+def collapse(frame):
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class StackSampler:
+    """Samples the calling thread (or greenlet) from a separate OS thread."""
+
+    def __init__(self, interval):
+        self._start_new_thread, allocate_lock, self._sleep, get_ident = _native()
+        self.thread_id = get_ident()
+        self.greenlet = _current_greenlet()
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopping = False
+        self._done = allocate_lock()
+
+    def start(self):
+        self._done.acquire()
+        self._start_new_thread(self._run, ())
+
+    def _frame(self):
+        g = self.greenlet
+        if g is not None and g.gr_frame is not None:
+            return g.gr_frame  # switched out, e.g. waiting on the database
+        return sys._current_frames().get(self.thread_id)
+
+    def _run(self):
+        try:
+            while not self._stopping:
+                self._sleep(self.interval)
+                frame = self._frame()
+                if frame is not None:
+                    self.stacks[collapse(frame)] += 1
+        finally:
+            self._done.release()
+
+    def stop(self):
+        self._stopping = True
+        self._done.acquire()
+        self._done.release()
+
+
+class RequestProfile:
+    def __init__(self, interval=0.002):
+        self.id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{secrets.token_hex(4)}"
+        self.sampler = StackSampler(interval)
+        self.statements = []  # [statement, parameters, executemany, seconds]
+        self.started = self.seconds = None
+        self._sql_started = None
+
+    def start(self):
+        self.started = time.perf_counter()
+        self.sampler.start()
+
+    def stop(self):
+        self.sampler.stop()
+        self.seconds = time.perf_counter() - self.started
+
+    def sql_before(self, statement, parameters, executemany):
+        self._sql_started = time.perf_counter()
+        self.statements.append([statement, parameters, executemany, None])
+
+    def sql_after(self):
+        if self.statements and self._sql_started is not None:
+            self.statements[-1][3] = time.perf_counter() - self._sql_started
+
+    def write(self, directory, info, explain=None):
+        """Write <id>.collapsed and <id>.sql.json; explain(statement, parameters) -> plan text."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, self.id + ".collapsed"), "w") as f:
+            for stack, n in self.sampler.stacks.most_common():
+                f.write(f"{stack} {n}\n")
+
+        plans = {}
+        trace = []
+        for statement, parameters, executemany, seconds in self.statements:
+            plan = None
+            key = (statement, repr(parameters))
+            if explain and not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+                if key not in plans and len(plans) < MAX_EXPLAINS:
+                    try:
+                        plans[key] = explain(statement, parameters)
+                    except Exception as e:  # a plan is best effort; never fail the profile
+                        plans[key] = f"EXPLAIN failed: {e}"
+                plan = plans.get(key)
+            trace.append({
+                "statement": statement,
+                "parameters": repr(parameters)[:MAX_PARAMS_CHARS] if not executemany
+                else f"{len(parameters)} parameter sets",
+                "ms": round(seconds * 1000, 3) if seconds is not None else None,
+                "plan": plan,
+            })
+        with open(os.path.join(directory, self.id + ".sql.json"), "w") as f:
+            json.dump({
+                **info,
+                "ms": round(self.seconds * 1000, 3),
+                "samples": sum(self.sampler.stacks.values()),
+                "sample_interval_ms": self.sampler.interval * 1000,
+                "sql_statements": len(trace),
+                "sql_ms": round(sum(t["ms"] or 0 for t in trace), 3),
+                "sql": trace,
+            }, f, indent=2, default=str)
+        return self.id
+
+
+def prune(directory, keep):
+    """Delete all but the newest `keep` profiles in directory (ids sort by time); 0 keeps all."""
+    if keep <= 0:
+        return 0
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return 0
+    ids = sorted({name.partition(".")[0] for name in names if PROFILE_ID_RE.match(name.partition(".")[0])})
+    old = ids[:-keep]
+    for profile_id in old:
+        for suffix in (".collapsed", ".sql.json"):
+            try:
+                os.remove(os.path.join(directory, profile_id + suffix))
+            except FileNotFoundError:
+                pass
+    return len(old)
+
+
+class Profiler:
+    """The profile (if any) of each thread's current request."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def begin(self, interval=0.002):
+        profile = RequestProfile(interval)
+        self._local.profile = profile
+        profile.start()
+        return profile
+
+    def end(self):
+        profile = getattr(self._local, "profile", None)
+        if profile is not None:
+            self._local.profile = None
+            profile.stop()
+        return profile
+
+    def sql_before(self, statement, parameters, executemany):
+        profile = getattr(self._local, "profile", None)
+        if profile is not None:
+            profile.sql_before(statement, parameters, executemany)
+
+    def sql_after(self):
+        profile = getattr(self._local, "profile", None)
+        if profile is not None:
+            profile.sql_after()
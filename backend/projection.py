@@ -0,0 +1,111 @@
+# backend/projection.py
+"""Projected team scores for a meet from everyone's marks.
+
+Each scored event is a sorted column of (mark, team, competitor) rows; places
+come from one sort per event and tied marks split the points of the places
+they cover. MeetProjection keeps per-event results and team totals so a
+what-if change (add/remove one of our entries) re-scores only the events it
+touches and adjusts the totals by their difference.
+"""
+from collections import defaultdict
+
+
+def score_column(rows, higher_is_better, points):
+    """rows: [(mark, team, competitor)] -> ([(team, competitor, mark, place, pts)], {team: pts})."""
+    ranked = sorted(rows, key=lambda r: -r[0] if higher_is_better else r[0])
+    scored, totals = [], defaultdict(float)
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        share = sum(points[p] for p in range(i, min(j + 1, len(points)))) / (j - i + 1)
+        for mark, team, competitor in ranked[i:j + 1]:
+            scored.append((team, competitor, mark, i + 1, share))
+            totals[team] += share
+        i = j + 1
+    return scored, dict(totals)
+
+
+class EventProjection:
+    def __init__(self, meet_event_id, higher_is_better, points, is_scored=True, relay=False):
+        self.meet_event_id = meet_event_id
+        self.higher_is_better = higher_is_better
+        self.points = points
+        self.is_scored = is_scored
+        self.relay = relay
+        self.ours = {}      # athlete_id -> mark (None: no mark to project from)
+        self.opponents = []  # (mark, team)
+        self.scored, self.totals = [], {}
+
+    def copy(self):
+        other = EventProjection(self.meet_event_id, self.higher_is_better, self.points, self.is_scored, self.relay)
+        other.ours = dict(self.ours)
+        other.opponents = list(self.opponents)
+        return other
+
+    def rows(self, team):
+        marks = {aid: m for aid, m in self.ours.items() if m is not None}
+        if self.relay:
+            # one team mark: the relay seed shared by its legs (best one if they differ)
+            if not marks:
+                return [(m, t, None) for m, t in self.opponents]
+            best = max(marks.values()) if self.higher_is_better else min(marks.values())
+            return [(best, team, None)] + [(m, t, None) for m, t in self.opponents]
+        return [(m, team, aid) for aid, m in marks.items()] + [(m, t, None) for m, t in self.opponents]
+
+    def rescore(self, team):
+        self.scored, totals = score_column(self.rows(team), self.higher_is_better, self.points)
+        self.totals = totals if self.is_scored else {}
+
+    def to_dict(self):
+        return {
+            "meet_event_id": self.meet_event_id,
+            "is_scored": self.is_scored,
+            "team_points": self.totals,
+            "places": [
+                {"team": team, "athlete_id": competitor, "mark_value": mark, "place": place, "points": pts}
+                for team, competitor, mark, place, pts in self.scored
+            ],
+            "unmarked_athlete_ids": sorted(aid for aid, m in self.ours.items() if m is None),
+        }
+
+
+class MeetProjection:
+    def __init__(self, team):
+        self.team = team
+        self.events = {}  # meet_event_id -> EventProjection
+        self.totals = defaultdict(float)
+
+    def add_event(self, event):
+        event.rescore(self.team)
+        self.events[event.meet_event_id] = event
+        for team, pts in event.totals.items():
+            self.totals[team] += pts
+
+    def what_if(self, changes, marks):
+        """Totals after [(op, meet_event_id, athlete_id)] without touching this projection.
+
+        marks(athlete_id, meet_event_id) gives the mark for an added athlete.
+        Returns ({team: total}, {meet_event_id: rescored EventProjection}).
+        """
+        changed = {}
+        for op, me_id, aid in changes:
+            base = self.events.get(me_id)
+            if base is None:
+                continue
+            ev = changed.get(me_id) or base.copy()
+            if op == "add":
+                ev.ours[aid] = marks(aid, me_id)
+            else:
+                ev.ours.pop(aid, None)
+            changed[me_id] = ev
+
+        totals = defaultdict(float, self.totals)
+        for me_id, ev in changed.items():
+            for team, pts in self.events[me_id].totals.items():
+                totals[team] -= pts
+            ev.rescore(self.team)
+            for team, pts in ev.totals.items():
+                totals[team] += pts
+        return dict(totals), changed
@@ -0,0 +1,119 @@
+# backend/query_budget.py
+"""Per-request SQL statement budgets and N+1 detection.
+
+QueryTracker counts the statements each thread executes inside open scopes
+(one per request, plus any opened by tests). Statements are keyed by their
+SQL text: SQLAlchemy sends bound parameters separately, so a query repeated
+in a loop (the usual N+1) produces the same text every time, and counting
+by text is just a dict increment. statement_shape() normalizes the text for
+reports, folding literals and expanded IN lists.
+
+In tests:
+
+    with max_queries(12) as scope:
+        client.get(f"/api/meets/{meet_id}/page")
+
+raises QueryBudgetExceeded listing the statements when more than 12 ran (or
+when any statement repeated more than max_repeats times). It also works as a
+decorator.
+"""
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+REPEAT_THRESHOLD = 5  # the same statement this many times in one scope looks like N+1
+
+_IN_LIST_RE = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+|\$\d+|%s)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+|\$\d+|%s))+\s*\)")
+_NUMBER_RE = re.compile(r"\b\d+\b")
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_SPACE_RE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def statement_shape(sql):
+    """SQL text with literals and IN lists folded, for grouping and reports."""
+    s = _STRING_RE.sub("?", sql)
+    s = _NUMBER_RE.sub("?", s)
+    s = _IN_LIST_RE.sub("(...)", s)
+    return _SPACE_RE.sub(" ", s).strip()
+
+
+class QueryScope:
+    def __init__(self, label=None):
+        self.label = label
+        self.count = 0
+        self.statements = Counter()  # SQL text -> times executed
+
+    def repeated(self, threshold=REPEAT_THRESHOLD):
+        """[(shape, times)] for statements run at least threshold times, most first."""
+        shapes = Counter()
+        for sql, n in self.statements.items():
+            shapes[statement_shape(sql)] += n
+        return [(shape, n) for shape, n in shapes.most_common() if n >= threshold]
+
+    def problems(self, budget=None, threshold=REPEAT_THRESHOLD):
+        """Human-readable budget / N+1 findings; empty when the scope is within limits."""
+        out = []
+        if budget is not None and self.count > budget:
+            out.append(f"{self.count} SQL statements (budget {budget})")
+        for shape, n in self.repeated(threshold):
+            out.append(f"repeated {n}x: {shape[:300]}")
+        return out
+
+    def report(self):
+        return "\n".join(f"  {n}x {statement_shape(sql)[:300]}" for sql, n in self.statements.most_common())
+
+
+class QueryTracker:
+    def __init__(self):
+        self._local = threading.local()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def record(self, sql):
+        stack = getattr(self._local, "stack", None)
+        if stack:
+            for scope in stack:
+                scope.count += 1
+                scope.statements[sql] += 1
+
+    def push(self, label=None):
+        scope = QueryScope(label)
+        self._stack().append(scope)
+        return scope
+
+    def pop(self, scope):
+        stack = self._stack()
+        if scope in stack:
+            stack.remove(scope)
+        return scope
+
+    @contextmanager
+    def scope(self, label=None):
+        s = self.push(label)
+        try:
+            yield s
+        finally:
+            self.pop(s)
+
+
+tracker = QueryTracker()
+
+
+@contextmanager
+def max_queries(budget, max_repeats=None, label=None):
+    """Fail (QueryBudgetExceeded) if the block runs more than budget statements, or
+    any one statement more than max_repeats times."""
+    with tracker.scope(label) as s:
+        yield s
+    problems = s.problems(budget, threshold=max_repeats + 1 if max_repeats is not None else float("inf"))
+    if problems:
+        raise QueryBudgetExceeded(f"{label or 'block'}: " + "; ".join(problems) + "\n" + s.report())
@@ -0,0 +1,61 @@
+# backend/query_plans.py
+"""Sequential-scan detection in EXPLAIN output.
+
+The hot queries (meet page, meet list, roster panel, varsity aggregate) are
+expected to reach their rows through an index once tables have a realistic
+number of rows. These helpers read the plans each backend produces and return
+the tables that were read start to finish instead:
+
+  SQLite    EXPLAIN QUERY PLAN rows; "SCAN [TABLE] <table>" without "USING ... INDEX"
+  Postgres  EXPLAIN (FORMAT JSON); any "Seq Scan" node on the table
+"""
+import json
+import re
+
+# SQLite before 3.36 writes "SCAN TABLE <t>", later versions "SCAN <t>"
+SQLITE_SCAN_RE = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+
+def sqlite_seq_scans(plan_rows, tables):
+    """plan_rows: (id, parent, notused, detail) rows -> [table] scanned without an index."""
+    found = []
+    for row in plan_rows:
+        detail = row[-1]
+        m = SQLITE_SCAN_RE.match(detail)
+        # "USING INDEX" and "USING COVERING INDEX" are treated alike on purpose: either
+        # way the rows come through an index, which is all this check asks for
+        if m and m.group(1) in tables and " USING " not in detail:
+            found.append(m.group(1))
+    return found
+
+
+def postgres_seq_scans(plan, tables):
+    """plan: parsed EXPLAIN (FORMAT JSON) output -> [table] with a Seq Scan node."""
+    found = []
+    stack = [entry["Plan"] for entry in plan]
+    while stack:
+        node = stack.pop()
+        if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in tables:
+            found.append(node["Relation Name"])
+        stack.extend(node.get("Plans", ()))
+    return found
+
+
+def seq_scans(conn, sql, tables):
+    """Run EXPLAIN for sql (with literal values) on a SQLAlchemy connection -> (plan text, [table])."""
+    if conn.dialect.name == "postgresql":
+        plan = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + sql).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return json.dumps(plan, indent=1), postgres_seq_scans(plan, tables)
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql).all()
+    return "\n".join(row[-1] for row in rows), sqlite_seq_scans(rows, tables)
+
+
+def explain(conn, statement, parameters=None):
+    """Plan text for one statement as the DBAPI saw it (driver paramstyle and parameters)."""
+    if conn.dialect.name == "postgresql":
+        rows = conn.exec_driver_sql("EXPLAIN " + statement, parameters or ()).all()
+        return "\n".join(row[0] for row in rows)
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters or ()).all()
+    return "\n".join(row[-1] for row in rows)
@@ -0,0 +1,55 @@
+# backend/relays.py
+"""Relay leg selection across every relay in a meet.
+
+Each leg is projected from the athlete's open mark in the relay's distance
+(4x400 -> 400m) or an explicit split. Picking legs for all relays at once,
+with each athlete limited in how many more events they can run, is a
+min-cost assignment solved exactly by backend.lineup.assign_min_cost.
+
+Leg costs are normalized by the relay's best possible time, so a second
+saved in a 4x100 weighs more than a second in a 4x800.
+"""
+import re
+
+from backend.lineup import assign_min_cost
+
+LEGS = 4
+# leg run by the fastest .. slowest of the four: anchor, leadoff, third, second
+LEG_ORDER_BY_RANK = (4, 1, 3, 2)
+COST_SCALE = 1_000_000
+
+_RELAY_RE = re.compile(r"^\s*4\s*x\s*(\d+)", re.IGNORECASE)
+
+
+def open_distance(relay_name):
+    """'4x400' -> '400'; None for relays without a single open distance (medleys)."""
+    m = _RELAY_RE.match(relay_name or "")
+    return m.group(1) if m else None
+
+
+def order_legs(legs):
+    """[(athlete_id, mark)] -> [(leg, athlete_id, mark)] sorted by leg."""
+    ranked = sorted(legs, key=lambda x: (x[1], x[0]))
+    return sorted(
+        ((LEG_ORDER_BY_RANK[i], aid, mark) for i, (aid, mark) in enumerate(ranked[:LEGS])),
+        key=lambda x: x[0],
+    )
+
+
+def optimize_relays(marks, athlete_caps, time_limit=1.0):
+    """Fastest non-conflicting legs for every relay.
+
+    marks: {relay_key: {athlete_id: leg time ms}}; athlete_caps: {athlete_id: relays allowed}.
+    Returns ({relay_key: [(leg, athlete_id, mark)]}, optimal).
+    """
+    costs = {}
+    for relay, by_athlete in marks.items():
+        best = sum(sorted(by_athlete.values())[:LEGS]) or 1
+        for aid, mark in by_athlete.items():
+            costs[(aid, relay)] = round(mark * COST_SCALE / best)
+
+    chosen, optimal = assign_min_cost(costs, athlete_caps, {relay: LEGS for relay in marks}, time_limit)
+    legs = {relay: [] for relay in marks}
+    for aid, relay in chosen:
+        legs[relay].append((aid, marks[relay][aid]))
+    return {relay: order_legs(picked) for relay, picked in legs.items()}, optimal
@@ -1,13 +1,21 @@
 # backend/seed.py
+import argparse
+import csv
+import io
 import os
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
 from backend.app import (
     app, db,
-    Organization, Team, EventGroup, Event, Athlete, Season,
+    Organization, Team, EventGroup, Event, Athlete, Season, Meet, MeetEvent, MeetEntry,
     CURRENT_ORG_ID, CURRENT_ORG_NAME,
-    get_event_group_id,
+    get_event_group_id, mark_changed, rebuild_varsity_counts,
 )
+from backend.marks import format_time, format_distance
 
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 
 def seed_athletes():
     # Only seed if no athletes exist for this org
@@ -167,7 +175,298 @@ def seed():
         upsert_event("Throws", "Discus", "field", "outdoor", 170)
         db.session.commit()
 
-if __name__ == "__main__":
+
+# ---- Synthetic large-org data (load tests, query plans) ----
+#
+# Everything is drawn from one random.Random(random_seed), so the same arguments
+# always give the same rows. Rows get explicit ids after the current max and go
+# in with multi-row INSERTs (SQLite) or COPY (Postgres) on the session's
+# connection, so the caller decides whether to commit or roll back.
+
+FIRST_NAMES = {
+    "M": ["Liam", "Noah", "Ethan", "Jack", "Owen", "Mason", "Lucas", "Caleb", "Isaac", "Wyatt",
+          "Henry", "Leo", "Jayden", "Miles", "Eli", "Carter", "Mateo", "Gavin", "Aaron", "Dylan"],
+    "F": ["Ava", "Mia", "Zoe", "Ella", "Lily", "Emma", "Chloe", "Grace", "Nora", "Aria",
+          "Maya", "Ruby", "Layla", "Sofia", "Hazel", "Ivy", "Claire", "Naomi", "Alice", "Jade"],
+    "X": ["Riley", "Jordan", "Avery", "Quinn", "Rowan", "Sage"],
+}
+LAST_NAMES = ["Carter", "Reed", "Brooks", "Miller", "Hayes", "Nguyen", "Parker", "Johnson", "Brown",
+              "Martinez", "Garcia", "Kim", "Patel", "Lopez", "Walker", "Young", "Allen", "King",
+              "Wright", "Scott", "Torres", "Hill", "Green", "Adams", "Baker", "Nelson", "Rivera",
+              "Campbell", "Mitchell", "Roberts", "Turner", "Phillips", "Evans", "Collins", "Stewart"]
+GENDER_WEIGHTS = {"M": 49, "F": 49, "X": 2}
+GROUP_WEIGHTS = {"Sprints": 28, "Distance": 16, "Mid Distance": 12, "Jumps": 12, "Throws": 12,
+                 "Hurdles": 8, "PV": 4, "Relays": 4, "Multi": 4}
+ENTRIES_PER_MEET_WEIGHTS = {1: 15, 2: 30, 3: 35, 4: 20}  # events an athlete enters at a meet
+OFF_GROUP_ENTRY = 0.2   # chance an entry is outside the athlete's event group
+SCRATCHED = 0.04
+SEED_MARK = 0.8         # share of individual entries with a seed mark
+# typical high-school (mean, spread): seconds for track, meters for field
+TYPICAL_MARKS = {
+    "100m": (12.6, 0.8), "200m": (26.0, 1.8), "400m": (60.0, 4.5), "110H/100H": (17.5, 1.5),
+    "300H": (46.0, 3.5), "800m": (140.0, 12.0), "1600m": (330.0, 30.0), "3200m": (720.0, 60.0),
+    "Long Jump": (5.2, 0.6), "Triple Jump": (10.8, 1.1), "High Jump": (1.6, 0.15),
+    "Pole Vault": (3.0, 0.5), "Shot Put": (10.5, 1.8), "Discus": (30.0, 6.0),
+}
+COPY_BATCH = 100_000
+
+
+def _weighted(rng, weights):
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def bulk_insert(conn, table, columns, rows):
+    """Insert tuples with COPY (Postgres) or multi-row INSERTs (SQLite) -> row count."""
+    cursor = conn.connection.cursor()
+    count = 0
+    if conn.dialect.name == "postgresql":
+        sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            writer.writerow(row)  # None -> unquoted empty field -> NULL
+            count += 1
+            if count % COPY_BATCH == 0:
+                buf.seek(0)
+                cursor.copy_expert(sql, buf)
+                buf.seek(0)
+                buf.truncate()
+        if buf.tell():
+            buf.seek(0)
+            cursor.copy_expert(sql, buf)
+        return count
+
+    max_vars = 32766 if sqlite3.sqlite_version_info >= (3, 32) else 999
+    per_statement = max(1, min(500, max_vars // len(columns)))
+    one = "(" + ", ".join("?" * len(columns)) + ")"
+    head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    full_sql = head + ", ".join([one] * per_statement)
+    batch = []
+    for row in rows:
+        batch.extend(row)
+        count += 1
+        if count % per_statement == 0:
+            cursor.execute(full_sql, batch)
+            batch = []
+    if batch:
+        cursor.execute(head + ", ".join([one] * (len(batch) // len(columns))), batch)
+    return count
+
+
+def _next_id(column):
+    return (db.session.query(func.max(column)).scalar() or 0) + 1
+
+
+def _sync_sequences(conn, table_columns):
+    # explicit ids leave Postgres serial sequences behind
+    if conn.dialect.name == "postgresql":
+        for table, column in table_columns:
+            conn.exec_driver_sql(
+                f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+                f"(SELECT COALESCE(MAX({column}), 1) FROM {table}))"
+            )
+
+
+def _season_rows(seasons):
+    """(name, year, discipline) for the most recent `seasons`, newest last."""
+    out = []
+    year = 2025
+    while len(out) < seasons:
+        out.append((f"{year} Outdoor", year, "outdoor"))
+        if len(out) < seasons:
+            out.append((f"{year} Indoor", year, "indoor"))
+        year -= 1
+    return out[::-1]
+
+
+def generate(orgs=1, athletes=600, seasons=3, meets_per_season=8, attendance=0.7,
+             random_seed=0, commit=True):
+    """Add `orgs` synthetic orgs (teams, rosters, meets with meet events and entries).
+
+    Needs event groups and events (seed() with SEED_EVENTS=1). Returns counts per
+    table plus first_org_id / first_meet_id / first_athlete_id.
+    """
+    rng = random.Random(random_seed)
+    conn = db.session.connection()
+
+    events = (db.session.query(Event.event_id, Event.name, Event.event_type, Event.venue_type,
+                               Event.event_group_id, Event.sort_order)
+              .filter(Event.is_active == True).order_by(Event.sort_order, Event.event_id).all())
+    groups = {name: gid for gid, name in db.session.query(EventGroup.event_group_id, EventGroup.name)}
+    if not events or not groups:
+        raise ValueError("no events or event groups; run `python -m backend.seed` with SEED_EVENTS=1 first")
+    group_weights = {groups[name]: w for name, w in GROUP_WEIGHTS.items() if name in groups}
+    for gid in groups.values():
+        group_weights.setdefault(gid, 1)
+
+    season_ids = []
+    existing = {(s.name, s.year, s.discipline): s.season_id for s in Season.query}
+    for key in _season_rows(seasons):
+        if key not in existing:
+            season = Season(name=key[0], year=key[1], discipline=key[2])
+            db.session.add(season)
+            db.session.flush()
+            existing[key] = season.season_id
+        season_ids.append((existing[key], key[1], key[2]))
+
+    org0, team0, athlete0 = _next_id(Organization.org_id), _next_id(Team.team_id), _next_id(Athlete.athlete_id)
+    meet0, me0, entry0 = _next_id(Meet.meet_id), _next_id(MeetEvent.meet_event_id), _next_id(MeetEntry.meet_entry_id)
+
+    org_rows, team_rows, athlete_rows, meet_rows = [], [], [], []
+    rosters = {}  # org_id -> [(athlete_id, gender, event_group_id, skill)]
+    next_athlete = athlete0
+    for o in range(orgs):
+        org_id = org0 + o
+        org_rows.append((org_id, f"Synthetic Org {org_id}"))
+        team_ids = {}
+        for k, name in enumerate(("Varsity", "JV", "Freshman")):
+            team_ids[name] = team0 + 3 * o + k
+            team_rows.append((team_ids[name], org_id, name))
+        roster = rosters[org_id] = []
+        for _ in range(athletes):
+            gender = _weighted(rng, GENDER_WEIGHTS)
+            grad_year = 2026 + rng.randrange(4)
+            skill = rng.gauss(0, 1)
+            varsity = skill + (2029 - grad_year) * 0.35 > 0.9  # older and stronger athletes
+            team = "Varsity" if varsity else ("Freshman" if grad_year == 2029 else "JV")
+            group_id = _weighted(rng, group_weights)
+            active = rng.random() > 0.05
+            athlete_rows.append((
+                next_athlete, org_id, team_ids[team], group_id, varsity,
+                rng.choice(FIRST_NAMES[gender]), rng.choice(LAST_NAMES), gender,
+                rng.random() < 0.03, None, grad_year, active,
+            ))
+            if active and gender != "X":
+                roster.append((next_athlete, gender, group_id, skill))
+            next_athlete += 1
+
+    # meets: one every week of each season, varsity about half the time
+    meets = []  # (meet_id, org_id, venue)
+    next_meet = meet0
+    for o in range(orgs):
+        org_id = org0 + o
+        for season_id, year, discipline in season_ids:
+            venue = "indoor" if discipline == "indoor" else "outdoor"
+            opens = date(year, 1 if discipline == "indoor" else 3, 1)
+            for m in range(meets_per_season):
+                meet_date = opens + timedelta(days=7 * m + rng.randrange(5))
+                meet_rows.append((
+                    next_meet, org_id, f"{'Invitational' if m % 4 == 3 else 'Dual'} {m + 1}",
+                    meet_date.isoformat(), None,
+                    rng.random() < 0.5, venue, year < 2025 and rng.random() < 0.1, season_id, None, 0,
+                ))
+                meets.append((next_meet, org_id, venue))
+                next_meet += 1
+
+    # meet events: every available event for both genders, ids consecutive per meet
+    layout = {}  # venue -> [(event, gender)]
+    for venue in ("indoor", "outdoor"):
+        layout[venue] = [(e, g) for e in events if e.venue_type in (venue, "both") for g in "MF"]
+    me_base = {}  # meet_id -> first meet_event_id
+    next_me = me0
+    for meet_id, _, venue in meets:
+        me_base[meet_id] = next_me
+        next_me += len(layout[venue])
+
+    def meet_event_rows():
+        for meet_id, _, venue in meets:
+            for k, (e, gender) in enumerate(layout[venue]):
+                yield (me_base[meet_id] + k, meet_id, e.event_id, gender, e.sort_order, None, True, 0, None, None)
+
+    events_by_group = {}
+    for e in events:
+        events_by_group.setdefault(e.event_group_id, []).append(e)
+
+    def entry_rows():
+        next_entry = entry0
+        for meet_id, org_id, venue in meets:
+            slots = layout[venue]
+            if not slots:
+                continue
+            offset = {(e.event_id, g): k for k, (e, g) in enumerate(slots)}
+            available = [e for e, g in slots if g == "M"]
+            available_ids = {e.event_id for e in available}
+            own_by_group = {
+                gid: [e for e in group_events if e.event_id in available_ids]
+                for gid, group_events in events_by_group.items()
+            }
+            base = me_base[meet_id]
+            for athlete_id, gender, group_id, skill in rosters[org_id]:
+                if rng.random() >= attendance:
+                    continue
+                own = own_by_group.get(group_id)
+                wanted = min(_weighted(rng, ENTRIES_PER_MEET_WEIGHTS), len(available))
+                chosen = {}
+                while len(chosen) < wanted:
+                    e = rng.choice(own) if own and rng.random() > OFF_GROUP_ENTRY else rng.choice(available)
+                    chosen[e.event_id] = e
+                for e in chosen.values():
+                    seed_time = seed_mark = seed_ms = seed_mm = None
+                    typical = TYPICAL_MARKS.get(e.name)
+                    if typical and rng.random() < SEED_MARK:
+                        mean, spread = typical
+                        form = skill + rng.gauss(0, 0.3)
+                        if e.event_type == "field":
+                            seed_mm = max(100, round((mean + spread * form) * 100) * 10)
+                            seed_mark = format_distance(seed_mm)
+                        else:
+                            seed_ms = max(1000, round((mean - spread * form) * 100) * 10)
+                            seed_time = format_time(seed_ms)
+                    status = "scratched" if rng.random() < SCRATCHED else "entered"
+                    yield (next_entry, base + offset[(e.event_id, gender)], athlete_id, status,
+                           seed_time, seed_mark, None, None, None, seed_ms, seed_mm)
+                    next_entry += 1
+
+    counts = {
+        "organizations": bulk_insert(conn, "organizations", ("org_id", "name"), org_rows),
+        "teams": bulk_insert(conn, "teams", ("team_id", "org_id", "name"), team_rows),
+        "athletes": bulk_insert(conn, "athletes", (
+            "athlete_id", "org_id", "team_id", "event_group_id", "varsity", "first_name", "last_name",
+            "gender", "unavailable", "expected_return", "grad_year", "is_active"), athlete_rows),
+        "meets": bulk_insert(conn, "meets", (
+            "meet_id", "org_id", "name", "meet_date", "location", "is_varsity", "venue_type",
+            "is_archived", "season_id", "notes", "page_version"), meet_rows),
+        "meet_events": bulk_insert(conn, "meet_events", (
+            "meet_event_id", "meet_id", "event_id", "gender", "sort_order", "max_entries",
+            "is_scored", "entries_version", "start_minute", "duration_minutes"), meet_event_rows()),
+        "meet_entries": bulk_insert(conn, "meet_entries", (
+            "meet_entry_id", "meet_event_id", "athlete_id", "entry_status", "seed_time", "seed_mark",
+            "heat", "lane", "relay_leg", "seed_time_ms", "seed_mark_mm"), entry_rows()),
+    }
+    _sync_sequences(conn, [
+        ("organizations", "org_id"), ("teams", "team_id"), ("athletes", "athlete_id"),
+        ("meets", "meet_id"), ("meet_events", "meet_event_id"), ("meet_entries", "meet_entry_id"),
+    ])
+    mark_changed("organizations", "teams", "athletes", "meets")
+    if commit:
+        db.session.commit()
+        rebuild_varsity_counts()
+    counts.update(first_org_id=org0, first_meet_id=meet0, first_athlete_id=athlete0)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed reference data, or generate a large synthetic dataset.")
+    sub = parser.add_subparsers(dest="command")
+    gen = sub.add_parser("generate", help="add synthetic orgs, rosters, meets and entries")
+    gen.add_argument("--orgs", type=int, default=1)
+    gen.add_argument("--athletes", type=int, default=600, help="athletes per org")
+    gen.add_argument("--seasons", type=int, default=3)
+    gen.add_argument("--meets-per-season", type=int, default=8)
+    gen.add_argument("--attendance", type=float, default=0.7, help="chance an athlete competes at a meet")
+    gen.add_argument("--random-seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
     with app.app_context():   # ✅ this is the key
         seed()
+        if args.command == "generate":
+            started = time.perf_counter()
+            counts = generate(args.orgs, args.athletes, args.seasons, args.meets_per_season,
+                              args.attendance, args.random_seed)
+            print(", ".join(f"{k}={v}" for k, v in counts.items()),
+                  f"in {time.perf_counter() - started:.1f}s")
     print("Seed complete.")
+
+
+if __name__ == "__main__":
+    main()
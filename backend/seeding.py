@@ -0,0 +1,93 @@
+# backend/seeding.py
+"""Heat and lane (or flight and order) assignment for one meet event.
+
+Pure functions over plain tuples so a whole meet can be seeded in memory and
+written back in bulk. Entries are (meet_entry_id, mark) where mark is the
+normalized seed from backend.marks (ms for track/relay, mm for field) or None.
+
+  fastest_last  timed finals: best marks in the last heat, which is full; the
+                first heat takes the remainder but never runs with fewer than
+                MIN_HEAT_SIZE when that can be avoided
+  serpentine    prelims: ranks snake across heats (1-2-3-3-2-1...) so heats
+                are balanced
+
+Within a heat the best seed gets the preferred lane (center out: 4,5,3,6,2,7,1,8
+for an 8-lane track). Field events get flights instead of heats and a
+competition order instead of lanes, best marks competing last.
+"""
+import math
+
+METHODS = ("fastest_last", "serpentine")
+MIN_HEAT_SIZE = 3
+
+
+def lane_preference(lanes):
+    """Lanes ordered best-first: center out, lower lane on ties."""
+    center = (lanes + 1) / 2
+    return sorted(range(1, lanes + 1), key=lambda lane: (abs(lane - center), lane))
+
+
+def rank_entries(entries, higher_is_better=False):
+    """Best first; unseeded (None) last, ties by meet_entry_id for stable output."""
+    seeded = [e for e in entries if e[1] is not None]
+    seeded.sort(key=lambda e: (-e[1] if higher_is_better else e[1], e[0]))
+    unseeded = sorted((e for e in entries if e[1] is None), key=lambda e: e[0])
+    return seeded + unseeded
+
+
+def heat_sizes(n, per_heat):
+    """Sizes of heats 1..H for fastest_last: later heats full, first heat the remainder."""
+    if n <= 0:
+        return []
+    heats = math.ceil(n / per_heat)
+    sizes = [per_heat] * heats
+    sizes[0] = n - per_heat * (heats - 1)
+    if heats > 1 and sizes[0] < MIN_HEAT_SIZE:
+        borrow = max(0, min(MIN_HEAT_SIZE - sizes[0], sizes[1] - MIN_HEAT_SIZE))
+        sizes[0] += borrow
+        sizes[1] -= borrow
+    return sizes
+
+
+def seed_event(entries, per_heat=8, method="fastest_last", field=False):
+    """[(meet_entry_id, heat, lane)] for one event's entered athletes.
+
+    per_heat is the lane count (track) or flight size (field).
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {', '.join(METHODS)}")
+    if per_heat < 1:
+        raise ValueError("per_heat must be at least 1")
+
+    ranked = rank_entries(entries, higher_is_better=field)
+    n = len(ranked)
+    if not n:
+        return []
+
+    # heats[h] = entry ids in seed order (best first), heat index 0 runs first
+    if method == "serpentine":
+        count = math.ceil(n / per_heat)
+        heats = [[] for _ in range(count)]
+        for i, entry in enumerate(ranked):
+            lap, pos = divmod(i, count)
+            h = pos if lap % 2 == 0 else count - 1 - pos
+            heats[h].append(entry[0])
+        heats.reverse()  # top seed runs in the last heat
+    else:
+        sizes = heat_sizes(n, per_heat)
+        heats, start = [], n
+        for size in sizes:
+            heats.append([e[0] for e in ranked[start - size:start]])
+            start -= size
+
+    out = []
+    if field:
+        for h, ids in enumerate(heats, start=1):
+            for order, entry_id in enumerate(reversed(ids), start=1):
+                out.append((entry_id, h, order))
+    else:
+        prefs = lane_preference(per_heat)
+        for h, ids in enumerate(heats, start=1):
+            for entry_id, lane in zip(ids, prefs):
+                out.append((entry_id, h, lane))
+    return out
@@ -25,10 +25,17 @@ document.addEventListener("DOMContentLoaded", () => {
   const filterGender = document.getElementById("filterGender");
   const filterUnavailable = document.getElementById("filterUnavailable");
   const showInactive = document.getElementById("showInactive");
+  const loadMoreBtn = document.getElementById("loadMoreBtn");
+  const rosterSentinel = document.getElementById("rosterSentinel");
+
+  const PAGE_SIZE = 100;
 
   let TEAMS = [];
   let EVENT_GROUPS = [];
-  let ATHLETES = []; // latest fetched from API
+  let ATHLETES = []; // pages fetched so far for the current filters
+  let nextCursor = null;
+  let rosterLoading = false;
+  let rosterGeneration = 0; // bumps on every filter change so stale pages are dropped
 
   function escapeHtml(s) {
     return String(s ?? "")
@@ -50,10 +57,21 @@ document.addEventListener("DOMContentLoaded", () => {
       .join("");
   }
 
+  // url -> { etag, body }; GETs revalidate with If-None-Match and reuse the body on 304
+  const etagCache = new Map();
+
   async function fetchJSON(url) {
-    const res = await fetch(url);
+    const cached = etagCache.get(url);
+    const res = await fetch(url, {
+      cache: "no-store",
+      headers: cached ? { "If-None-Match": cached.etag } : {},
+    });
+    if (res.status === 304 && cached) return cached.body;
     if (!res.ok) throw new Error(`Request failed: ${url}`);
-    return await res.json();
+    const body = await res.json();
+    const etag = res.headers.get("ETag");
+    if (etag) etagCache.set(url, { etag, body });
+    return body;
   }
 
   async function createAthlete(payload) {
@@ -69,17 +87,79 @@ document.addEventListener("DOMContentLoaded", () => {
     return await res.json();
   }
 
-  async function patchAthlete(id, payload) {
-    const res = await fetch(`/api/athletes/${id}`, {
+  async function patchAthletes(updates) {
+    const res = await fetch("/api/athletes", {
       method: "PATCH",
       headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(payload),
+      body: JSON.stringify(updates),
     });
     if (!res.ok) {
       const err = await res.json().catch(() => ({}));
       throw new Error(err.error || "Update failed");
     }
-    return await res.json();
+    return (await res.json()).results;
+  }
+
+  // ---- Coalesced inline edits ----
+  // Cell changes are merged per athlete and sent as one batch PATCH shortly
+  // after the last edit, instead of one request per cell.
+  const PATCH_DELAY_MS = 300;
+  let pendingEdits = new Map(); // athlete_id -> { field: value }
+  let flushTimer = null;
+  let flushing = null;
+
+  function setRowStatus(id, text) {
+    const statusCell = document.querySelector(`[data-status-for="${id}"]`);
+    if (statusCell) statusCell.textContent = text;
+  }
+
+  function queueEdit(id, changes, delay = PATCH_DELAY_MS) {
+    pendingEdits.set(String(id), { ...(pendingEdits.get(String(id)) || {}), ...changes });
+    setRowStatus(id, "saving…");
+    clearTimeout(flushTimer);
+    flushTimer = setTimeout(() => flushEdits().catch((err) => alert(err.message)), delay);
+  }
+
+  async function flushEdits() {
+    if (flushing) await flushing; // keep batches in order
+    if (!pendingEdits.size) return;
+
+    const batch = pendingEdits;
+    pendingEdits = new Map();
+    const updates = Array.from(batch, ([id, changes]) => ({ athlete_id: Number(id), changes }));
+
+    flushing = (async () => {
+      let results;
+      try {
+        results = await patchAthletes(updates);
+      } catch (err) {
+        batch.forEach((_, id) => setRowStatus(id, "error"));
+        await refreshRoster();
+        throw err;
+      }
+
+      const errors = [];
+      for (const r of results) {
+        if (r.ok && r.athlete) {
+          const idx = ATHLETES.findIndex((a) => String(a.athlete_id) === String(r.athlete_id));
+          if (idx !== -1) ATHLETES[idx] = r.athlete;
+        } else if (!r.ok) {
+          errors.push(`#${r.athlete_id}: ${r.error}`);
+        }
+      }
+      renderTable();
+      for (const r of results) {
+        setRowStatus(r.athlete_id, r.ok ? "saved" : "error");
+        if (r.ok) setTimeout(() => setRowStatus(r.athlete_id, ""), 800);
+      }
+      if (errors.length) alert(errors.join("\n"));
+    })();
+
+    try {
+      await flushing;
+    } finally {
+      flushing = null;
+    }
   }
 
   function isValidNewAthlete() {
@@ -119,30 +199,40 @@ document.addEventListener("DOMContentLoaded", () => {
     refreshAddButtonState();
   }
 
-  async function loadAthletesFromApi() {
-    const include = showInactive.checked ? "true" : "false";
-    ATHLETES = await fetchJSON(`/api/athletes?include_inactive=${include}`);
+  // Filters are applied server-side; the API returns name-sorted pages.
+  function rosterQuery(cursor) {
+    const params = new URLSearchParams({
+      include_inactive: showInactive.checked ? "true" : "false",
+      limit: String(PAGE_SIZE),
+    });
+    const q = searchName.value.trim();
+    if (q) params.set("q", q);
+    if (filterTeam.value) params.set("team_id", filterTeam.value);
+    if (filterEventGroup.value) params.set("event_group_id", filterEventGroup.value);
+    if (filterGender.value) params.set("gender", filterGender.value);
+    if (filterUnavailable.checked) params.set("unavailable", "false");
+    if (cursor) params.set("cursor", cursor);
+    return `/api/athletes?${params}`;
   }
 
-  function getFilteredAthletes() {
-    const q = searchName.value.trim().toLowerCase();
-    const teamId = filterTeam.value;
-    const egId = filterEventGroup.value;
-    const gender = filterGender.value;
-    const hideUnavailableOnly = filterUnavailable.checked;
-
-    return ATHLETES.filter((a) => {
-      if (teamId && String(a.team_id) !== String(teamId)) return false;
-      if (egId && String(a.event_group_id) !== String(egId)) return false;
-      if (gender && a.gender !== gender) return false;
-      if (hideUnavailableOnly && a.unavailable) return false;
-
-      if (q) {
-        const full = `${a.first_name} ${a.last_name}`.toLowerCase();
-        if (!full.includes(q)) return false;
-      }
-      return true;
-    });
+  async function loadNextPage() {
+    if (rosterLoading) return;
+    const generation = rosterGeneration;
+    rosterLoading = true;
+    try {
+      const page = await fetchJSON(rosterQuery(nextCursor));
+      if (generation !== rosterGeneration) return; // filters changed mid-flight
+      ATHLETES = ATHLETES.concat(page.items);
+      nextCursor = page.next_cursor;
+    } finally {
+      rosterLoading = false;
+    }
+    renderTable();
+  }
+
+  async function loadMoreIfAny() {
+    if (!nextCursor) return;
+    await loadNextPage();
   }
 
   function renderIntoTbody(tbody, athletesList) {
@@ -222,14 +312,8 @@ document.addEventListener("DOMContentLoaded", () => {
   }
 
 function renderTable() {
-  const filtered = getFilteredAthletes();
-
-  // sort by last name, then first name
-  filtered.sort((a, b) => {
-    const last = a.last_name.localeCompare(b.last_name);
-    if (last !== 0) return last;
-    return a.first_name.localeCompare(b.first_name);
-  });
+  // pages already arrive sorted by last name, then first name
+  const filtered = ATHLETES;
 
   const male = filtered.filter((a) => a.gender === "M");
   const female = filtered.filter((a) => a.gender === "F");
@@ -246,11 +330,23 @@ function renderTable() {
     xSection.style.display = "none";
     tbodyX.innerHTML = "";
   }
+
+  loadMoreBtn.style.display = nextCursor ? "" : "none";
 }
 
+  // Re-fetch from the first page (filters changed or a row was edited).
   async function refreshRoster() {
-    await loadAthletesFromApi();
-    renderTable();
+    rosterGeneration += 1;
+    ATHLETES = [];
+    nextCursor = null;
+    rosterLoading = false;
+    await loadNextPage();
+  }
+
+  let searchTimer = null;
+  function refreshRosterDebounced() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(() => refreshRoster().catch((err) => alert(err.message)), 250);
   }
 
   // Add athlete
@@ -303,18 +399,7 @@ function renderTable() {
           ? el.checked
           : el.value;
 
-      const statusCell = document.querySelector(`[data-status-for="${id}"]`);
-      try {
-        statusCell.textContent = "saving…";
-        await patchAthlete(id, { [field]: value });
-        statusCell.textContent = "saved";
-        setTimeout(() => (statusCell.textContent = ""), 800);
-        await refreshRoster(); // optional, but keeps everything consistent
-      } catch (err) {
-        statusCell.textContent = "error";
-        alert(err.message);
-        await refreshRoster();
-      }
+      queueEdit(id, { [field]: value });
     });
 
     tb.addEventListener("click", async (e) => {
@@ -327,29 +412,33 @@ function renderTable() {
         : unarchiveBtn.dataset.unarchiveId;
 
       const newStatus = archiveBtn ? "N" : "Y";
-      const statusCell = document.querySelector(`[data-status-for="${id}"]`);
 
+      // archiving changes which rows match the filters, so flush now and refetch
+      queueEdit(id, { is_active: newStatus }, 0);
       try {
-        statusCell.textContent = archiveBtn ? "archiving…" : "unarchiving…";
-        await patchAthlete(id, { is_active: newStatus });
-        statusCell.textContent = archiveBtn ? "archived" : "restored";
+        await flushEdits();
         await refreshRoster();
       } catch (err) {
-        statusCell.textContent = "error";
         alert(err.message);
-        await refreshRoster();
       }
     });
   });
 
-  // Filters re-render without refetch (fast)
-  [searchName, filterTeam, filterEventGroup, filterGender, filterUnavailable].forEach((el) => {
-    el.addEventListener("input", renderTable);
-    el.addEventListener("change", renderTable);
+  // Filters refetch from the first page
+  searchName.addEventListener("input", refreshRosterDebounced);
+  [filterTeam, filterEventGroup, filterGender, filterUnavailable, showInactive].forEach((el) => {
+    el.addEventListener("change", refreshRoster);
   });
 
-  // Show inactive changes API fetch behavior
-  showInactive.addEventListener("change", refreshRoster);
+  // Lazy paging: button as a fallback, sentinel for scroll-to-load
+  loadMoreBtn.addEventListener("click", () => loadMoreIfAny().catch((err) => alert(err.message)));
+  if ("IntersectionObserver" in window) {
+    new IntersectionObserver((entries) => {
+      if (entries.some((en) => en.isIntersecting)) {
+        loadMoreIfAny().catch((err) => console.error(err));
+      }
+    }).observe(rosterSentinel);
+  }
 
   // Form validation wiring
   [teamSelect, eventGroupSelect, genderSelect, varsityEl, firstEl, lastEl, availEl, expectedEl, gradEl].forEach((el) => {
@@ -9,6 +9,9 @@ let seasonsCache = []; // [{season_id, name, year, discipline}]
 
 let pageAthletes = [];
 let pageMeetEvents = [];
+let pageConflicts = new Set(); // "meet_event_id:athlete_id" entries that overlap another of the athlete's events
+let pageVersion = null; // version of the loaded page, for ?since= deltas
+let pageKey = null;     // `${meetId}:${gender}` the version belongs to
 let filtersWired = false;
 
 const elMeetList = document.getElementById("meetList");
@@ -30,6 +33,9 @@ const elAthletesCol = document.getElementById("athletesCol");
 const btnNewMeet = document.getElementById("btnNewMeet");
 const btnAddEvent = document.getElementById("btnAddEvent");
 const btnArchiveMeet = document.getElementById("btnArchiveMeet");
+const btnCloneMeet = document.getElementById("btnCloneMeet");
+const btnSeedMeet = document.getElementById("btnSeedMeet");
+const btnOptimizeLineup = document.getElementById("btnOptimizeLineup");
 
 const createBackdrop = document.getElementById("meetCreateBackdrop");
 const btnCloseCreate = document.getElementById("btnCloseCreate");
@@ -105,22 +111,34 @@ function setStatus(msg) {
   elStatus.textContent = msg || "";
 }
 
+// url -> { etag, json }; GETs revalidate with If-None-Match and reuse the body on 304
+const etagCache = new Map();
+
 async function api(url, opts = {}) {
+  const isGet = !opts.method || opts.method.toUpperCase() === "GET";
+  const cached = isGet ? etagCache.get(url) : null;
   const res = await fetch(url, {
-    headers: { "Content-Type": "application/json" },
+    ...(isGet ? { cache: "no-store" } : {}),
     ...opts,
+    headers: {
+      "Content-Type": "application/json",
+      ...(cached ? { "If-None-Match": cached.etag } : {}),
+      ...(opts.headers || {}),
+    },
   });
+  if (res.status === 304 && cached) return cached.json;
   const text = await res.text();
   let json = null;
   try { json = text ? JSON.parse(text) : null; } catch {}
   if (!res.ok) throw new Error(json?.error || `${res.status} ${res.statusText}`);
+  const etag = isGet ? res.headers.get("ETag") : null;
+  if (etag) etagCache.set(url, { etag, json });
   return json;
 }
 
 // --------load seasons -------
 async function loadSeasons() {
-  // cache so we don't refetch constantly
-  if (seasonsCache.length) return seasonsCache;
+  // cheap: api() revalidates with the stored ETag and gets a 304 when unchanged
   seasonsCache = await api("/api/seasons");
   return seasonsCache;
 }
@@ -301,6 +319,7 @@ btnArchiveMeet.addEventListener("click", async () => {
       // Archived meet disappears from list; close editor view
       currentMeetId = null;
       selectedMeetEventId = null;
+      watchMeet(null);
       elMeetEditor.style.display = "none";
       elMeetActions.style.display = "none";
       elMeetHeader.textContent = "Meet archived. Select another meet on the left.";
@@ -316,6 +335,80 @@ btnArchiveMeet.addEventListener("click", async () => {
     setStatus("");
   }
 });
+btnCloneMeet.addEventListener("click", async () => {
+  if (!currentMeetId || !currentMeet) return;
+
+  const name = prompt("Name for the new meet:", `${currentMeet.name} (copy)`);
+  if (name === null) return;
+  const includeEntries = confirm("Copy entries too? (inactive and unavailable athletes are skipped)");
+
+  try {
+    setStatus("cloning…");
+    const meet = await api(`/api/meets/${currentMeetId}/clone`, {
+      method: "POST",
+      body: JSON.stringify({ name: name.trim(), include_entries: includeEntries }),
+    });
+    await loadMeets();
+    await openMeet(meet.meet_id);
+  } catch (e) {
+    alert(e.message);
+  } finally {
+    setStatus("");
+  }
+});
+
+btnSeedMeet.addEventListener("click", async () => {
+  if (!currentMeetId) return;
+
+  const lanes = prompt("Lanes per heat:", "8");
+  if (lanes === null) return;
+  const serpentine = confirm("Serpentine seeding (prelims)? Cancel seeds timed finals, fastest heat last.");
+
+  try {
+    setStatus("seeding…");
+    await api(`/api/meets/${currentMeetId}/seed`, {
+      method: "POST",
+      body: JSON.stringify({
+        gender: currentGender,
+        lanes: Number(lanes) || 8,
+        method: serpentine ? "serpentine" : "fastest_last",
+      }),
+    });
+    await loadMeetPage();
+  } catch (e) {
+    alert(e.message);
+  } finally {
+    setStatus("");
+  }
+});
+
+btnOptimizeLineup.addEventListener("click", async () => {
+  if (!currentMeetId) return;
+
+  const scoring = prompt("Scoring (dual, tri, invitational):", "dual");
+  if (scoring === null) return;
+  const body = { gender: currentGender, scoring: scoring.trim() || "dual" };
+
+  try {
+    setStatus("optimizing…");
+    const plan = await api(`/api/meets/${currentMeetId}/lineup`, { method: "POST", body: JSON.stringify(body) });
+    const ok = confirm(
+      `Projected ${plan.projected_points} pts with ${plan.entries.length} entries ` +
+      `(${plan.operations.length} changes). Replace this gender's individual entries?`
+    );
+    if (!ok) return;
+    await api(`/api/meets/${currentMeetId}/lineup`, {
+      method: "POST",
+      body: JSON.stringify({ ...body, apply: true }),
+    });
+    await loadMeetPage();
+  } catch (e) {
+    alert(e.message);
+  } finally {
+    setStatus("");
+  }
+});
+
 // -------------athlete event count function
 function buildAthleteEntryCountMap(meetEvents = []) {
   const counts = new Map(); // key: String(athlete_id) -> number
@@ -330,10 +423,105 @@ function buildAthleteEntryCountMap(meetEvents = []) {
   return counts;
 }
 
+// -------------------- Batched entry edits --------------------
+// Clicks add/remove entries locally right away and are sent to the bulk
+// endpoint together once the coach pauses, instead of one request per click.
+const ENTRY_FLUSH_MS = 250;
+let pendingEntryOps = []; // [{ meetId, operation }]: the meet the click was made in
+let entryFlushTimer = null;
+let entryFlushing = null;
+
+function queueEntryOp(meetEventId, athleteId, op) {
+  const me = pageMeetEvents.find((x) => String(x.meet_event_id) === String(meetEventId));
+  if (me) {
+    if (op === "add") {
+      const a = pageAthletes.find((x) => String(x.athlete_id) === String(athleteId));
+      if (a && !(me.entries || []).some((e) => String(e.athlete_id) === String(athleteId))) {
+        const { first_name, last_name, gender, unavailable } = a;
+        me.entries = [...(me.entries || []), { athlete_id: a.athlete_id, first_name, last_name, gender, unavailable }]
+          .sort((x, y) => x.last_name.localeCompare(y.last_name) || x.first_name.localeCompare(y.first_name));
+      }
+    } else {
+      me.entries = (me.entries || []).filter((e) => String(e.athlete_id) !== String(athleteId));
+    }
+    renderEvents(pageMeetEvents);
+    rerenderAthletes();
+  }
+
+  pendingEntryOps.push({
+    meetId: currentMeetId,
+    operation: { meet_event_id: Number(meetEventId), athlete_id: Number(athleteId), op },
+  });
+  clearTimeout(entryFlushTimer);
+  entryFlushTimer = setTimeout(() => flushEntryOps().catch((e) => alert(e.message)), ENTRY_FLUSH_MS);
+}
+
+async function flushEntryOps() {
+  if (entryFlushing) await entryFlushing; // keep batches in order
+  if (!pendingEntryOps.length) return;
+
+  const byMeet = new Map(); // meetId -> operations, in click order
+  pendingEntryOps.forEach(({ meetId, operation }) => byMeet.set(meetId, [...(byMeet.get(meetId) || []), operation]));
+  pendingEntryOps = [];
+
+  entryFlushing = (async () => {
+    try {
+      const failed = [];
+      for (const [meetId, operations] of byMeet) {
+        const res = await api(`/api/meets/${meetId}/entries/bulk`, {
+          method: "POST",
+          body: JSON.stringify({ operations }),
+        });
+        failed.push(...res.results.filter((r) => !r.ok));
+      }
+      if (failed.length) alert(failed.map((r) => r.error).join("\n"));
+    } finally {
+      await loadMeetPage(); // delta via ?since=, also undoes any rejected local change
+    }
+  })();
+
+  try {
+    await entryFlushing;
+  } finally {
+    entryFlushing = null;
+  }
+}
+
+// -------------------- Live updates (SSE) --------------------
+let meetStream = null;
+let streamReloadTimer = null;
+
+function onMeetStreamEvent(e) {
+  const change = JSON.parse(e.data);
+  if (change.gender && change.gender !== currentGender) return;
+  // already reflected (e.g. our own edit, which reloads the page itself)
+  const loaded = Number(String(pageVersion || "").split(".")[0]);
+  if (pageKey === `${currentMeetId}:${currentGender}` && change.page_version <= loaded) return;
+
+  clearTimeout(streamReloadTimer);
+  streamReloadTimer = setTimeout(() => loadMeetPage().catch((err) => console.error(err)), 150);
+}
+
+function watchMeet(meetId) {
+  if (meetStream) meetStream.close();
+  meetStream = null;
+  if (!meetId || !("EventSource" in window)) return;
+
+  meetStream = new EventSource(`/api/meets/${meetId}/stream`);
+  ["entry_added", "entry_removed", "meet_event_added", "entries_seeded", "results_added", "schedule_changed"].forEach((type) =>
+    meetStream.addEventListener(type, onMeetStreamEvent)
+  );
+}
+
 // -------------------- Meet editor --------------------
 async function openMeet(meetId) {
+  // send the previous meet's queued clicks now rather than after the switch
+  clearTimeout(entryFlushTimer);
+  flushEntryOps().catch((e) => alert(e.message));
+
   currentMeetId = meetId;
   selectedMeetEventId = null;
+  watchMeet(meetId);
 
   elMeetEditor.style.display = "none";
   elMeetHeader.textContent = "Loading meet…";
@@ -345,7 +533,26 @@ async function loadMeetPage() {
   if (!currentMeetId) return;
 
   setStatus("loading meet…");
-  const data = await api(`/api/meets/${currentMeetId}/page?gender=${currentGender}`);
+  const key = `${currentMeetId}:${currentGender}`;
+  const since = key === pageKey && pageVersion ? `&since=${encodeURIComponent(pageVersion)}` : "";
+  let data = await api(`/api/meets/${currentMeetId}/page?gender=${currentGender}${since}`);
+
+  if (data.delta) {
+    // merge changed meet events; anything unknown means the list itself changed
+    const byId = new Map(pageMeetEvents.map((me) => [me.meet_event_id, me]));
+    if (data.meet_events.some((me) => !byId.has(me.meet_event_id))) {
+      data = await api(`/api/meets/${currentMeetId}/page?gender=${currentGender}`);
+    } else {
+      data.meet_events.forEach((me) => byId.set(me.meet_event_id, me));
+      data = {
+        ...data,
+        meet_events: pageMeetEvents.map((me) => byId.get(me.meet_event_id)),
+        athletes: data.athletes || pageAthletes, // only sent when the roster changed
+      };
+    }
+  }
+  pageKey = key;
+  pageVersion = data.version;
 
   currentMeet = data.meet;
   await loadSeasons();
@@ -379,6 +586,9 @@ async function loadMeetPage() {
 
   pageMeetEvents = data.meet_events || [];
   pageAthletes = data.athletes || [];
+  pageConflicts = new Set(
+    (data.conflicts || []).flatMap((c) => c.meet_event_ids.map((id) => `${id}:${c.athlete_id}`))
+  );
   renderEvents(pageMeetEvents);
   initAthleteFilters(pageAthletes);
   rerenderAthletes();
@@ -401,10 +611,11 @@ function renderEvents(meetEvents) {
     const entriesHtml = (me.entries || [])
       .map((a) => `
         <span
-          class="pill${a.unavailable ? " pill-unavailable" : ""}"
+          class="pill${a.unavailable ? " pill-unavailable" : ""}${pageConflicts.has(`${me.meet_event_id}:${a.athlete_id}`) ? " pill-conflict" : ""}"
           data-athlete-id="${a.athlete_id}"
+          ${a.pr ? `title="PR ${a.pr}${a.sb ? ` · SB ${a.sb}` : ""}"` : ""}
         >
-          ${a.last_name}, ${a.first_name}
+          ${a.last_name}, ${a.first_name}${a.heat ? ` <span class="muted">H${a.heat}-${a.lane}</span>` : ""}${a.relay_leg ? ` <span class="muted">leg ${a.relay_leg}</span>` : ""}
         </span>
       `)
       .join("");
@@ -413,6 +624,7 @@ function renderEvents(meetEvents) {
       <div class="row">
         <div class="event-title-row">
           <strong>${me.event_name}</strong>
+          ${me.start_time ? `<span class="muted">${me.start_time}</span>` : ""}
           <span class="muted event-group">${me.event_group || ""}</span>
         </div>
         <div class="muted">#${me.meet_event_id}</div>
@@ -422,20 +634,17 @@ function renderEvents(meetEvents) {
       </div>
     `;
 
-    div.addEventListener("click", () => {
-      selectedMeetEventId = me.meet_event_id;
-      // rerender selection highlight (cheap way)
-      loadMeetPage().catch((e) => alert(e.message));
-    });
-
-    // Allow removing an athlete by clicking their pill (nice little MVP)
-    div.addEventListener("click", async (e) => {
+    div.addEventListener("click", (e) => {
+      // Allow removing an athlete by clicking their pill (nice little MVP)
       const pill = e.target.closest("[data-athlete-id]");
-      if (!pill) return;
-      e.stopPropagation();
-      const athleteId = pill.dataset.athleteId;
-      await api(`/api/meet-events/${me.meet_event_id}/entries/${athleteId}`, { method: "DELETE" });
-      await loadMeetPage();
+      if (pill) {
+        queueEntryOp(me.meet_event_id, pill.dataset.athleteId, "remove");
+        return;
+      }
+      selectedMeetEventId = me.meet_event_id;
+      // rerender selection highlight locally; no refetch needed
+      renderEvents(pageMeetEvents);
+      rerenderAthletes();
     });
 
     elEventsCol.appendChild(div);
@@ -479,15 +688,7 @@ function renderAthletes(athletes, selectedSet = new Set(), entryCountMap = new M
       // optional: prevent duplicate add spam
       if (isSelected) return;
 
-      try {
-        await api(`/api/meet-events/${selectedMeetEventId}/entries`, {
-          method: "POST",
-          body: JSON.stringify({ athlete_id: a.athlete_id }),
-        });
-        await loadMeetPage();
-      } catch (e) {
-        alert(e.message);
-      }
+      queueEntryOp(selectedMeetEventId, a.athlete_id, "add");
     });
 
     elAthletesCol.appendChild(div);
@@ -522,8 +723,7 @@ function renderAddEventOptions(events) {
 }
 
 async function ensureEventsLoaded() {
-  if (eventsCache.length) return eventsCache;
-  eventsCache = await api("/api/events");
+  eventsCache = await api("/api/events"); // revalidated via ETag
   return eventsCache;
 }
 
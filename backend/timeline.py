@@ -0,0 +1,85 @@
+# backend/timeline.py
+"""Meet timeline estimates.
+
+Track events run one after another on the track, in meet order; each takes
+(heats x minutes per heat) plus a changeover. Field events each have their
+own venue and run in parallel from the start, one flight after another.
+Times are minutes after midnight.
+"""
+import math
+import re
+
+CHANGEOVER = 2
+# minutes per heat by distance (m); the first row whose limit covers the race applies
+HEAT_MINUTES = ((200, 3), (400, 4), (800, 5), (1600, 8), (3200, 14))
+RELAY_HEAT_MINUTES = {"4x100": 4, "4x200": 5, "4x400": 7, "4x800": 12}
+FIELD_MINUTES_PER_ATHLETE = {"high jump": 5, "pole vault": 7}
+FIELD_MINUTES_DEFAULT = 3  # three attempts plus measuring
+FIELD_MINIMUM = 20
+
+_DISTANCE_RE = re.compile(r"(\d+)")
+
+
+def parse_clock(value):
+    """'15:30' -> 930; raises ValueError."""
+    hours, sep, minutes = str(value).strip().partition(":")
+    if not sep or not hours.isdigit() or not minutes.isdigit() or len(minutes) != 2:
+        raise ValueError("time must be HH:MM")
+    total = int(hours) * 60 + int(minutes)
+    if int(hours) > 23 or int(minutes) > 59:
+        raise ValueError("time must be HH:MM")
+    return total
+
+
+def format_clock(minute):
+    if minute is None:
+        return None
+    return f"{minute // 60 % 24:02d}:{minute % 60:02d}"
+
+
+def heat_minutes(event_name, event_type):
+    name = event_name.lower()
+    if event_type == "relay":
+        for prefix, minutes in RELAY_HEAT_MINUTES.items():
+            if name.startswith(prefix):
+                return minutes
+        return 8
+    m = _DISTANCE_RE.search(name)
+    distance = int(m.group(1)) if m else 400
+    for limit, minutes in HEAT_MINUTES:
+        if distance <= limit:
+            return minutes
+    return HEAT_MINUTES[-1][1]
+
+
+def estimate_minutes(event_name, event_type, entries, heats=None, lanes=8):
+    """Duration of one meet event from its entry count (and seeded heat count, if any)."""
+    if event_type == "field":
+        per_athlete = FIELD_MINUTES_PER_ATHLETE.get(event_name.lower(), FIELD_MINUTES_DEFAULT)
+        return max(FIELD_MINIMUM, entries * per_athlete)
+    if event_type == "relay":
+        entries = math.ceil(entries / 4)  # one team per four legs
+    heats = heats or max(1, math.ceil(entries / lanes))
+    return heats * heat_minutes(event_name, event_type) + CHANGEOVER
+
+
+def build_timeline(events, start, lanes=8):
+    """Start times for meet events.
+
+    events: [(key, event_name, event_type, entries, heats)] in running order.
+    Returns {key: (start_minute, duration_minutes)}.
+    """
+    out = {}
+    track_clock = start
+    field_clock = {}  # venue (event name) -> next free minute
+    for key, name, event_type, entries, heats in events:
+        minutes = estimate_minutes(name, event_type, entries, heats, lanes)
+        if event_type == "field":
+            venue = name.lower()
+            begin = field_clock.get(venue, start)
+            field_clock[venue] = begin + minutes
+        else:
+            begin = track_clock
+            track_clock += minutes
+        out[key] = (begin, minutes)
+    return out